@@ -1,8 +1,20 @@
-from src.chesstools.controllers import MainController
+import argparse
+import sys
+
+from src.chesstools.controllers import REPORT_WORKERS, MainController
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Chess club manager.")
+    parser.add_argument("--all-reports", action="store_true",
+                        help="generate every report without prompting, then exit (for scheduled jobs)")
+    parser.add_argument("--workers", type=int, default=REPORT_WORKERS,
+                        help="number of reports generated at once with --all-reports")
+    args = parser.parse_args()
+
     controller = MainController()
+    if args.all_reports:
+        sys.exit(controller.generate_all_reports(args.workers))
     controller.run()
 
 
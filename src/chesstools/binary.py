@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+# Standard library imports
+import json
+import os
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Iterable
+
+from .storage import fsync_directory, write_json_atomically
+
+# File header: magic number, format version and reserved flags
+MAGIC = b"CHSB"
+FORMAT_VERSION = 3
+HEADER = struct.Struct("<4sHH")
+COUNT = struct.Struct("<I")
+
+# Typecode of the unsigned 32 bits integers the records are made of
+REFERENCE_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+# Number of integers in each fixed-width record
+TOURNAMENT_FIELDS = 11
+# Version 1 had no flag telling whether the players of a tournament are stored in full, they always were, and
+# version 2 no schema version of the tournament's data
+TOURNAMENT_FIELDS_BY_VERSION = {1: 9, 2: 10, FORMAT_VERSION: TOURNAMENT_FIELDS}
+PLAYER_FIELDS = 4
+ROUND_FIELDS = 6
+SIDE_FIELDS = 3
+MATCH_FIELDS = 2
+
+
+class BinaryFormatError(ValueError):
+    """
+    Raised when a file is not a tournaments snapshot of a supported version.
+    """
+
+
+class ValueTable:
+    """
+    Table interning every value of the snapshot, the records only hold indexes in it.
+    """
+    def __init__(self):
+        # the values are kept apart by type too, so that 0 and 0.0 are converted back to json as they were
+        self.indexes: dict[tuple[type, Any], int] = {}
+
+    def intern(self, value: Any) -> int:
+        """
+        Method that gets the index of a value, adding it to the table the first time.
+        Args:
+            value (Any): A json scalar.
+
+        Returns:
+            The index of the value in the table.
+        """
+        return self.indexes.setdefault((value.__class__, value), len(self.indexes))
+
+    def values(self) -> list[Any]:
+        """
+        Method that gets the interned values, in the order of their indexes.
+        Returns:
+            The values.
+        """
+        return [value for _, value in self.indexes]
+
+
+def pack_records(records: list[int]) -> bytes:
+    """
+    Function that packs records with their number of integers, in little-endian order.
+    Args:
+        records (list[int]): The records.
+
+    Returns:
+        The packed records.
+    """
+    packed = array(REFERENCE_TYPECODE, records)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return COUNT.pack(len(packed)) + packed.tobytes()
+
+
+def unpack_records(data: memoryview, offset: int) -> tuple[list[int], int]:
+    """
+    Function that unpacks records packed by pack_records.
+    Args:
+        data (memoryview): The file content.
+        offset (int): Offset of the records in the content.
+
+    Returns:
+        The records, and the offset following them.
+    """
+    if offset + COUNT.size > len(data):
+        raise BinaryFormatError("Truncated tournaments snapshot.")
+    (length,), offset = COUNT.unpack_from(data, offset), offset + COUNT.size
+    end = offset + length * array(REFERENCE_TYPECODE).itemsize
+    if end > len(data):
+        raise BinaryFormatError("Truncated tournaments snapshot.")
+
+    records = array(REFERENCE_TYPECODE)
+    records.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        records.byteswap()
+    return records.tolist(), end
+
+
+def encode_tournaments(tournaments: dict[str, dict]) -> bytes:
+    """
+    Function that encodes the tournaments' data, as written in the json file, to the binary format.
+
+    Every value is interned once in a value table, and the match sides (identifier, score, color) once in
+    their own table. The tournaments, their players, their rounds and their matches are then fixed-width
+    records of indexes in these tables. The tournaments of older files, which store each player in full, are
+    flagged and their players interned in a players table.
+    Args:
+        tournaments (dict[str, dict]): The tournaments' data by name.
+
+    Returns:
+        The content of the snapshot file.
+    """
+    table = ValueTable()
+    intern = table.intern
+    players_table: dict[tuple, int] = {}
+    sides_table: dict[tuple, int] = {}
+    tournament_records: list[int] = []
+    player_records: list[int] = []
+    tournament_players: list[int] = []
+    round_records: list[int] = []
+    side_records: list[int] = []
+    match_records: list[int] = []
+
+    for name, attrs in tournaments.items():
+        players = attrs.get("players", [])
+        rounds = attrs.get("rounds", {})
+        full_players = isinstance(players, dict)
+        tournament_records += (intern(name), intern(attrs["place"]), intern(attrs["start_date"]),
+                               intern(attrs["end_date"]), intern(attrs.get("description", "")),
+                               intern(attrs.get("current_round", 1)), intern(attrs["rounds_number"]),
+                               len(players), len(rounds), int(full_players), intern(attrs.get("schema_version")))
+
+        if not full_players:
+            tournament_players += map(intern, players)
+        for identifier, player in players.items() if full_players else ():
+            key = (identifier, player["name"], player["first_name"], player["birth_date"])
+            index = players_table.get(key)
+            if index is None:
+                index = players_table[key] = len(players_table)
+                player_records += map(intern, key)
+            tournament_players.append(index)
+
+        for rnd in rounds.values():
+            matches = rnd.get("matches", {})
+            round_records += (intern(rnd["round_name"]), intern(rnd.get("start_date")), intern(rnd.get("start_time")),
+                              intern(rnd.get("end_date")), intern(rnd.get("end_time")), len(matches))
+
+            for match in matches.values():
+                for side in (match["player1"], match["player2"]):
+                    score = side["score"]
+                    key = (side["identifier"], score, score.__class__, side["color"])
+                    index = sides_table.get(key)
+                    if index is None:
+                        index = sides_table[key] = len(sides_table)
+                        side_records += (intern(side["identifier"]), intern(score), intern(side["color"]))
+                    match_records.append(index)
+
+    values = json.dumps(table.values(), ensure_ascii=False).encode("utf-8")
+    return b"".join((HEADER.pack(MAGIC, FORMAT_VERSION, 0),
+                     COUNT.pack(len(values)), values,
+                     pack_records(tournament_records),
+                     pack_records(player_records),
+                     pack_records(tournament_players),
+                     pack_records(round_records),
+                     pack_records(side_records),
+                     pack_records(match_records)))
+
+
+class BinarySnapshot:
+    """
+    Decoded tables of a snapshot file. The tournaments are only rebuilt as dictionaries when asked for.
+    """
+    def __init__(self, data: bytes):
+        view = memoryview(data)
+        if len(view) < HEADER.size + COUNT.size:
+            raise BinaryFormatError("Truncated tournaments snapshot.")
+        magic, version, _ = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise BinaryFormatError("Not a tournaments snapshot.")
+        if version not in TOURNAMENT_FIELDS_BY_VERSION:
+            raise BinaryFormatError(f"Unsupported tournaments snapshot version {version}.")
+
+        self.tournament_fields = TOURNAMENT_FIELDS_BY_VERSION[version]
+
+        (length,), offset = COUNT.unpack_from(view, HEADER.size), HEADER.size + COUNT.size
+        self.values: list[Any] = json.loads(bytes(view[offset:offset + length]).decode("utf-8"))
+        offset += length
+
+        self.tournament_records, offset = unpack_records(view, offset)
+        self.player_records, offset = unpack_records(view, offset)
+        self.tournament_players, offset = unpack_records(view, offset)
+        self.round_records, offset = unpack_records(view, offset)
+        self.side_records, offset = unpack_records(view, offset)
+        self.match_records, offset = unpack_records(view, offset)
+
+        # Players stored in full as (identifier, data) items and match sides, built once the first tournament is
+        # rebuilt
+        self.players: list[tuple[str, dict]] | None = None
+        self.sides: list[dict] | None = None
+        self.match_keys: list[str] = []
+
+        # Offsets of the players, rounds and matches records of each tournament
+        self.offsets: dict[str, tuple[int, int, int, int]] = {}
+        player_offset = round_offset = match_offset = 0
+        values, records, round_records = self.values, self.tournament_records, self.round_records
+        for index in range(0, len(records), self.tournament_fields):
+            self.offsets[values[records[index]]] = (index, player_offset, round_offset, match_offset)
+            player_offset += records[index + 7]
+            round_end = round_offset + records[index + 8] * ROUND_FIELDS
+            match_offset += sum(round_records[round_offset + 5:round_end:ROUND_FIELDS]) * MATCH_FIELDS
+            round_offset = round_end
+
+    def build_tables(self) -> None:
+        """
+        Method that builds the players stored in full and the sides dictionaries. They are shared by the
+        tournaments, so the callers must not modify them.
+        """
+        values = self.values
+        fields = list(map(values.__getitem__, self.player_records))
+        self.players = [(identifier, {"name": name, "first_name": first_name, "birth_date": birth_date})
+                        for identifier, name, first_name, birth_date
+                        in zip(fields[0::4], fields[1::4], fields[2::4], fields[3::4])]
+
+        fields = list(map(values.__getitem__, self.side_records))
+        self.sides = [{"identifier": identifier, "score": score, "color": color}
+                      for identifier, score, color in zip(fields[0::3], fields[1::3], fields[2::3])]
+
+    def header(self, name: str) -> dict:
+        """
+        Method that gets the header fields of a tournament.
+        Args:
+            name (str): The tournament name.
+
+        Returns:
+            The tournament's data without its players and rounds.
+        """
+        values, records = self.values, self.tournament_records
+        index = self.offsets[name][0]
+        attrs = {"place": values[records[index + 1]],
+                 "start_date": values[records[index + 2]],
+                 "end_date": values[records[index + 3]],
+                 "description": values[records[index + 4]],
+                 "current_round": values[records[index + 5]],
+                 "rounds_number": values[records[index + 6]]}
+        if self.tournament_fields == TOURNAMENT_FIELDS and values[records[index + 10]] is not None:
+            # the schema version comes first in the json file
+            attrs = {"schema_version": values[records[index + 10]], **attrs}
+        return attrs
+
+    def summary(self, name: str) -> dict:
+        """
+        Method that gets the header fields of a tournament with its completion state, read from its rounds
+        records only.
+        Args:
+            name (str): The tournament name.
+
+        Returns:
+            The tournament header.
+        """
+        attrs = self.header(name)
+        index, _, round_offset, _ = self.offsets[name]
+        rounds_count = self.tournament_records[index + 8]
+        fourth_round = round_offset + 3 * ROUND_FIELDS
+        attrs["completed"] = (attrs["current_round"] == 4 and rounds_count > 3
+                              and bool(self.values[self.round_records[fourth_round + 3]]))
+        return attrs
+
+    def tournament(self, name: str) -> dict:
+        """
+        Method that rebuilds the data of a tournament, as written in the json file.
+        Args:
+            name (str): The tournament name.
+
+        Returns:
+            The tournament's data.
+        """
+        if self.players is None:
+            self.build_tables()
+        values, sides, match_records, round_records = self.values, self.sides, self.match_records, self.round_records
+
+        attrs = self.header(name)
+        index, player_offset, round_offset, match_offset = self.offsets[name]
+        players_count, rounds_count = self.tournament_records[index + 7], self.tournament_records[index + 8]
+        players = self.tournament_players[player_offset:player_offset + players_count]
+        if self.tournament_fields == TOURNAMENT_FIELDS_BY_VERSION[1] or self.tournament_records[index + 9]:
+            attrs["players"] = dict(map(self.players.__getitem__, players))
+        else:
+            attrs["players"] = list(map(values.__getitem__, players))
+
+        rounds = attrs["rounds"] = {}
+        for offset in range(round_offset, round_offset + rounds_count * ROUND_FIELDS, ROUND_FIELDS):
+            matches_count = round_records[offset + 5]
+            for number in range(len(self.match_keys) + 1, matches_count + 1):
+                self.match_keys.append(f"match_{number}")
+            positions = match_records[match_offset:match_offset + matches_count * MATCH_FIELDS]
+            match_offset += matches_count * MATCH_FIELDS
+
+            round_name = values[round_records[offset]]
+            rounds[round_name] = {
+                "round_name": round_name,
+                "start_date": values[round_records[offset + 1]],
+                "start_time": values[round_records[offset + 2]],
+                "end_date": values[round_records[offset + 3]],
+                "end_time": values[round_records[offset + 4]],
+                "matches": dict(zip(self.match_keys, [{"player1": sides[side_1], "player2": sides[side_2]}
+                                                      for side_1, side_2 in zip(positions[0::2], positions[1::2])]))
+            }
+        return attrs
+
+    def tournaments(self, names: Iterable[str] | None = None) -> dict[str, dict]:
+        """
+        Method that rebuilds the data of the given tournaments.
+        Args:
+            names (Iterable[str] | None): The tournament names. All the tournaments if None.
+
+        Returns:
+            The tournaments' data by name.
+        """
+        if names is None:
+            names = self.offsets
+        return {name: self.tournament(name) for name in names if name in self.offsets}
+
+
+def decode_tournaments(data: bytes) -> dict[str, dict]:
+    """
+    Function that decodes a snapshot file to the tournaments' data, as written in the json file.
+    Args:
+        data (bytes): The content of the snapshot file.
+
+    Returns:
+        The tournaments' data by name.
+    """
+    return BinarySnapshot(data).tournaments()
+
+
+def write_binary_atomically(file_path: Path, data: bytes) -> None:
+    """
+    Function that writes the bytes to a temporary file synced to the disk and swaps it in with a rename.
+    Args:
+        file_path (Path): Path to the file.
+        data (bytes): The content of the file.
+    """
+    temporary_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temporary_path, "wb") as binary_file:
+            binary_file.write(data)
+            binary_file.flush()
+            os.fsync(binary_file.fileno())
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+    os.replace(temporary_path, file_path)
+    fsync_directory(file_path.parent)
+
+
+def convert_json_to_binary(json_path: Path, binary_path: Path) -> None:
+    """
+    Function that converts a tournaments json file to the binary format.
+    Args:
+        json_path (Path): Path to the json file.
+        binary_path (Path): Path to the snapshot file to be written.
+    """
+    with open(json_path, encoding="utf-8") as json_file:
+        tournaments = json.load(json_file)
+    write_binary_atomically(Path(binary_path), encode_tournaments(tournaments))
+
+
+def convert_binary_to_json(binary_path: Path, json_path: Path) -> None:
+    """
+    Function that converts a snapshot file back to a tournaments json file.
+    Args:
+        binary_path (Path): Path to the snapshot file.
+        json_path (Path): Path to the json file to be written.
+    """
+    write_json_atomically(Path(json_path), decode_tournaments(Path(binary_path).read_bytes()))
+
+
+class BinaryTournamentStore:
+    """
+    Storage of all the tournaments in a single binary snapshot file, see encode_tournaments.
+
+    The file is rewritten as a whole on every write. Its last decoded content is kept until the file changes.
+    The json file found next to a new snapshot is imported.
+    """
+    def __init__(self, file_path: Path, legacy_snapshot: Path | None = None):
+        self.file_path = Path(file_path)
+        self.legacy_snapshot = legacy_snapshot
+        self.lock = threading.RLock()
+        self.snapshot: tuple[tuple, BinarySnapshot] | None = None
+
+    def paths(self) -> list[Path]:
+        """
+        Method that gets the files to watch for changes.
+        Returns:
+            The paths to the files.
+        """
+        return [self.file_path]
+
+    def open(self) -> BinarySnapshot | None:
+        """
+        Method that decodes the snapshot file. The json file is imported the first time.
+        Returns:
+            The decoded snapshot, or None if there are no tournaments yet.
+        """
+        with self.lock:
+            try:
+                stat = self.file_path.stat()
+            except FileNotFoundError:
+                if self.legacy_snapshot is not None and Path(self.legacy_snapshot).exists():
+                    self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                    convert_json_to_binary(self.legacy_snapshot, self.file_path)
+                    return self.open()
+                return None
+
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self.snapshot is None or self.snapshot[0] != signature:
+                self.snapshot = (signature, BinarySnapshot(self.file_path.read_bytes()))
+            return self.snapshot[1]
+
+    def read_summaries(self) -> dict[str, dict]:
+        """
+        Method that reads the tournaments headers, without their players and rounds.
+        Returns:
+            The tournaments headers by name.
+        """
+        snapshot = self.open()
+        return {} if snapshot is None else {name: snapshot.summary(name) for name in snapshot.offsets}
+
+    def read(self, names: Iterable[str] | None = None) -> dict[str, dict]:
+        """
+        Method that reads the given tournaments.
+        Args:
+            names (Iterable[str] | None): The tournament names. All the tournaments if None.
+
+        Returns:
+            The tournaments' data by name.
+        """
+        snapshot = self.open()
+        return {} if snapshot is None else snapshot.tournaments(names)
+
+    def write(self, tournaments: dict[str, dict]) -> None:
+        """
+        Method that rewrites the snapshot file with the given tournaments updated.
+        Args:
+            tournaments (dict[str, dict]): The tournaments' data by name.
+        """
+        with self.lock:
+            snapshot = self.open()
+            merged = {} if snapshot is None else snapshot.tournaments()
+            merged.update(tournaments)
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            write_binary_atomically(self.file_path, encode_tournaments(merged))
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+# Standard library imports
+import hashlib
+import hmac
+import io
+import os
+import pickle
+import secrets
+import threading
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable
+
+# Key the warm start files are signed with, kept outside the data folder so that whoever can write to the data
+# folder cannot sign a file of their own
+WARM_START_KEY = (Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "chesstools"
+                  / "warm_start.key")
+
+
+class RepositoryCache:
+    """
+    Process-wide cache of the parsed players and tournaments.
+
+    Each entry remembers the modification time and the size of the files it was parsed from, and is parsed
+    again only when one of them changes.
+    """
+    def __init__(self):
+        self.entries: dict[Hashable, tuple[tuple, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def signature(paths: Iterable[Path]) -> tuple:
+        """
+        Method that gets the signature of the given files.
+        Args:
+            paths (Iterable[Path]): Paths to the files.
+
+        Returns:
+            The modification time and the size of each file, None for the missing ones.
+        """
+        signature = []
+        for path in paths:
+            try:
+                stat = Path(path).stat()
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((str(path), None, None))
+        return tuple(signature)
+
+    def get(self, key: Hashable, paths: list[Path], loader: Callable[[], Any]) -> Any:
+        """
+        Method that gets a cached value, parsing it again with the loader if its files changed.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value is parsed from.
+            loader (Callable): Callable parsing the value.
+
+        Returns:
+            The cached value.
+        """
+        with self.lock:
+            signature = self.signature(paths)
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            value = loader()
+            self.entries[key] = (signature, value)
+            return value
+
+    def refresh(self, key: Hashable, paths: list[Path], value: Any) -> None:
+        """
+        Method that records the new signature of the files after the cached value itself was saved to them.
+        Nothing is done if the given value is not the cached one.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value is saved to.
+            value (Any): The value which was saved.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] is value:
+                self.entries[key] = (self.signature(paths), value)
+
+    def current(self, key: Hashable, paths: list[Path]) -> Any:
+        """
+        Method that gets a cached value without parsing it.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value is parsed from.
+
+        Returns:
+            The cached value. Or None if there is none or its files changed.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == self.signature(paths):
+                return entry[1]
+            return None
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Method that drops a cached value, or all of them.
+        Args:
+            key (Hashable | None): The cache key. All the keys if None.
+        """
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Method that gets the cache counters.
+        Returns:
+            The hits, misses and entries counts.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
+
+
+class ReferencePickler(pickle.Pickler):
+    """
+    Pickler writing the given shared objects as their reference instead of their content.
+    """
+    def __init__(self, file, references: dict[Hashable, Any]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.references = {id(obj): reference for reference, obj in references.items()}
+
+    def persistent_id(self, obj: Any) -> Any:
+        return self.references.get(id(obj))
+
+
+class ReferenceUnpickler(pickle.Unpickler):
+    """
+    Unpickler replacing the references written by ReferencePickler with the given shared objects.
+    """
+    def __init__(self, file, references: dict[Hashable, Any]):
+        super().__init__(file)
+        self.references = references
+
+    def persistent_load(self, reference: Any) -> Any:
+        return self.references[reference]
+
+
+class WarmStartCache:
+    """
+    On-disk cache of the parsed players and tournaments, shared by the successive launches of the application.
+
+    Each value is pickled in a folder next to the first of its files, along with the hash of the content of
+    all its files, and is only unpickled again if none of them changed. The objects shared with the rest of the
+    application, like the controllers, are given by the caller and pickled as references to them.
+
+    Unpickling a file can run any code, so each file is signed with a key kept outside the data folder, see
+    WARM_START_KEY, and a file whose signature does not match is never unpickled: only the files written by
+    the application itself are read back. The cache is skipped when the key cannot be read or created.
+    """
+    FOLDER_NAME = "warm_start"
+    # Bumped when the pickled classes change, the files written by an older version are parsed again
+    VERSION = 2
+    SIGNATURE_SIZE = 32
+
+    # Errors of a truncated file or of a file pickled with classes which changed since
+    READ_ERRORS = (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, KeyError,
+                   TypeError, ValueError)
+
+    def __init__(self, key_path: Path = WARM_START_KEY):
+        self.key_path = Path(key_path)
+        self.key: bytes | None = None
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def signing_key(self) -> bytes | None:
+        """
+        Method that reads the key the files are signed with, created the first time it is needed.
+        Returns:
+            The key. Or None if it can be neither read nor created.
+        """
+        if self.key is not None:
+            return self.key
+        try:
+            self.key_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                descriptor = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                key = self.key_path.read_bytes()
+            else:
+                key = secrets.token_bytes(self.SIGNATURE_SIZE)
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(key)
+        except OSError:
+            return None
+        # a key being written by another launch is not used
+        if len(key) == self.SIGNATURE_SIZE:
+            self.key = key
+        return self.key
+
+    def sign(self, content: bytes) -> bytes | None:
+        """
+        Method that signs the content of a pickle file.
+        Args:
+            content (bytes): The pickled header and value.
+
+        Returns:
+            The signature. Or None if there is no key.
+        """
+        key = self.signing_key()
+        if key is None:
+            return None
+        return hmac.new(key, content, hashlib.sha256).digest()
+
+    @staticmethod
+    def digest(paths: Iterable[Path]) -> str:
+        """
+        Method that hashes the content of the given files.
+        Args:
+            paths (Iterable[Path]): Paths to the files.
+
+        Returns:
+            The hexadecimal digest, the missing files being hashed as such.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        for path in paths:
+            digest.update(str(path).encode("utf-8") + b"\0")
+            try:
+                with open(path, "rb") as file:
+                    digest.update(b"1")
+                    for chunk in iter(lambda: file.read(1 << 20), b""):
+                        digest.update(chunk)
+            except FileNotFoundError:
+                digest.update(b"0")
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @classmethod
+    def file_path(cls, key: Hashable, paths: list[Path]) -> Path:
+        """
+        Method that gets the file a value is pickled in.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value is parsed from.
+
+        Returns:
+            The path to the pickle file.
+        """
+        name = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=8).hexdigest()
+        return Path(paths[0]).parent / cls.FOLDER_NAME / f"{name}.pickle"
+
+    def get(self, key: Hashable, paths: list[Path], loader: Callable[[], Any],
+            references: Callable[[], dict[Hashable, Any]] | None = None) -> Any:
+        """
+        Method that gets a value from its pickle file, parsing it with the loader and pickling it if its files
+        changed.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value is parsed from.
+            loader (Callable): Callable parsing the value.
+            references (Callable | None): Callable giving the shared objects by reference. A value referring to
+                a reference which is gone is parsed again.
+
+        Returns:
+            The value.
+        """
+        with self.lock:
+            digest = self.digest(paths)
+            shared = references() if references is not None else None
+            value = self.read(key, paths, digest, shared)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            self.misses += 1
+            value = loader()
+            self.write(key, paths, digest, value, shared)
+            return value
+
+    def read(self, key: Hashable, paths: list[Path], digest: str,
+             references: dict[Hashable, Any] | None = None) -> Any:
+        """
+        Method that reads a value back from its pickle file.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value is parsed from.
+            digest (str): The hash of the content of these files.
+            references (dict | None): The shared objects by reference.
+
+        Returns:
+            The value. Or None if there is no pickle file, if it was not signed with the key, or if it was written
+            for other files content.
+        """
+        try:
+            data = self.file_path(key, paths).read_bytes()
+            signature, content = data[:self.SIGNATURE_SIZE], data[self.SIGNATURE_SIZE:]
+            expected = self.sign(content)
+            # nothing is unpickled from a file the application did not write
+            if expected is None or not hmac.compare_digest(signature, expected):
+                return None
+            file = io.BytesIO(content)
+            # the header is checked before the value is unpickled, the value being pickled on its own
+            if pickle.Unpickler(file).load() != (self.VERSION, repr(key), digest):
+                return None
+            unpickler = pickle.Unpickler(file) if references is None else ReferenceUnpickler(file, references)
+            return unpickler.load()
+        except self.READ_ERRORS:
+            return None
+
+    @staticmethod
+    def dumps(value: Any, references: dict[Hashable, Any] | None = None) -> bytes | None:
+        """
+        Method that pickles a value, to be written later on, see store.
+        Args:
+            value (Any): The value.
+            references (dict | None): The shared objects by reference.
+
+        Returns:
+            The pickled value. Or None if it cannot be pickled, the cache only being skipped.
+        """
+        file = io.BytesIO()
+        try:
+            pickler = (pickle.Pickler(file, pickle.HIGHEST_PROTOCOL) if references is None
+                       else ReferencePickler(file, references))
+            pickler.dump(value)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            return None
+        return file.getvalue()
+
+    def write(self, key: Hashable, paths: list[Path], digest: str, value: Any,
+              references: dict[Hashable, Any] | None = None) -> bool:
+        """
+        Method that pickles a value for the next launches.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value is parsed from.
+            digest (str): The hash of the content of these files when the value was parsed.
+            value (Any): The value.
+            references (dict | None): The shared objects by reference.
+
+        Returns:
+            True if the value was pickled. False otherwise, the cache only being skipped.
+        """
+        pickled = self.dumps(value, references)
+        return pickled is not None and self.write_pickled(key, paths, digest, pickled)
+
+    def write_pickled(self, key: Hashable, paths: list[Path], digest: str, pickled: bytes) -> bool:
+        """
+        Method that writes a pickled value, signed, for the next launches.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value is parsed from.
+            digest (str): The hash of the content of these files when the value was parsed.
+            pickled (bytes): The value, see dumps.
+
+        Returns:
+            True if the value was written. False otherwise, the cache only being skipped.
+        """
+        content = pickle.dumps((self.VERSION, repr(key), digest), pickle.HIGHEST_PROTOCOL) + pickled
+        signature = self.sign(content)
+        if signature is None:
+            return False
+        file_path = self.file_path(key, paths)
+        temporary_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, "wb") as file:
+                file.write(signature)
+                file.write(content)
+            os.replace(temporary_path, file_path)
+            return True
+        except OSError:
+            temporary_path.unlink(missing_ok=True)
+            return False
+
+    def store(self, key: Hashable, paths: list[Path], pickled: bytes) -> bool:
+        """
+        Method that writes a value pickled when it was saved to its files, so that the next launch starts from
+        it. The caller checks that the files were not changed since.
+        Args:
+            key (Hashable): The cache key.
+            paths (list[Path]): Paths to the files the value was saved to.
+            pickled (bytes): The value, see dumps.
+
+        Returns:
+            True if the value was written. False otherwise.
+        """
+        with self.lock:
+            return self.write_pickled(key, paths, self.digest(paths), pickled)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Method that gets the cache counters.
+        Returns:
+            The hits and misses counts.
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+
+repository_cache = RepositoryCache()
+warm_start_cache = WarmStartCache()
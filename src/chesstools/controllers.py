@@ -2,24 +2,28 @@ from __future__ import annotations
 
 # Standard library imports
 import json
+import os
 import random
-import sys
+import re
+import threading
+import time
 from collections import UserList
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
 
-from jinja2 import Environment, FileSystemLoader
-from rich.console import Console
-
+from .binary import BinaryTournamentStore
+from .cache import repository_cache, warm_start_cache
+from .database import SqliteStorage
+from .migrations import REQUIRED_FIELDS, MigrationReport, migrate_tournament
 from .models import Match, Player, Round, Tournament
+from .reports import ReportBuild, ReportBuildCache, content_digest
+from .storage import (ShardedTournamentStore, TournamentArchive, TournamentsJournal, WriteBehindWriter,
+                      iter_json_object, read_json_value_at, write_json_atomically)
+from .templating import TemplateRegistry
 from .views import MainView, PlayerView, ReportView, TournamentView
 
-console = Console(
-    file=sys.stdout,
-    force_terminal=True,
-    color_system="truecolor",
-    width=200
-)
-
 NUMBER_OF_ROUNDS = 4
 
 # Base paths
@@ -30,33 +34,115 @@ REPORTS_FOLDER = Path("./data/reports/")
 TOURNAMENTS_DATA_JSON = TOURNAMENT_FOLDER / Path("./tournaments.json")
 PLAYERS_DATA_JSON = TOURNAMENT_FOLDER / Path("./players.json")
 
+# Journal of the results entered since the last tournaments snapshot
+TOURNAMENTS_JOURNAL = TOURNAMENT_FOLDER / Path("./tournaments.journal")
+JOURNALED_PERSISTENCE = False
+
+# Completed tournaments move out of the json file into a compressed archive, only read when they are opened
+ARCHIVE_COMPLETED = True
+TOURNAMENTS_ARCHIVE_FOLDER = TOURNAMENT_FOLDER / Path("./archive/")
+
+# In lazy loading the tournaments are listed from their headers, their rounds are built when first opened
+LAZY_LOADING = True
+
+# The parsed tournaments are pickled next to their files, the next launches start from them until the files change
+WARM_START = True
+
+# Report of the tournaments which could not be read, written when there are any
+TOURNAMENTS_LOAD_REPORT_JSON = TOURNAMENT_FOLDER / Path("./load_report.json")
+
+# Storage backend: "json" for the single files, "sharded" for one file per tournament, "sqlite" for a database,
+# "binary" for a packed tournaments snapshot next to the players json file
+STORAGE_BACKEND = "json"
+TOURNAMENT_SHARDS_FOLDER = TOURNAMENT_FOLDER / Path("./shards/")
+TOURNAMENTS_MANIFEST_JSON = TOURNAMENT_FOLDER / Path("./manifest.json")
+DATABASE_FILE = TOURNAMENT_FOLDER / Path("./chess_club.sqlite3")
+# Report of the tournaments which could not be imported into a new database, written when there are any
+DATABASE_IMPORT_REPORT_JSON = TOURNAMENT_FOLDER / Path("./import_report.json")
+TOURNAMENTS_BINARY_FILE = TOURNAMENT_FOLDER / Path("./tournaments.chsb")
+
+# In fast start each report template is only loaded and compiled when its first report is generated
+FAST_START = True
+
 # Reports paths
 ALPHABETICALLY_PLAYERS_REPORT = REPORTS_FOLDER / Path("./1_report_alphabetically_players.html")
 ALL_TOURNAMENTS_REPORT = REPORTS_FOLDER / Path("./2_report_all_tournaments.html")
 CURRENT_TOURNAMENT_PLAYERS_REPORT = REPORTS_FOLDER / Path("./3_report_current_tournament_players.html")
 CURRENT_TOURNAMENT_ROUNDS_AND_MATCHES_REPORT = (REPORTS_FOLDER
                                                 / Path("./4_report_current_tournament_rounds_matches.html"))
-
-# Templates paths
-ALPHABETICALLY_PLAYERS_TEMPLATE_HTML = "./src/templates/report_alphabetically_players_template.html"
-TOURNAMENTS_TEMPLATE_HTML = "./src/templates/report_tournaments_template.html"
-CURRENT_TOURNAMENT_PLAYERS_TEMPLATE_HTML = "./src/templates/report_current_tournament_players_template.html"
-CURRENT_TOURNAMENT_ROUNDS_MATCHES_TEMPLATE_HTML = ("./src/templates/report_current_tournament_"
-                                                   "rounds_matches_template.html")
+# Number of bytes of a report rendered before they are written to its file
+REPORT_WRITE_BUFFER = 64 * 1024
+# The reports whose templates and inputs have not changed since they were last built are not rendered again
+REPORTS_BUILD_MANIFEST_JSON = REPORTS_FOLDER / Path("./build_manifest.json")
+REPORTS_FRAGMENTS_JSON = REPORTS_FOLDER / Path("./report_fragments.json")
+# The batch mode writes the players and the rounds reports of every tournament in this folder
+TOURNAMENT_REPORTS_FOLDER = REPORTS_FOLDER / Path("./tournaments/")
+# Number of reports written at once by the batch mode, None for the thread pool default
+REPORT_WORKERS = None
+
+# Templates paths, relative to the templates folder of the package
+ALPHABETICALLY_PLAYERS_TEMPLATE_HTML = "report_alphabetically_players_template.html"
+TOURNAMENTS_TEMPLATE_HTML = "report_tournaments_template.html"
+CURRENT_TOURNAMENT_PLAYERS_TEMPLATE_HTML = "report_current_tournament_players_template.html"
+CURRENT_TOURNAMENT_ROUNDS_MATCHES_TEMPLATE_HTML = "report_current_tournament_rounds_matches_template.html"
+TOURNAMENT_ROW_TEMPLATE_HTML = "report_tournament_row_template.html"
+REPORT_TEMPLATES = {
+    "players": ALPHABETICALLY_PLAYERS_TEMPLATE_HTML,
+    "all_tournaments": TOURNAMENTS_TEMPLATE_HTML,
+    "tournament_row": TOURNAMENT_ROW_TEMPLATE_HTML,
+    "current_tournament_players": CURRENT_TOURNAMENT_PLAYERS_TEMPLATE_HTML,
+    "tournament_rounds_and_matches": CURRENT_TOURNAMENT_ROUNDS_MATCHES_TEMPLATE_HTML,
+}
+
+
+def tournament_reports_paths(tournament_name: str) -> tuple[Path, Path]:
+    """
+    Function that gets the paths of the players and of the rounds reports of a tournament in batch mode.
+    Args:
+        tournament_name (str): Tournament name.
+
+    Returns:
+        The paths of the players report and of the rounds and matches report. The file names are made of the
+        tournament name, cleaned for the file system, and of a digest of it so that they never collide.
+    """
+    name = re.sub(r"[^\w-]+", "_", tournament_name).strip("_")
+    stem = f"{name}_{content_digest(tournament_name)[:8]}"
+    return (TOURNAMENT_REPORTS_FOLDER / f"{stem}_players.html",
+            TOURNAMENT_REPORTS_FOLDER / f"{stem}_rounds_matches.html")
+
+
+def open_storages(backend: str) -> tuple[Any, Any]:
+    """
+    Function that opens the storage backends of the tournaments and of the players.
+    Args:
+        backend (str): The backend name, see STORAGE_BACKEND.
+
+    Returns:
+        The tournaments storage and the players storage. None stands for the json files.
+    """
+    if backend == "sharded":
+        return ShardedTournamentStore(TOURNAMENT_SHARDS_FOLDER, TOURNAMENTS_MANIFEST_JSON, TOURNAMENTS_DATA_JSON), None
+    if backend == "sqlite":
+        database = SqliteStorage(DATABASE_FILE, TOURNAMENTS_DATA_JSON, PLAYERS_DATA_JSON, DATABASE_IMPORT_REPORT_JSON)
+        return database, database
+    if backend == "binary":
+        return BinaryTournamentStore(TOURNAMENTS_BINARY_FILE, TOURNAMENTS_DATA_JSON), None
+    return None, None
 
 
 class MainController:
     def __init__(self):
         self.view = MainView()
 
-        self.env = Environment(loader=FileSystemLoader('.'))
+        self.tournaments_storage, self.players_storage = open_storages(STORAGE_BACKEND)
+        # Saves made from the prompts are written to disk by a background thread
+        self.writer = WriteBehindWriter()
+
+        # Report templates by report, compiled on first use and kept compiled on disk between launches
+        self.templates = TemplateRegistry(REPORT_TEMPLATES)
+        if not FAST_START:
+            self.templates.load_all()
 
-        self.templates = {
-            "players": self.env.get_template(ALPHABETICALLY_PLAYERS_TEMPLATE_HTML),
-            "all_tournaments": self.env.get_template(TOURNAMENTS_TEMPLATE_HTML),
-            "current_tournament_players": self.env.get_template(CURRENT_TOURNAMENT_PLAYERS_TEMPLATE_HTML),
-            "tournament_rounds_and_matches": self.env.get_template(CURRENT_TOURNAMENT_ROUNDS_MATCHES_TEMPLATE_HTML)
-        }
         self.tournament_controller = TournamentController(self)
         self.player_controller = PlayerController(self)
         self.report_controller = ReportController(self)
@@ -80,10 +166,29 @@ class MainController:
             action = actions.get(menu)
             action()
 
+    def generate_all_reports(self, workers: int | None = REPORT_WORKERS) -> int:
+        """
+        Method that generates every report without prompting, then closes the application, for scheduled jobs.
+        Args:
+            workers (int | None): Number of reports written at once.
+
+        Returns:
+            The exit status: 0 if all the reports were written, 1 otherwise.
+        """
+        succeeded = self.report_controller.generate_all_reports(workers)
+        self.tournament_controller.close()
+        self.writer.close()
+        self.tournament_controller.save_warm_start()
+        return 0 if succeeded else 1
+
     def goodbye(self):
         """
         Method that close the application.
         """
+        self.tournament_controller.close()
+        self.writer.close()
+        self.tournament_controller.save_warm_start()
+        self.view.display_writer_stats(self.writer.stats())
         self.view.display_goodbye()
         exit(1)
 
@@ -111,108 +216,510 @@ class TournamentsManager(UserList):
         """
         return any(tournament_obj.name == tournament.name for tournament_obj in self.data)
 
-    def convert_dict_to_tournaments(self, controller: TournamentController, dictionary: dict) -> None:
+    def convert_dict_to_tournaments(self, controller: TournamentController, dictionary: dict,
+                                    club_players: PlayersManager | None = None) -> None:
         """
         Method that converts tournaments' datas in a dictionary to the Tournaments object.
         Args:
             controller (TournamentController): Controller object.
             dictionary (dict): Dictionary to be converted.
+            club_players (PlayersManager | None): The club players the tournaments' players are resolved against,
+                read once for the whole load. Read here if None.
         """
+        club_players = controller.get_club_players() if club_players is None else club_players
         for name, attrs in dictionary.items():
-            players = PlayersManager()
-            players_dict = attrs.get("players", {})
-
-            for identifier, player_attrs in players_dict.items():
-                player = Player(
-                    player_attrs["name"],
-                    player_attrs["first_name"],
-                    player_attrs["birth_date"],
-                    identifier
-                )
-                players.add_player(player)
-
-            tournament = Tournament(
-                name,
-                attrs["place"],
-                attrs["rounds_number"],
-                attrs["start_date"],
-                attrs["end_date"],
-                attrs.get("description", ""),
-                attrs.get("current_round", 1),
-            )
-            tournament.add_players(players)
-
-            # Rounds
-            rounds_dict = attrs.get("rounds", {})
-            for rnd_name, rnd_attrs in rounds_dict.items():
-                rnd = Round(rnd_name)
-                rnd.start_date = rnd_attrs.get("start_date")
-                rnd.start_time = rnd_attrs.get("start_time")
-                rnd.end_date = rnd_attrs.get("end_date")
-                rnd.end_time = rnd_attrs.get("end_time")
-                rnd.matches = []
-
-                # rebuild the matches
-                matches_dict = rnd_attrs.get("matches", {})
-                for _, match_attrs in matches_dict.items():
-                    player_1 = players.get_player_by_identifier(match_attrs["player1"]["identifier"])
-                    player_2 = players.get_player_by_identifier(match_attrs["player2"]["identifier"])
-                    score_1 = match_attrs["player1"]["score"]
-                    score_2 = match_attrs["player2"]["score"]
-                    color_1 = match_attrs["player1"]["color"]
-                    color_2 = match_attrs["player2"]["color"]
-
-                    match = None
-                    if player_1 is not None and player_2 is not None:
-                        match = Match(player_1, player_2)
-                        controller.set_match_scores(match, player_1, score_1, player_2, score_2)
-                        match.set_colors(color_1, color_2)
-                    else:
-                        return
-                    rnd.matches.append(match)
-
-                tournament.rounds.append(rnd)
+            tournament = self.convert_dict_to_tournament(controller, name, attrs, club_players)
+            if tournament is None:
+                # the problem is in the controller's load report, the other tournaments are still loaded
+                continue
 
             self.add_tournament(tournament)
 
-    def load_tournaments_from_json(self, controller: TournamentController, file_path: Path) -> bool:
+    def convert_dict_to_tournament(self, controller: TournamentController, name: str, attrs: dict,
+                                   club_players: PlayersManager) -> Tournament | None:
+        """
+        Method that converts a tournament's datas in a dictionary to a Tournament object. The data of the older
+        schema versions are upgraded first.
+        Args:
+            controller (TournamentController): Controller object.
+            name (str): The tournament name.
+            attrs (dict): Dictionary to be converted.
+            club_players (PlayersManager): The club players, see convert_dict_to_tournaments.
+
+        Returns:
+            The tournament object. Or None if the data cannot be used or a player is not a club player, the
+            problem being recorded in the controller's load report.
+        """
+        # players stored in full by the older versions
+        found: dict[str, dict] = {}
+        attrs = migrate_tournament(name, attrs, controller.load_report, found)
+        if attrs is None:
+            return None
+        resolved = controller.resolve_players(name, attrs.get("players", []), found, club_players)
+        if resolved is None:
+            controller.load_report.reject(name, attrs)
+            return None
+        players = PlayersManager(resolved)
+
+        tournament = Tournament(
+            name,
+            attrs["place"],
+            attrs["rounds_number"],
+            attrs["start_date"],
+            attrs["end_date"],
+            attrs.get("description", ""),
+            attrs.get("current_round", 1),
+        )
+        tournament.add_players(players)
+
+        # Rounds
+        rounds_dict = attrs.get("rounds", {})
+        for rnd_name, rnd_attrs in rounds_dict.items():
+            rnd = self.convert_dict_to_round(controller, rnd_name, rnd_attrs, players)
+            if rnd is None:
+                controller.load_report.add_issue("error", name, f"rounds/{rnd_name}", "Unknown player in a match")
+                controller.load_report.reject(name, attrs)
+                return None
+
+            tournament.add_round(rnd)
+
+        return tournament
+
+    def iter_tournaments_from_json(self, controller: TournamentController, file_path: Path,
+                                   names: list[str] | None = None,
+                                   club_players: PlayersManager | None = None) -> Iterator[Tournament]:
+        """
+        Method that reads the tournaments of a json file one at a time, so that only the data of the
+        tournament being built is held in memory.
+        Args:
+            controller (TournamentController): Controller object.
+            file_path (Path): Path to the json file to be read.
+            names (list[str] | None): Only read these tournaments. All of them if None.
+            club_players (PlayersManager | None): See convert_dict_to_tournaments.
+
+        Returns:
+            An iterator over the tournaments objects. The ones which cannot be built are left out, see
+            convert_dict_to_tournament.
+        """
+        club_players = controller.get_club_players() if club_players is None else club_players
+        for name, attrs, _ in iter_json_object(file_path):
+            if names is not None and name not in names:
+                continue
+            tournament = self.convert_dict_to_tournament(controller, name, attrs, club_players)
+            if tournament is not None:
+                yield tournament
+
+    @staticmethod
+    def convert_dict_to_round(controller: TournamentController, rnd_name: str, rnd_attrs: dict,
+                              players: PlayersManager) -> Round | None:
+        """
+        Method that converts a round's datas in a dictionary to a Round object.
+        Args:
+            controller (TournamentController): Controller object.
+            rnd_name (str): The round name.
+            rnd_attrs (dict): Dictionary to be converted.
+            players (PlayersManager): The tournament players.
+
+        Returns:
+            The round object. Or None if a match refers to an unknown player.
+        """
+        rnd = Round(rnd_name)
+        rnd.start_date = rnd_attrs.get("start_date")
+        rnd.start_time = rnd_attrs.get("start_time")
+        rnd.end_date = rnd_attrs.get("end_date")
+        rnd.end_time = rnd_attrs.get("end_time")
+        rnd.matches = []
+
+        # rebuild the matches
+        matches_dict = rnd_attrs.get("matches", {})
+        for _, match_attrs in matches_dict.items():
+            player_1 = players.get_player_by_identifier(match_attrs["player1"]["identifier"])
+            player_2 = players.get_player_by_identifier(match_attrs["player2"]["identifier"])
+            score_1 = match_attrs["player1"]["score"]
+            score_2 = match_attrs["player2"]["score"]
+            color_1 = match_attrs["player1"]["color"]
+            color_2 = match_attrs["player2"]["color"]
+
+            if player_1 is None or player_2 is None:
+                return None
+            match = Match(player_1, player_2)
+            if match.player_1 is not player_1:
+                # keep the stored order so that the colors stay with their players
+                match.swap_sides()
+            controller.set_match_scores(match, player_1, score_1, player_2, score_2)
+            match.set_colors(color_1, color_2)
+            rnd.matches.append(match)
+
+        return rnd
+
+    def get_tournament(self, tournament_name: str) -> Tournament | None:
+        """
+        Method that gets a tournament by name.
+        Args:
+            tournament_name (str): Tournament name.
+
+        Returns:
+            The tournament object. Or None otherwise.
+        """
+        for tournament in self.data:
+            if tournament.name == tournament_name:
+                return tournament
+        return None
+
+    def apply_journal_record(self, controller: TournamentController, record: dict,
+                             club_players: PlayersManager | None = None) -> None:
+        """
+        Method that applies a journal record to the tournaments.
+        Args:
+            controller (TournamentController): Controller object.
+            record (dict): The journal record.
+            club_players (PlayersManager | None): See convert_dict_to_tournaments.
+        """
+        if record["op"] == "tournament":
+            existing = self.get_tournament(record["name"])
+            if existing is not None:
+                self.data.remove(existing)
+            self.convert_dict_to_tournaments(controller, {record["name"]: record["data"]}, club_players)
+            return
+
+        tournament = self.get_tournament(record["name"])
+        if tournament is None:
+            return
+
+        if record["op"] == "round_start":
+            players = PlayersManager(tournament.players)
+            rnd = self.convert_dict_to_round(controller, record["data"]["round_name"], record["data"], players)
+            if rnd is None:
+                return
+            if record["round"] < len(tournament.rounds):
+                tournament.replace_round(record["round"], rnd)
+            else:
+                tournament.add_round(rnd)
+            tournament.current_round = record["current_round"]
+
+        elif record["op"] == "score":
+            match = tournament.rounds[record["round"]].matches[record["match"]]
+            player_1, _, _ = match.match_tuple[0]
+            player_2, _, _ = match.match_tuple[1]
+            scores = record["scores"]
+            controller.set_match_scores(match, player_1, scores[player_1.identifier],
+                                        player_2, scores[player_2.identifier], tournament)
+
+        elif record["op"] == "round_end":
+            rnd = tournament.rounds[record["round"]]
+            rnd.end_date = record["end_date"]
+            rnd.end_time = record["end_time"]
+
+    def replay_journal(self, controller: TournamentController, journal: TournamentsJournal,
+                       names: list[str] | None = None) -> None:
+        """
+        Method that replays the pending journal records on top of the loaded snapshot.
+        Args:
+            controller (TournamentController): Controller object.
+            journal (TournamentsJournal): The journal.
+            names (list[str] | None): Only replay the records of these tournaments. All of them if None.
+        """
+        club_players = controller.get_club_players()
+        for record in journal.records():
+            if names is None or record["name"] in names:
+                self.apply_journal_record(controller, record, club_players)
+
+    def load_tournaments_from_json(self, controller: TournamentController, file_path: Path,
+                                   names: list[str] | None = None) -> bool:
         """
-        Method that loads tournaments from a json file
+        Method that loads tournaments from a json file, or from the shards in sharded storage.
         Args:
             controller (TournamentController): Controller object.
             file_path (Path): Path to the json file to be loaded.
+            names (list[str] | None): Only load these tournaments. All of them if None.
 
         Returns:
             Returns a boolean indicating if the tournaments were loaded successfully or not.
         """
+        club_players = controller.get_club_players()
+        if controller.storage is not None:
+            self.convert_dict_to_tournaments(controller, controller.storage.read(names), club_players)
+            return True
+
         try:
-            with open(file_path, encoding="utf-8") as json_file:
-                data = json.load(json_file)
-                # convert dictionary datas in Tournaments object
-                self.convert_dict_to_tournaments(controller, data)
-                return True
+            # the tournaments are decoded and converted one at a time
+            for tournament in self.iter_tournaments_from_json(controller, file_path, names, club_players):
+                self.add_tournament(tournament)
+            found = True
 
         except FileNotFoundError:
             self.save_tournament_to_json(controller, TOURNAMENTS_DATA_JSON)
-            return False
+            found = False
+
+        if controller.archive is not None:
+            self.load_archived_tournaments(controller, names, club_players)
+        return found
+
+    def load_archived_tournaments(self, controller: TournamentController, names: list[str] | None = None,
+                                  club_players: PlayersManager | None = None) -> None:
+        """
+        Method that adds the archived tournaments missing from the json file. The given ones are read from the
+        archive, all the other ones are only added from their headers and read when first accessed.
+        Args:
+            controller (TournamentController): Controller object.
+            names (list[str] | None): The tournaments to be read from the archive. None to add all the archived
+                tournaments from their headers.
+            club_players (PlayersManager | None): See convert_dict_to_tournaments.
+        """
+        index = controller.archive.read_index()
+        loaded = {tournament.name for tournament in self}
+        for name, attrs in index.items():
+            if name in loaded:
+                continue
+            if names is None:
+                self.add_tournament(self.archived_tournament_header(controller, name, attrs))
+            elif name in names:
+                self.convert_dict_to_tournaments(controller, {name: controller.archive.read(name)}, club_players)
+
+    def archived_tournament_header(self, controller: TournamentController, name: str, attrs: dict) -> Tournament:
+        """
+        Method that builds an archived tournament from its header, its players and rounds being read from the
+        archive when first accessed.
+        Args:
+            controller (TournamentController): Controller object.
+            name (str): The tournament name.
+            attrs (dict): The tournament header, from the archive index.
+
+        Returns:
+            The tournament object.
+        """
+        tournament = Tournament(name,
+                                attrs["place"],
+                                attrs["rounds_number"],
+                                attrs["start_date"],
+                                attrs["end_date"],
+                                attrs.get("description", ""),
+                                attrs.get("current_round", 1))
+        tournament.completed = True
+        tournament.loader = partial(self.materialize_archived_tournament, controller, [])
+        return tournament
+
+    def load_tournaments_index(self, controller: TournamentController, file_path: Path) -> bool:
+        """
+        Method that loads the tournaments headers only, with the pending journal records taken into account.
+        The players and the rounds of each tournament are built the first time they are accessed.
+        Args:
+            controller (TournamentController): Controller object.
+            file_path (Path): Path to the json file to be loaded.
+
+        Returns:
+            Returns a boolean indicating if the tournaments were loaded successfully or not.
+        """
+        # offset of each tournament in the json file, and signature of the file they are valid for
+        offsets: dict[str, int] = {}
+        # tournaments only found in the archive, read from it alone when opened
+        archived: set[str] = set()
+        signature = None
+        found = True
+        with controller.journal.lock:
+            records = list(controller.journal.records())
+            if controller.storage is not None:
+                summaries = controller.storage.read_summaries()
+            else:
+                summaries = {}
+                signature = repository_cache.signature([file_path])
+                try:
+                    # only the headers are kept, the tournaments are decoded one at a time
+                    for name, attrs, offset in iter_json_object(file_path, offsets=True):
+                        if not isinstance(attrs, dict) or any(field not in attrs for field in REQUIRED_FIELDS):
+                            # a tournament which cannot even be listed is left out, the load report tells why
+                            migrate_tournament(name, attrs, controller.load_report)
+                            continue
+                        summaries[name] = {key: value for key, value in attrs.items()
+                                           if key not in ("players", "rounds")}
+                        summaries[name]["completed"] = Tournament.completed_from_dict(attrs)
+                        offsets[name] = offset
+                except FileNotFoundError:
+                    found = False
+                if controller.archive is not None:
+                    for name, attrs in controller.archive.read_index().items():
+                        if name not in summaries:
+                            summaries[name] = attrs
+                            archived.add(name)
+
+        headers = {name: dict(attrs) for name, attrs in summaries.items()}
+        pending: dict[str, list[dict]] = {}
+        for record in records:
+            if record["op"] == "tournament":
+                headers[record["name"]] = dict(record["data"])
+            elif record["op"] == "round_start" and record["name"] in headers:
+                headers[record["name"]]["current_round"] = record["current_round"]
+            pending.setdefault(record["name"], []).append(record)
+
+        for name, attrs in headers.items():
+            tournament = Tournament(name,
+                                    attrs["place"],
+                                    attrs["rounds_number"],
+                                    attrs["start_date"],
+                                    attrs["end_date"],
+                                    attrs.get("description", ""),
+                                    attrs.get("current_round", 1))
+            # the completion state of a tournament with pending records is only known once loaded
+            if name not in pending:
+                tournament.completed = attrs.get("completed")
+                if tournament.completed is None and "rounds" in attrs:
+                    tournament.completed = Tournament.completed_from_dict(attrs)
+
+            if name in archived:
+                tournament.loader = partial(self.materialize_archived_tournament, controller, pending.get(name, []))
+            else:
+                tournament.loader = partial(self.materialize_tournament, controller, offsets.get(name), signature,
+                                            pending.get(name, []))
+            self.add_tournament(tournament)
+
+        return found
+
+    @staticmethod
+    def materialize_tournament(controller: TournamentController, offset: int | None, signature: tuple | None,
+                               records: list[dict], tournament: Tournament) -> None:
+        """
+        Method that builds the players and the rounds of a tournament loaded from the tournaments index.
+        Args:
+            controller (TournamentController): Controller object.
+            offset (int | None): Offset of the tournament in the json file. None in sharded and sqlite storage.
+            signature (tuple | None): Signature of the json file when the index was read.
+            records (list[dict]): The tournament's journal records read with the index.
+            tournament (Tournament): The tournament to fill in.
+        """
+        tournaments = TournamentsManager()
+        if offset is not None and repository_cache.signature([TOURNAMENTS_DATA_JSON]) == signature:
+            data = read_json_value_at(TOURNAMENTS_DATA_JSON, offset)
+            club_players = controller.get_club_players()
+            tournaments.convert_dict_to_tournaments(controller, {tournament.name: data}, club_players)
+            for record in records:
+                tournaments.apply_journal_record(controller, record, club_players)
+        else:
+            # the json file was rewritten since the index was read, or the tournament is in another storage
+            with controller.journal.lock:
+                tournaments.load_tournaments_from_json(controller, TOURNAMENTS_DATA_JSON, [tournament.name])
+                tournaments.replay_journal(controller, controller.journal, [tournament.name])
+        TournamentsManager.take_loaded_tournament(controller, tournaments, tournament)
+
+    @staticmethod
+    def materialize_archived_tournament(controller: TournamentController, records: list[dict],
+                                        tournament: Tournament) -> None:
+        """
+        Method that builds the players and the rounds of an archived tournament listed from its header. Only its
+        archive file is read, not the json file.
+        Args:
+            controller (TournamentController): Controller object.
+            records (list[dict]): The tournament's journal records read with the index.
+            tournament (Tournament): The tournament to fill in.
+        """
+        tournaments = TournamentsManager()
+        data = controller.archive.read(tournament.name)
+        club_players = controller.get_club_players()
+        tournaments.convert_dict_to_tournaments(controller, {tournament.name: data}, club_players)
+        for record in records:
+            tournaments.apply_journal_record(controller, record, club_players)
+        TournamentsManager.take_loaded_tournament(controller, tournaments, tournament)
+
+    @staticmethod
+    def take_loaded_tournament(controller: TournamentController, tournaments: TournamentsManager,
+                               tournament: Tournament) -> None:
+        """
+        Method that fills in a tournament listed from its header with its fully loaded copy.
+        Args:
+            controller (TournamentController): Controller object.
+            tournaments (TournamentsManager): The tournaments read, the loaded copy among them.
+            tournament (Tournament): The tournament to fill in.
+        """
+        loaded = tournaments.get_tournament(tournament.name)
+        if loaded is not None:
+            tournament.load_from(loaded)
+        else:
+            # left empty, it is never saved in place of its data on disk, see snapshot
+            controller.unreadable[tournament.name] = tournament
+            controller.report_load_issues()
+
+    def save_tournament_to_json(self, controller: TournamentController, file_path: Path,
+                                names: list[str] | None = None) -> bool:
+        """
+        Method that saves tournaments to a json file, or to the shards in sharded storage.
+        Args:
+            controller (TournamentController): The TournamentController object.
+            file_path (Path): Path to the json file to be saved.
+            names (list[str] | None): The tournaments which changed. Only their shards are written in sharded
+                storage, the json file always holds all the tournaments.
+
+        Returns:
+            Returns a boolean indicating if the tournaments were saved successfully or not.
+        """
+        return self.write_snapshot(controller, file_path, self.snapshot(controller, names))
+
+    def snapshot(self, controller: TournamentController, names: list[str] | None = None) -> dict[str, dict]:
+        """
+        Method that gets the data of the tournaments to be saved.
+        Args:
+            controller (TournamentController): The TournamentController object.
+            names (list[str] | None): The tournaments which changed, see save_tournament_to_json.
+
+        Returns:
+            The tournaments' data by name.
+        """
+        # the tournaments read from disk only refer to club players, only the changed ones are checked
+        changed = [tournament for tournament in self
+                   if tournament.is_loaded() and tournament.is_dirty()
+                   and controller.unreadable.get(tournament.name) is not tournament]
+        if controller.storage is not None:
+            # the storage backends only update the given tournaments, the others stay untouched
+            tournaments = [tournament for tournament in self if names is None or tournament.name in names]
+        else:
+            # the archived tournaments never change, they are neither loaded nor written again
+            archived = controller.archive.read_index() if controller.archive is not None else {}
+            tournaments = [tournament for tournament in self if tournament.name not in archived]
+
+        # the tournaments of the index not opened yet are read here, so that the ones whose data could not be
+        # read are known before they are left out: they stay as they are on disk
+        snapshot = {tournament.name: tournament.convert_to_dict() for tournament in tournaments}
+        for tournament in tournaments:
+            if controller.unreadable.get(tournament.name) is tournament:
+                del snapshot[tournament.name]
+        # after the tournaments are read, the players they added from the older files are saved with them
+        controller.register_players(changed)
+        if controller.storage is not None:
+            return snapshot
+
+        # the json file is rewritten as a whole, the tournaments left out keep their data as read
+        for name, attrs in controller.load_report.rejected.items():
+            if name not in archived:
+                snapshot.setdefault(name, attrs)
+        return snapshot
 
-    def save_tournament_to_json(self, controller: TournamentController, file_path: Path) -> bool:
+    @staticmethod
+    def write_snapshot(controller: TournamentController, file_path: Path, snapshot: dict[str, dict]) -> bool:
         """
-        Method that saves tournaments to a json file.
+        Method that writes the data of the tournaments to a json file, or to the storage backend.
         Args:
             controller (TournamentController): The TournamentController object.
             file_path (Path): Path to the json file to be saved.
+            snapshot (dict[str, dict]): The tournaments' data, see snapshot.
 
         Returns:
             Returns a boolean indicating if the tournaments were saved successfully or not.
         """
         try:
-            file_path.parent.mkdir(exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as json_file:
-                tournaments_dict = self.convert_to_dict()
-                json.dump(tournaments_dict, json_file, ensure_ascii=False, indent=4)
+            if controller.storage is not None:
+                controller.storage.write(snapshot)
                 return True
 
+            file_path.parent.mkdir(exist_ok=True)
+            if controller.archive is not None:
+                rejected = controller.load_report.rejected
+                completed = {name: attrs for name, attrs in snapshot.items()
+                             if name not in rejected and Tournament.completed_from_dict(attrs)}
+                if completed:
+                    # archived first, so that a crash in between leaves them in both places rather than in none
+                    controller.archive.write(completed)
+                    snapshot = {name: attrs for name, attrs in snapshot.items() if name not in completed}
+            write_json_atomically(file_path, snapshot)
+            return True
+
         except FileNotFoundError:
             controller.view.display_file_not_found(file_path)
             return False
@@ -232,8 +739,34 @@ class TournamentController:
         self.tournaments = TournamentsManager()
         self.main_controller = main_controller
 
+        # In journaled mode results are appended to the journal and the snapshot is rewritten on compaction
+        self.journaled = JOURNALED_PERSISTENCE
+        self.journal = TournamentsJournal(TOURNAMENTS_JOURNAL)
+        self.lazy = LAZY_LOADING
+        self.warm_start = WARM_START
+        # Problems met while reading the tournaments, the data of the ones left out is kept in it
+        self.load_report = MigrationReport()
+        self.reported_issues = 0
+        # Tournaments of the index whose data could not be read, by name
+        self.unreadable: dict[str, Tournament] = {}
+        # Players stored in full by the older files added to the club players while reading, by identifier
+        self.unsaved_players: dict[str, Player] = {}
+        # Signature of the tournaments files as last written and the tournaments pickled as they were written,
+        # see save_warm_start
+        self.warm_start_pickle: tuple[tuple, bytes] | None = None
+
+        self.storage = main_controller.tournaments_storage
+        self.writer = main_controller.writer
+        # Completed tournaments archive, only used with the json file
+        self.archive = TournamentArchive(TOURNAMENTS_ARCHIVE_FOLDER) if ARCHIVE_COMPLETED else None
+
         self.view = TournamentView()
 
+        # the tournaments which could not be imported into a new database are kept in the json file
+        if isinstance(self.storage, SqliteStorage) and self.storage.import_report.has_errors():
+            errors = [issue for issue in self.storage.import_report.issues if issue["severity"] == "error"]
+            self.view.display_load_issues(errors, self.storage.import_report_path)
+
     def tournaments_menu(self) -> None:
         """
         Method that displays the "tournaments" menu.
@@ -271,27 +804,356 @@ class TournamentController:
                 return t
         return None
 
+    def get_club_players(self) -> PlayersManager:
+        """
+        Method that gets the club players, the single registry the players of every tournament are resolved
+        against. The pending saves are not flushed, so that reading the tournaments never writes: the players
+        being saved are already in the cached players.
+        Returns:
+            Players object.
+        """
+        return self.main_controller.player_controller.get_cached_players()
+
+    def resolve_players(self, name: str, identifiers: list[str], found: dict[str, dict],
+                        club_players: PlayersManager) -> list[Player] | None:
+        """
+        Method that resolves the players identifiers of a tournament against the club players, so that all the
+        tournaments share the same Player objects. Older files store each player in full, the ones missing from
+        the club players are added to them, and saved along with the next save of the tournaments.
+        Args:
+            name (str): The tournament name.
+            identifiers (list[str]): The players identifiers.
+            found (dict[str, dict]): The players' data by identifier, for the players stored in full.
+            club_players (PlayersManager): The club players, read once for the whole load.
+
+        Returns:
+            The players. Or None if an identifier is not a club player, which is recorded in the load report.
+        """
+        resolved = []
+        for identifier in identifiers:
+            player = club_players.get_player_by_identifier(identifier)
+            if player is None:
+                if identifier not in found:
+                    self.load_report.add_issue("error", name, "players", f"Unknown club player {identifier}")
+                    return None
+                attrs = found[identifier]
+                with self.main_controller.player_controller.lock:
+                    # added in the meantime by the other thread
+                    player = club_players.get_player_by_identifier(identifier)
+                    if player is None:
+                        player = Player(attrs["name"], attrs["first_name"], attrs["birth_date"], identifier)
+                        club_players.add_player(player)
+                        self.unsaved_players[identifier] = player
+            resolved.append(player)
+        return resolved
+
+    def register_players(self, tournaments: Iterable[Tournament]) -> None:
+        """
+        Method that saves the club players added while reading the older files, along with the players of the
+        given tournaments missing from the club players, so that every identifier written in a tournament can
+        be resolved.
+        Args:
+            tournaments (Iterable[Tournament]): The tournaments to be saved.
+        """
+        player_controller = self.main_controller.player_controller
+        with player_controller.lock:
+            club_players = self.get_club_players()
+            added = []
+            for identifier, player in self.unsaved_players.items():
+                if club_players.get_player_by_identifier(identifier) is None:
+                    club_players.add_player(player)
+                added.append(identifier)
+            for tournament in tournaments:
+                for player in tournament.players:
+                    if club_players.get_player_by_identifier(player.identifier) is None:
+                        club_players.add_player(player)
+                        added.append(player.identifier)
+
+            if added and player_controller.save_club_players(club_players, added):
+                self.unsaved_players.clear()
+
+    def tournaments_paths(self) -> list[Path]:
+        """
+        Method that gets the files the tournaments are read from.
+        Returns:
+            The paths to the files.
+        """
+        if self.storage is not None:
+            paths = self.storage.paths()
+        else:
+            paths = [TOURNAMENTS_DATA_JSON] + (self.archive.paths() if self.archive is not None else [])
+        return paths + [self.journal.file_path, self.journal.compacting_path]
+
     def get_all_tournaments(self) -> TournamentsManager:
         """
-        Method that gets tournaments object from the json file
+        Method that gets tournaments object from the json file. The parsed tournaments are kept in the
+        repository cache until one of their files changes. In lazy loading only their headers are parsed.
+        Returns:
+            Tournaments object.
+        """
+        self.writer.flush()
+        paths = self.tournaments_paths()
+        key = ("tournaments", self.lazy, *map(str, paths))
+        loader = self.read_tournaments_index if self.lazy else self.read_all_tournaments
+        if self.warm_start:
+            # the tournaments pickled by a previous launch are read while their files are unchanged
+            loader = partial(warm_start_cache.get, key, paths, loader, self.warm_start_references)
+        tournaments = repository_cache.get(key, paths, loader)
+        self.report_load_issues()
+        return tournaments
+
+    def report_load_issues(self) -> None:
+        """
+        Method that displays the errors met since the last call while reading the tournaments, and saves the
+        load report along with the data of the tournaments left out. It is called after each read, the lazily
+        loaded tournaments included.
+        """
+        issues = self.load_report.issues[self.reported_issues:]
+        self.reported_issues = len(self.load_report.issues)
+        errors = [issue for issue in issues if issue["severity"] == "error"]
+        if not errors:
+            return
+        try:
+            TOURNAMENTS_LOAD_REPORT_JSON.parent.mkdir(parents=True, exist_ok=True)
+            self.load_report.write(TOURNAMENTS_LOAD_REPORT_JSON)
+            report_path = TOURNAMENTS_LOAD_REPORT_JSON
+        except OSError:
+            report_path = None
+        self.view.display_load_issues(errors, report_path)
+
+    def warm_start_references(self) -> dict[Any, Any]:
+        """
+        Method that gets the objects the pickled tournaments refer to without holding a copy of them: this
+        controller, which their lazy loaders are bound to, and the club players.
+        Returns:
+            The objects by reference.
+        """
+        references: dict[Any, Any] = {("player", player.identifier): player for player in self.get_club_players()}
+        references["tournament_controller"] = self
+        return references
+
+    def pickle_warm_start(self, tournaments: TournamentsManager) -> bytes | None:
+        """
+        Method that pickles the tournaments as they are being saved, for the next launch.
+        Args:
+            tournaments (TournamentsManager): The tournaments being saved.
+
+        Returns:
+            The pickled tournaments. Or None without warm start.
+        """
+        if not self.warm_start:
+            return None
+        return warm_start_cache.dumps(tournaments, self.warm_start_references())
+
+    def save_warm_start(self) -> None:
+        """
+        Method that stores the tournaments as they were last saved before leaving, so that the next launch starts
+        from them. Nothing is stored if their files changed since, the changes not saved never being stored.
+        """
+        if not self.warm_start or self.warm_start_pickle is None:
+            return
+        paths = self.tournaments_paths()
+        signature, pickled = self.warm_start_pickle
+        # the tournaments left out are only known from reading their files again
+        if repository_cache.signature(paths) == signature and not self.load_report.rejected:
+            warm_start_cache.store(("tournaments", self.lazy, *map(str, paths)), paths, pickled)
+
+    def refresh_cached_tournaments(self, tournaments: TournamentsManager | None = None,
+                                   pickled: bytes | None = None) -> None:
+        """
+        Method that keeps the cached tournaments once they have been saved, and their pickled form along with the
+        signature of the files as written, see save_warm_start.
+        Args:
+            tournaments (TournamentsManager | None): The saved tournaments. The current ones if None.
+            pickled (bytes | None): The tournaments pickled when they were handed to the writer, as they were
+                saved. Pickled now if None.
+        """
+        tournaments = self.tournaments if tournaments is None else tournaments
+        paths = self.tournaments_paths()
+        repository_cache.refresh(("tournaments", self.lazy, *map(str, paths)), paths, tournaments)
+        pickled = self.pickle_warm_start(tournaments) if pickled is None else pickled
+        if pickled is not None:
+            self.warm_start_pickle = (repository_cache.signature(paths), pickled)
+
+    def invalidate_cached_tournaments(self) -> None:
+        """
+        Method that drops the cached tournaments when they could not be saved. They were changed in place before
+        the write, the next read gets them from their files again rather than with the changes which were lost.
+        """
+        paths = self.tournaments_paths()
+        repository_cache.invalidate(("tournaments", self.lazy, *map(str, paths)))
+
+    def queue_tournaments_save(self, names: list[str]) -> None:
+        """
+        Method that hands a snapshot of the tournaments to the write-behind writer. The cached tournaments are
+        refreshed once it reached the disk.
+        Args:
+            names (list[str]): The tournaments which changed, see TournamentsManager.save_tournament_to_json.
+        """
+        tournaments = self.tournaments
+        # pickled now, the tournaments can change again before the snapshot is written
+        pickled = self.pickle_warm_start(tournaments)
+
+        def write(snapshot: dict[str, dict]) -> None:
+            if TournamentsManager.write_snapshot(self, TOURNAMENTS_DATA_JSON, snapshot):
+                self.refresh_cached_tournaments(tournaments, pickled)
+            else:
+                self.invalidate_cached_tournaments()
+
+        def failed(error: Exception) -> None:
+            self.invalidate_cached_tournaments()
+            self.view.display_save_failed(self.tournaments_paths()[0], error)
+
+        # the save was confirmed at once, a failure is told when it happens rather than at the next flush
+        self.writer.submit("tournaments", tournaments.snapshot(self, names), write, failed)
+
+    def read_tournaments_index(self) -> TournamentsManager:
+        """
+        Method that reads the tournaments headers, each tournament being fully built when first opened.
         Returns:
             Tournaments object.
         """
+        self.reset_load_report()
         tournaments = TournamentsManager()
+        tournaments.load_tournaments_index(self, TOURNAMENTS_DATA_JSON)
+        return tournaments
 
-        tournaments.load_tournaments_from_json(self, TOURNAMENTS_DATA_JSON)
+    def read_all_tournaments(self) -> TournamentsManager:
+        """
+        Method that reads all the tournaments, with the pending journal records applied.
+        Returns:
+            Tournaments object.
+        """
+        self.reset_load_report()
+        tournaments = TournamentsManager()
+
+        with self.journal.lock:
+            tournaments.load_tournaments_from_json(self, TOURNAMENTS_DATA_JSON)
+            tournaments.replay_journal(self, self.journal)
         return tournaments
 
+    def reset_load_report(self) -> None:
+        """
+        Method that starts a new load report before all the tournaments are read again from their files, so that
+        the problems and the tournaments left out by the previous reads are neither kept nor reported twice.
+        """
+        self.load_report = MigrationReport()
+        self.reported_issues = 0
+        self.unreadable.clear()
+
+    def get_tournaments_summaries(self) -> TournamentsManager:
+        """
+        Method that gets the tournaments headers, without their rounds, enough to list or select them.
+        They come from the manifest in sharded storage and from the tournaments table in sqlite storage.
+        In lazy loading they are the tournaments index, whose tournaments are built when opened.
+        Returns:
+            Tournaments object.
+        """
+        if self.storage is None or self.lazy:
+            return self.get_all_tournaments()
+
+        self.writer.flush()
+        with self.journal.lock:
+            manifest = self.storage.read_summaries()
+            for record in self.journal.records():
+                if record["op"] == "tournament":
+                    manifest.setdefault(record["name"], record["data"])
+
+        summaries = TournamentsManager()
+        for name, attrs in manifest.items():
+            summaries.add_tournament(Tournament(name,
+                                                attrs["place"],
+                                                attrs["rounds_number"],
+                                                attrs["start_date"],
+                                                attrs["end_date"],
+                                                attrs.get("description", ""),
+                                                attrs.get("current_round", 1)))
+        return summaries
+
+    def load_tournament(self, tournament_name: str) -> Tournament | None:
+        """
+        Method that loads a single tournament. In sharded and sqlite storage only this tournament is read.
+        Args:
+            tournament_name (str): Tournament name.
+
+        Returns:
+            The tournament object. Or None otherwise.
+        """
+        if self.storage is None or self.lazy:
+            return self.get_all_tournaments().get_tournament(tournament_name)
+
+        self.writer.flush()
+
+        def read_tournament() -> TournamentsManager:
+            tournaments = TournamentsManager()
+            with self.journal.lock:
+                tournaments.load_tournaments_from_json(self, TOURNAMENTS_DATA_JSON, [tournament_name])
+                tournaments.replay_journal(self, self.journal, [tournament_name])
+            return tournaments
+
+        paths = self.tournaments_paths()
+        tournaments = repository_cache.get(("tournament", tournament_name, *map(str, paths)), paths, read_tournament)
+        self.report_load_issues()
+        return tournaments.get_tournament(tournament_name)
+
+    def write_journal_snapshot(self, records) -> bool:
+        """
+        Method that writes the tournaments snapshot with the given journal records applied. It runs on the
+        compaction thread in background compaction, so it only changes the club players under their lock.
+        Args:
+            records (Iterator[dict]): The journal records to apply.
+
+        Returns:
+            Returns a boolean indicating if the snapshot was written successfully or not.
+        """
+        self.writer.flush()
+        records = list(records)
+        names = list({record["name"] for record in records})
+        # the single json file is rewritten as a whole, so it needs all the tournaments
+        partial = names if self.storage is not None else None
+
+        tournaments = TournamentsManager()
+        with self.journal.lock:
+            tournaments.load_tournaments_from_json(self, TOURNAMENTS_DATA_JSON, partial)
+        for record in records:
+            tournaments.apply_journal_record(self, record)
+        return tournaments.save_tournament_to_json(self, TOURNAMENTS_DATA_JSON, names)
+
+    def compact_journal(self, background: bool = False) -> None:
+        """
+        Method that folds the journal into the tournaments snapshot.
+        Args:
+            background (bool): True to compact in a background thread.
+        """
+        if background:
+            self.journal.compact_in_background(self.write_journal_snapshot)
+        else:
+            self.journal.wait_for_compaction()
+            self.journal.compact(self.write_journal_snapshot)
+
+    def flush_journal(self) -> None:
+        """
+        Method that folds the pending journal records, if any, into the snapshot.
+        """
+        if not self.journal.is_empty():
+            self.compact_journal()
+
+    def close(self) -> None:
+        """
+        Method that flushes the pending journal records into the snapshot before leaving.
+        """
+        self.flush_journal()
+
     def display_a_tournament(self) -> None:
         """
         Method that displays a tournament.
         """
-        self.tournaments = self.get_all_tournaments()
-        name = self.view.prompt_for_selecting_tournament(self.tournaments)
+        summaries = self.get_tournaments_summaries()
+        name = self.view.prompt_for_selecting_tournament(summaries)
         if name.lower() == "q":
             return
 
-        self.current_tournament = self.get_tournament(name)
+        self.current_tournament = self.load_tournament(name)
 
         self.view.display_tournament(self.current_tournament)
 
@@ -383,15 +1245,25 @@ class TournamentController:
             self.view.display_tournament_exists()
         else:
             self.tournaments.add_tournament(self.current_tournament)
-            if self.tournaments.save_tournament_to_json(self, TOURNAMENTS_DATA_JSON):
+            if self.journaled:
+                self.journal.log_tournament(self.current_tournament)
+                self.refresh_cached_tournaments()
                 self.view.display_tournament_added(self.current_tournament)
+            else:
+                self.flush_journal()
+                if self.tournaments.save_tournament_to_json(self, TOURNAMENTS_DATA_JSON,
+                                                            [self.current_tournament.name]):
+                    self.refresh_cached_tournaments()
+                    self.view.display_tournament_added(self.current_tournament)
+                else:
+                    self.invalidate_cached_tournaments()
 
     def display_completed_tournament(self) -> None:
         """
         Method that displays a completed tournament object and the winner of the tournament.
         """
 
-        scores, id_to_player = Tournament.compute_player_scores(self.current_tournament)
+        scores, id_to_player = self.compute_player_scores(self.current_tournament)
         if not scores:
             self.view.display_no_scores_found()
             return
@@ -405,6 +1277,26 @@ class TournamentController:
 
         self.view.display_winners(winners, max_score, self.current_tournament.name)
 
+    def compute_player_scores(self, tournament: Tournament) -> tuple[dict[str, float], dict[str, Player]]:
+        """
+        Method that computes the player scores of a tournament. In sqlite storage they are summed up by an
+        aggregate query over the matches, once the pending saves reached the database. The results only in
+        the journal are not in the database yet, the scores are then computed from the tournament.
+        Args:
+            tournament (Tournament): Tournament object.
+
+        Returns:
+            A score associated to player's id, and the players by id.
+        """
+        if not isinstance(self.storage, SqliteStorage) or not self.journal.is_empty():
+            return Tournament.compute_player_scores(tournament)
+
+        self.writer.flush()
+        id_to_player = {player.identifier: player for player in tournament.players}
+        scores = {player_id: 0.0 for player_id in id_to_player}
+        scores.update(self.storage.standings(tournament.name))
+        return scores, id_to_player
+
     def tournament_exists(self, tournament_name: str) -> bool:
         """
         Method that checks if a tournament exists.
@@ -430,15 +1322,24 @@ class TournamentController:
                 self.tournaments.remove(tournament)
                 self.tournaments.add_tournament(self.current_tournament)
 
-        if self.tournaments.save_tournament_to_json(self, TOURNAMENTS_DATA_JSON):
+        if self.journaled:
+            # The results are already in the journal
+            self.refresh_cached_tournaments()
+            if self.journal.needs_compaction():
+                self.compact_journal(background=True)
+            self.view.display_tournament_updated(self.current_tournament)
 
+        else:
+            self.flush_journal()
+            self.queue_tournaments_save([tournament_name])
             self.view.display_tournament_updated(self.current_tournament)
 
     def set_match_scores(self, match: Match,
                          player_1: Player,
                          score_1: float,
                          player_2: Player,
-                         score_2: float) -> None:
+                         score_2: float,
+                         tournament: Tournament | None = None) -> None:
         """
         Method that sets the scores of the match.
         Args:
@@ -447,24 +1348,26 @@ class TournamentController:
             score_1 (float): The score 1.
             player_2 (Player): The player 2 associated to score 2.
             score_2 (float): The score 2.
-        """
-
-        p1, s1, c1 = match.match_tuple[0]
-        p2, s2, c2 = match.match_tuple[1]
-
-        if p1 == player_1:
-            match.match_tuple = (
-                (p1, score_1, c1),
-                (p2, score_2, c2),
-            )
-        elif p1 == player_2:
-            match.match_tuple = (
-                (p1, score_2, c1),
-                (p2, score_1, c2),
-            )
+            tournament (Tournament | None): The tournament of the match, whose score ledger is updated and which is
+                marked as changed. None while the match is rebuilt, its round is indexed once added to the tournament.
+        """
+        if tournament is not None:
+            tournament.sync_round_index()
+            old_scores = [(match.player_1.identifier, match.score_1), (match.player_2.identifier, match.score_2)]
+
+        if match.player_1 == player_1:
+            match.score_1 = score_1
+            match.score_2 = score_2
+        elif match.player_1 == player_2:
+            match.score_1 = score_2
+            match.score_2 = score_1
         else:
             self.view.display_scores_bug()
 
+        if tournament is not None:
+            tournament.update_ledger(old_scores, match)
+            tournament.mark_dirty()
+
     def update_tournament(self) -> None:
         """
         Method that updates a tournament. Called when the user select the second option in the main menu.
@@ -518,9 +1421,11 @@ class TournamentController:
         Args:
             tournament_name (str): the tournament name.
         """
-        self.set_tournament_scores()
+        # the results of the round reach the journal in a single durable write
+        with self.journal.batch():
+            self.set_tournament_scores()
 
-        self.current_tournament.rounds[self.current_tournament.current_round - 1].set_end_date()
+            self.end_current_round()
 
         self.save_tournament(tournament_name)
 
@@ -533,17 +1438,30 @@ class TournamentController:
         Args:
             tournament_name (str): The name of the tournament.
         """
-        self.set_tournament_scores()
+        # the results of the round and the next pairings reach the journal in a single durable write
+        with self.journal.batch():
+            self.set_tournament_scores()
 
-        self.current_tournament.rounds[self.current_tournament.current_round - 1].set_end_date()
+            self.end_current_round()
 
-        self.current_tournament.current_round += 1
+            self.current_tournament.current_round += 1
 
-        self.current_tournament.create_round(self.current_tournament.current_round,
-                                             self.current_tournament.sort_players_by_score())
+            self.current_tournament.create_round(self.current_tournament.current_round,
+                                                 self.current_tournament.sort_players_by_score())
+            if self.journaled:
+                self.journal.log_round_start(self.current_tournament, self.current_tournament.current_round - 1)
 
         self.save_tournament(tournament_name)
 
+    def end_current_round(self) -> None:
+        """
+        Method that sets the end date of the current round.
+        """
+        round_index = self.current_tournament.current_round - 1
+        self.current_tournament.rounds[round_index].set_end_date()
+        if self.journaled:
+            self.journal.log_round_end(self.current_tournament, round_index)
+
     @staticmethod
     def increment_score(player_score: float, increment: float) -> None:
         """
@@ -564,7 +1482,7 @@ class TournamentController:
         self.view.display_setting_scores_title()
         self.view.display_round(rnd)
 
-        for match in rnd.matches:
+        for match_index, match in enumerate(rnd.matches):
             player_1, _, _ = match.match_tuple[0]
             player_2, _, _ = match.match_tuple[1]
 
@@ -579,7 +1497,9 @@ class TournamentController:
 
             score_2 = actions.get(float(score_1), 0)
 
-            self.set_match_scores(match, player_1, score_1, player_2, score_2)
+            self.set_match_scores(match, player_1, score_1, player_2, score_2, tournament)
+            if self.journaled:
+                self.journal.log_score(tournament, tournament.current_round - 1, match_index, match)
 
         self.view.display_tournament_round_score_saved(rnd.round_name)
 
@@ -597,20 +1517,20 @@ class TournamentController:
 
         self.main_controller.player_controller.get_players()
 
-        all_players = self.main_controller.player_controller.players_manager.all_players()
+        all_players = self.main_controller.player_controller.players_manager
         selected_players = PlayersManager()
 
         while current_number < number:
             players_left = number - current_number
             player_identifier = (self.main_controller.player_controller.view.
                                  prompt_for_selecting_players(all_players, players_left, selected_players))
-            player = self.main_controller.player_controller.players_manager.get_player_by_identifier(player_identifier)
+            player = self.main_controller.player_controller.find_player(player_identifier)
 
             if player is None:
                 self.view.display_player_not_found()
                 continue
 
-            if any(p.identifier == player.identifier for p in selected_players):
+            if selected_players.player_identifier_exists(player.identifier):
                 self.view.display_player_exists()
                 continue
 
@@ -645,6 +1565,17 @@ class TournamentController:
 class PlayersManager(UserList):
     def __init__(self, players=None):
         super().__init__(players or [])
+        # identifier -> first player with this identifier, kept in sync by every method changing the list
+        self.identifier_index: dict[str, Player] = {}
+        self.reindex()
+
+    def reindex(self) -> None:
+        """
+        Method that rebuilds the identifier index from the list of players.
+        """
+        self.identifier_index = {}
+        for player in self.data:
+            self.identifier_index.setdefault(player.identifier, player)
 
     def all_players(self) -> list["Player"]:
         return list(self.data)
@@ -656,6 +1587,43 @@ class PlayersManager(UserList):
             player (Player): Player to be added.
         """
         self.data.append(player)
+        self.identifier_index.setdefault(player.identifier, player)
+
+    def append(self, player: Player) -> None:
+        self.add_player(player)
+
+    def extend(self, players) -> None:
+        for player in players:
+            self.add_player(player)
+
+    def __iadd__(self, players):
+        self.extend(players)
+        return self
+
+    def insert(self, i, player: Player) -> None:
+        self.data.insert(i, player)
+        self.reindex()
+
+    def pop(self, i=-1) -> Player:
+        player = self.data.pop(i)
+        self.reindex()
+        return player
+
+    def remove(self, player: Player) -> None:
+        self.data.remove(player)
+        self.reindex()
+
+    def clear(self) -> None:
+        self.data.clear()
+        self.identifier_index.clear()
+
+    def __setitem__(self, i, player) -> None:
+        self.data[i] = player
+        self.reindex()
+
+    def __delitem__(self, i) -> None:
+        del self.data[i]
+        self.reindex()
 
     def player_names_exist(self, name: str, first_name: str) -> bool:
         """
@@ -683,11 +1651,11 @@ class PlayersManager(UserList):
         Returns:
             Boolean: True if the player identifier already exists. False otherwise.
         """
-        return any(p.identifier == identifier for p in self.data)
+        return identifier in self.identifier_index
 
     def shuffle(self) -> None:
         """
-        Method that shuffles the list of players.
+        Method that shuffles the list of players. The identifier index does not depend on the order.
         """
         random.shuffle(self.data)
 
@@ -715,12 +1683,16 @@ class PlayersManager(UserList):
 
     def load_players_from_json(self, controller: PlayerController, file_path: Path) -> bool | None:
         """
-        Method that loads the players from a json file.
+        Method that loads the players from a json file, or from the database in sqlite storage.
         Args:
             controller (PlayerController): Controller object.
             file_path (Path): Path to the json file.
         Returns (bool) : True if the file was successfully loaded. False otherwise.
         """
+        if controller.storage is not None:
+            self.convert_dict_to_players(controller.storage.read_players())
+            return True
+
         try:
             with open(file_path, encoding="utf-8") as json_file:
                 data = json.load(json_file)
@@ -731,21 +1703,51 @@ class PlayersManager(UserList):
             self.save_players_to_json(controller, PLAYERS_DATA_JSON)
             return None
 
-    def save_players_to_json(self, controller: PlayerController, file_path: Path) -> bool:
+    def save_players_to_json(self, controller: PlayerController, file_path: Path,
+                             identifiers: list[str] | None = None) -> bool:
         """
-        Method that saves the players to a json file.
+        Method that saves the players to a json file, or to the database in sqlite storage.
         Args:
             controller (PlayerController): The controller object.
             file_path (Path): Path to the json file.
+            identifiers (list[str] | None): The players which changed. Only their rows are written in sqlite
+                storage, the json file always holds all the players.
         Returns (bool): True if the saved players were saved. False otherwise.
         """
+        return self.write_snapshot(controller, file_path, self.snapshot(controller, identifiers))
+
+    def snapshot(self, controller: PlayerController, identifiers: list[str] | None = None) -> dict[str, dict]:
+        """
+        Method that gets the data of the players to be saved.
+        Args:
+            controller (PlayerController): The controller object.
+            identifiers (list[str] | None): The players which changed, see save_players_to_json.
+        Returns (dict[str, dict]): The players' data by identifier.
+        """
+        if controller.storage is not None:
+            return {str(player.identifier): player.convert_to_dict() for player in self
+                    if identifiers is None or player.identifier in identifiers}
+        return self.convert_to_dict()
+
+    @staticmethod
+    def write_snapshot(controller: PlayerController, file_path: Path, snapshot: dict[str, dict]) -> bool:
+        """
+        Method that writes the data of the players to a json file, or to the database in sqlite storage.
+        Args:
+            controller (PlayerController): The controller object.
+            file_path (Path): Path to the json file.
+            snapshot (dict[str, dict]): The players' data, see snapshot.
+        Returns (bool): True if the players were saved. False otherwise.
+        """
         try:
-            file_path.parent.mkdir(exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as json_file:
-                players_dict = self.convert_to_dict()
-                json.dump(players_dict, json_file, ensure_ascii=False, indent=4)
+            if controller.storage is not None:
+                controller.storage.write_players(snapshot)
                 return True
 
+            file_path.parent.mkdir(exist_ok=True)
+            write_json_atomically(file_path, snapshot)
+            return True
+
         except FileNotFoundError:
             controller.view.display_file_not_found(file_path)
             return False
@@ -759,8 +1761,7 @@ class PlayersManager(UserList):
         Returns:
             The player object with the given identifier. Or None if not found.
         """
-        players = [p for p in self if p.identifier == identifier]
-        return players[0] if players else None
+        return self.identifier_index.get(identifier)
 
 
 class PlayerController:
@@ -768,6 +1769,10 @@ class PlayerController:
         self.view = PlayerView()
         self.players_manager = PlayersManager()
         self.main_controller = main_controller
+        self.storage = main_controller.players_storage
+        self.writer = main_controller.writer
+        # Guards the changes to the club players, which the journal compaction thread also adds to and saves
+        self.lock = threading.RLock()
 
     def players_menu(self) -> None:
         """
@@ -790,14 +1795,92 @@ class PlayerController:
 
             action()
 
+    def players_paths(self) -> list[Path]:
+        """
+        Method that gets the files the players are read from.
+        Returns:
+            The paths to the files.
+        """
+        return [PLAYERS_DATA_JSON] if self.storage is None else self.storage.paths()
+
     def get_players(self) -> None:
         """
-        Method that gets players object from the json file
+        Method that gets players object from the json file. The parsed players are kept in the repository
+        cache until their file changes.
+        Returns:
+            Players object.
+        """
+        self.writer.flush()
+        self.players_manager = self.get_cached_players()
+
+    def get_cached_players(self) -> PlayersManager:
+        """
+        Method that gets the club players from the repository cache, read from their file if it changed, without
+        flushing the pending saves.
+        Returns:
+            Players object.
+        """
+        paths = self.players_paths()
+        return repository_cache.get(("players", *map(str, paths)), paths, self.read_players)
+
+    def find_player(self, identifier: str) -> Player | None:
+        """
+        Method that finds a club player by identifier. In sqlite storage the identifier is looked up through
+        the primary key index of the database, the loaded club players only give the Player object shared by
+        the tournaments.
+        Args:
+            identifier (str): The player identifier.
+
+        Returns:
+            The player object with the given identifier. Or None if not found.
+        """
+        if self.storage is None:
+            self.get_players()
+            return self.players_manager.get_player_by_identifier(identifier)
+
+        # the players being saved are in the database once the writer is flushed
+        self.writer.flush()
+        attrs = self.storage.find_player(identifier)
+        if attrs is None:
+            return None
+        player = self.players_manager.get_player_by_identifier(identifier)
+        return player or Player(attrs["name"], attrs["first_name"], attrs["birth_date"], identifier)
+
+    def save_club_players(self, players: PlayersManager, identifiers: list[str]) -> bool:
+        """
+        Method that saves the club players after some of them were added outside of the players menu. The
+        pending players save is written first, so that it cannot overwrite this one with older players.
+        Args:
+            players (PlayersManager): The club players.
+            identifiers (list[str]): The added players identifiers.
+
+        Returns:
+            True if the players were saved. False otherwise.
+        """
+        self.writer.flush()
+        if players.save_players_to_json(self, PLAYERS_DATA_JSON, identifiers):
+            paths = self.players_paths()
+            repository_cache.refresh(("players", *map(str, paths)), paths, players)
+            return True
+        self.invalidate_cached_players()
+        return False
+
+    def invalidate_cached_players(self) -> None:
+        """
+        Method that drops the cached club players when they could not be saved, so that the next read gets them
+        from their files again rather than with the players which were not saved.
+        """
+        repository_cache.invalidate(("players", *map(str, self.players_paths())))
+
+    def read_players(self) -> PlayersManager:
+        """
+        Method that reads all the club players.
         Returns:
             Players object.
         """
-        self.players_manager.clear()
-        self.players_manager.load_players_from_json(self, PLAYERS_DATA_JSON)
+        players = PlayersManager()
+        players.load_players_from_json(self, PLAYERS_DATA_JSON)
+        return players
 
     def display_players(self) -> None:
         """
@@ -832,7 +1915,7 @@ class PlayerController:
         while True:
             identifier = self.view.prompt_for_player_identifier()
 
-            if self.players_manager.player_identifier_exists(identifier):
+            if self.find_player(identifier) is not None:
                 self.view.display_player_identifier_exists()
                 continue
             else:
@@ -840,16 +1923,31 @@ class PlayerController:
 
         player = Player(name.upper(), first_name.capitalize(), birth_date, identifier)
 
-        self.players_manager.add_player(player)
+        players = self.players_manager
+
+        def write(snapshot: dict[str, dict]) -> None:
+            if PlayersManager.write_snapshot(self, PLAYERS_DATA_JSON, snapshot):
+                paths = self.players_paths()
+                repository_cache.refresh(("players", *map(str, paths)), paths, players)
+            else:
+                self.invalidate_cached_players()
+
+        def failed(error: Exception) -> None:
+            self.invalidate_cached_players()
+            self.view.display_save_failed(self.players_paths()[0], error)
 
-        if self.players_manager.save_players_to_json(self, PLAYERS_DATA_JSON):
-            self.view.display_player_added(player)
+        # queued along with the change, so that the players the compaction thread saves are not overwritten
+        with self.lock:
+            players.add_player(player)
+            self.writer.submit("players", players.snapshot(self, [player.identifier]), write, failed)
+        self.view.display_player_added(player)
 
 
 class ReportController:
     def __init__(self, main_controller):
         self.main_controller = main_controller
         self.view = ReportView()
+        self.build_cache = ReportBuildCache(REPORTS_BUILD_MANIFEST_JSON, REPORTS_FRAGMENTS_JSON)
 
     def reports_menu(self) -> None:
         """
@@ -874,12 +1972,13 @@ class ReportController:
 
             action()
 
-    def save_report(self, path: Path, content: str) -> bool:
+    def save_report(self, path: Path, content: Iterable[str]) -> bool:
         """
-        Method that saves the report with the given path.
+        Method that saves the report with the given path. The content is written as it is rendered, to a
+        temporary file swapped in once complete, so that a failed report never replaces the previous one.
         Args:
             path (Path): Path to save the report.
-            content (str): Content of the report.
+            content (Iterable[str]): Content of the report, in chunks.
 
         Returns:
             Boolean : True if the report was saved. False otherwise.
@@ -887,87 +1986,169 @@ class ReportController:
         try:
             output_path = Path(path)
             output_path.parent.mkdir(exist_ok=True)
-            with open(path, "w", encoding="utf-8") as html_file:
-                html_file.write(content)
-                return True
+            temporary_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(temporary_path, "w", encoding="utf-8", buffering=REPORT_WRITE_BUFFER) as html_file:
+                    html_file.writelines(content)
+            except BaseException:
+                temporary_path.unlink(missing_ok=True)
+                raise
+            os.replace(temporary_path, output_path)
+            return True
 
         except FileNotFoundError:
             self.view.display_file_not_found(path)
             return False
 
+    def write_report(self, path: Path, build: ReportBuild) -> str:
+        """
+        Method that writes the report with the given path, unless the report file is up to date. The build is
+        recorded in the build cache, which is left to be saved by the caller.
+        Args:
+            path (Path): Path to save the report.
+            build (ReportBuild): The report to be written.
+
+        Returns:
+            "generated" if the report was rendered and saved, "unchanged" if it was up to date, "failed" otherwise.
+        """
+        reason = self.build_cache.outdated(path, build)
+        if reason is None:
+            self.build_cache.record(path, build, None)
+            return "unchanged"
+        if not self.save_report(path, build.content):
+            return "failed"
+        self.build_cache.record(path, build, reason)
+        return "generated"
+
+    def build_report(self, path: Path, build: ReportBuild) -> bool:
+        """
+        Method that writes the report with the given path, unless the report file is up to date, and saves the
+        build manifest.
+        Args:
+            path (Path): Path to save the report.
+            build (ReportBuild): The report to be written.
+
+        Returns:
+            Boolean : True if the report was rendered and saved. False otherwise.
+        """
+        status = self.write_report(path, build)
+        self.build_cache.save()
+        if status == "unchanged":
+            self.view.display_report_unchanged(path)
+        return status == "generated"
+
+    def generate_all_reports(self, workers: int | None = REPORT_WORKERS) -> bool:
+        """
+        Method that writes the players and the tournaments reports, and the players and the rounds reports of
+        every tournament, archived ones included, on a pool of threads. The players, the tournaments and the
+        templates are loaded once, before the reports are handed to the threads, and shared by all of them.
+        Args:
+            workers (int | None): Number of reports written at once, None for the thread pool default.
+
+        Returns:
+            True if all the reports were written or up to date. False otherwise.
+        """
+        start = time.perf_counter()
+
+        self.main_controller.player_controller.get_players()
+        sorted_players = sorted(self.main_controller.player_controller.players_manager, key=lambda p: p.name)
+        sorted_tournaments = sorted(self.main_controller.tournament_controller.get_all_tournaments(),
+                                    key=lambda t: t.name)
+        for tournament in sorted_tournaments:
+            # the tournaments read from the index are built here, the threads only read them
+            tournament.materialize()
+        self.main_controller.templates.load_all()
+
+        tasks = [(ALPHABETICALLY_PLAYERS_REPORT, partial(self.players_report, sorted_players)),
+                 (ALL_TOURNAMENTS_REPORT, partial(self.tournaments_report, sorted_tournaments))]
+        for tournament in sorted_tournaments:
+            players_path, rounds_path = tournament_reports_paths(tournament.name)
+            tasks.append((players_path, partial(self.tournament_players_report, tournament)))
+            tasks.append((rounds_path, partial(self.tournament_rounds_report, tournament)))
+        TOURNAMENT_REPORTS_FOLDER.mkdir(parents=True, exist_ok=True)
+
+        def write(path: Path, report: Callable[[], ReportBuild]) -> tuple[Path, str, float]:
+            report_start = time.perf_counter()
+            try:
+                status = self.write_report(path, report())
+            except Exception as error:
+                self.view.display_report_error(path, error)
+                status = "failed"
+            return path, status, time.perf_counter() - report_start
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = []
+            for path, status, seconds in executor.map(lambda task: write(*task), tasks):
+                self.view.display_report_timing(path, status, seconds)
+                results.append(status)
+        self.build_cache.save()
+
+        self.view.display_reports_summary({status: results.count(status) for status in set(results)},
+                                          time.perf_counter() - start)
+        return "failed" not in results
+
     def display_report(self, report: int) -> None:
         """
         Method that displays the report according to the report number given.
         Args:
             report (int): Number of the report in the dispatch table.
-
-        Returns:
-            A tuple with the template path and the HTML content.
         """
-        def report_alphabetically_players() -> tuple[Path, str]:
+        def report_alphabetically_players() -> tuple[Path, ReportBuild]:
             """
-            Method that returns a tuple containing the report path and the html content of the report for
+            Method that returns a tuple containing the report path and the build of the report for
             alphabetically sorted club players.
             Returns:
-                The report path and the html content of the report for alphabetically sorted club players.
+                The report path and the build of the report for alphabetically sorted club players.
             """
-            content = self.generate_report_alphabetically_players()
-            return ALPHABETICALLY_PLAYERS_REPORT, content
+            build = self.generate_report_alphabetically_players()
+            return ALPHABETICALLY_PLAYERS_REPORT, build
 
-        def report_tournaments() -> tuple[Path, str]:
+        def report_tournaments() -> tuple[Path, ReportBuild]:
             """
-            Method that returns a tuple containing the report path and the html content of the report for
+            Method that returns a tuple containing the report path and the build of the report for
             all sorted tournaments.
             Returns:
-                The report path and the html content of the report of all sorted tournaments.
+                The report path and the build of the report of all sorted tournaments.
             """
-            content = self.generate_report_tournaments()
-            return ALL_TOURNAMENTS_REPORT, content
+            build = self.generate_report_tournaments()
+            return ALL_TOURNAMENTS_REPORT, build
 
-        def report_current_tournament_players() -> tuple[Path, str]:
+        def report_current_tournament_players() -> tuple[Path, ReportBuild]:
             """
-            Method that returns a tuple containing the report path and the html content of the report for
+            Method that returns a tuple containing the report path and the build of the report for
             sorted players in the current tournament.
             Returns:
-                The report path and the html content of the report for sorted players in the current tournament.
+                The report path and the build of the report for sorted players in the current tournament.
             """
-            tournaments = self.main_controller.tournament_controller.get_all_tournaments()
-
-            tournament_name = (self.main_controller.tournament_controller.view.
-                               prompt_for_selecting_tournament(tournaments))
+            tournament_controller = self.main_controller.tournament_controller
+            tournaments = tournament_controller.get_tournaments_summaries()
 
-            current_tournament = Tournament("", "", 4)
+            tournament_name = tournament_controller.view.prompt_for_selecting_tournament(tournaments)
 
-            for tournament in tournaments:
-                if tournament.name == tournament_name:
-                    current_tournament = tournament
+            current_tournament = tournament_controller.load_tournament(tournament_name) or Tournament("", "", 4)
 
-            content = self.generate_report_current_tournament_players(current_tournament)
+            build = self.generate_report_current_tournament_players(current_tournament)
 
-            return CURRENT_TOURNAMENT_PLAYERS_REPORT, content
+            return CURRENT_TOURNAMENT_PLAYERS_REPORT, build
 
-        def report_current_tournament_rounds_and_matches() -> tuple[Path, str]:
+        def report_current_tournament_rounds_and_matches() -> tuple[Path, ReportBuild]:
             """
-            Method that returns a tuple containing the report path and the html content of the report for
+            Method that returns a tuple containing the report path and the build of the report for
             all rounds and matches in the current tournament.
             Returns:
-                The report path and the html content of the report for all rounds and matches
+                The report path and the build of the report for all rounds and matches
                 in the current tournament.
             """
-            tournaments = self.main_controller.tournament_controller.get_all_tournaments()
-
-            tournament_name = (self.main_controller.tournament_controller.view.
-                               prompt_for_selecting_tournament(tournaments))
+            tournament_controller = self.main_controller.tournament_controller
+            tournaments = tournament_controller.get_tournaments_summaries()
 
-            current_tournament = Tournament("", "", 4)
+            tournament_name = tournament_controller.view.prompt_for_selecting_tournament(tournaments)
 
-            for tournament in tournaments:
-                if tournament.name == tournament_name:
-                    current_tournament = tournament
+            current_tournament = tournament_controller.load_tournament(tournament_name) or Tournament("", "", 4)
 
-            content = self.generate_report_current_tournament_all_rounds_and_matches(current_tournament)
+            build = self.generate_report_current_tournament_all_rounds_and_matches(current_tournament)
 
-            return CURRENT_TOURNAMENT_ROUNDS_AND_MATCHES_REPORT, content
+            return CURRENT_TOURNAMENT_ROUNDS_AND_MATCHES_REPORT, build
 
         # --- Dispatch Table ---
         reports = {
@@ -983,10 +2164,10 @@ class ReportController:
                 if report not in reports:
                     self.view.display_invalid_report_number()
                     break
-                path, content = reports[report]()
+                path, build = reports[report]()
 
-                self.save_report(path, content)
-                self.view.display_report_generated(path)
+                if self.build_report(path, build):
+                    self.view.display_report_generated(path)
                 break
 
             elif answer == "n":
@@ -995,14 +2176,25 @@ class ReportController:
             else:
                 self.view.display_yes_no()
 
-    def generate_report_alphabetically_players(self) -> str:
+    def render(self, report: str, **context) -> Iterator[str]:
         """
-        Method that generates the report with the players alphabetically sorted.
+        Method that renders a report template chunk by chunk. The template is only loaded with the first chunk,
+        so that a report which is up to date never loads it.
+        Args:
+            report (str): The report name in the templates registry.
+            **context: The variables of the template.
+
         Returns:
             HTML content of the report.
         """
-        template = self.main_controller.templates["players"]
+        yield from self.main_controller.templates[report].generate(**context)
 
+    def generate_report_alphabetically_players(self) -> ReportBuild:
+        """
+        Method that generates the report with the players alphabetically sorted.
+        Returns:
+            The build of the report, its HTML content rendered chunk by chunk as it is consumed.
+        """
         self.main_controller.player_controller.get_players()
 
         players = self.main_controller.player_controller.players_manager
@@ -1011,69 +2203,125 @@ class ReportController:
 
         self.view.display_sorted_players(len(sorted_players), PlayersManager(sorted_players))
 
-        html = template.render(players=sorted_players)
-
-        return html
+        return self.players_report(sorted_players)
 
-    def generate_report_tournaments(self) -> str:
+    def generate_report_tournaments(self) -> ReportBuild:
         """
         Method that generates the report with the tournaments sorted.
         Returns:
-            HTML content of the report.
+            The build of the report, its HTML content rendered chunk by chunk as it is consumed.
         """
         tournaments = self.main_controller.tournament_controller.get_all_tournaments()
 
         sorted_tournaments = sorted(tournaments, key=lambda t: t.name)
 
-        template = template = self.main_controller.templates["all_tournaments"]
-
         tournament_view = self.main_controller.tournament_controller.view
 
         self.view.display_sorted_tournaments(TournamentsManager(sorted_tournaments).data, tournament_view)
 
-        html = template.render(tournaments=sorted_tournaments)
-
-        return html
+        return self.tournaments_report(sorted_tournaments)
 
-    def generate_report_current_tournament_players(self, tournament: Tournament) -> str:
+    def generate_report_current_tournament_players(self, tournament: Tournament) -> ReportBuild:
         """
         Method that generates the report with the current tournament players sorted.
         Args:
             tournament (Tournament): Tournament object.
 
         Returns:
-            HTML content of the report.
+            The build of the report, its HTML content rendered chunk by chunk as it is consumed.
         """
-        template = self.main_controller.templates["current_tournament_players"]
-
         self.view.display_selected_tournament_title(tournament.name)
 
         sorted_players = sorted(tournament.players, key=lambda p: p.name)
 
         self.view.display_sorted_players(len(sorted_players), PlayersManager(sorted_players))
 
-        tournament.players = sorted_players
+        return self.tournament_players_report(tournament)
 
-        html = template.render(tournament=tournament)
-
-        return html
-
-    def generate_report_current_tournament_all_rounds_and_matches(self, tournament: Tournament) -> str:
+    def generate_report_current_tournament_all_rounds_and_matches(self, tournament: Tournament) -> ReportBuild:
         """
         Method that generates the report with all rounds and matches of the given tournament.
         Args:
             tournament (Tournament): Tournament object.
 
         Returns:
-            HTML content of the report.
+            The build of the report, its HTML content rendered chunk by chunk as it is consumed.
         """
-        template = self.main_controller.templates["tournament_rounds_and_matches"]
-
         self.view.display_selected_tournament_title(tournament.name)
 
         for rnd in tournament.rounds:
             self.view.display_rnd(rnd, self.main_controller.tournament_controller.view)
 
-        html = template.render(tournament=tournament)
+        return self.tournament_rounds_report(tournament)
+
+    def players_report(self, sorted_players: list[Player]) -> ReportBuild:
+        """
+        Method that prepares the report of the club players.
+        Args:
+            sorted_players (list[Player]): The players, in the order of the report.
+
+        Returns:
+            The build of the report, its HTML content rendered chunk by chunk as it is consumed.
+        """
+        digests = {"template": self.main_controller.templates.source_digest("players"),
+                   "inputs": content_digest([(p.identifier, p.convert_to_dict()) for p in sorted_players])}
+
+        return ReportBuild(digests, self.render("players", players=sorted_players))
+
+    def tournaments_report(self, sorted_tournaments: list[Tournament]) -> ReportBuild:
+        """
+        Method that prepares the report of the tournaments. The row of each tournament is kept as a fragment,
+        only rendered again when the tournament changed.
+        Args:
+            sorted_tournaments (list[Tournament]): The tournaments, in the order of the report.
+
+        Returns:
+            The build of the report, its HTML content rendered chunk by chunk as it is consumed.
+        """
+        templates = self.main_controller.templates
+        row_template_digest = templates.source_digest("tournament_row")
+        rows = {t.name: [t.name, t.place, t.start_date, t.end_date, t.rounds_number, t.current_round,
+                         t.description] for t in sorted_tournaments}
+        build = ReportBuild({"template": content_digest(templates.source_digest("all_tournaments"),
+                                                        row_template_digest),
+                             "inputs": content_digest(list(rows.values()))})
+
+        def tournament_row(tournament: Tournament) -> str:
+            return self.build_cache.fragment(build, tournament.name,
+                                             content_digest(row_template_digest, rows[tournament.name]),
+                                             lambda: templates["tournament_row"].render(t=tournament))
+
+        build.content = self.render("all_tournaments", tournaments=sorted_tournaments, tournament_row=tournament_row)
+        return build
+
+    def tournament_players_report(self, tournament: Tournament) -> ReportBuild:
+        """
+        Method that prepares the report of the players of a tournament, alphabetically sorted.
+        Args:
+            tournament (Tournament): Tournament object.
+
+        Returns:
+            The build of the report, its HTML content rendered chunk by chunk as it is consumed.
+        """
+        sorted_players = sorted(tournament.players, key=lambda p: p.name)
+        digests = {"template": self.main_controller.templates.source_digest("current_tournament_players"),
+                   "inputs": content_digest(tournament.name,
+                                            [(p.identifier, p.convert_to_dict()) for p in sorted_players])}
+
+        return ReportBuild(digests, self.render("current_tournament_players", tournament=tournament,
+                                                players=sorted_players))
+
+    def tournament_rounds_report(self, tournament: Tournament) -> ReportBuild:
+        """
+        Method that prepares the report of all rounds and matches of a tournament.
+        Args:
+            tournament (Tournament): Tournament object.
+
+        Returns:
+            The build of the report, its HTML content rendered chunk by chunk as it is consumed.
+        """
+        digests = {"template": self.main_controller.templates.source_digest("tournament_rounds_and_matches"),
+                   "inputs": content_digest(tournament.name, [rnd.convert_to_dict() for rnd in tournament.rounds],
+                                            [(p.identifier, p.convert_to_dict()) for p in tournament.players])}
 
-        return html
+        return ReportBuild(digests, self.render("tournament_rounds_and_matches", tournament=tournament))
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+# Standard library imports
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable
+
+from .migrations import MigrationReport, migrate_tournaments
+from .models import SCHEMA_VERSION as TOURNAMENT_SCHEMA_VERSION
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    identifier TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    birth_date TEXT
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    place TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    description TEXT,
+    current_round INTEGER,
+    rounds_number INTEGER
+);
+CREATE INDEX IF NOT EXISTS tournaments_start_date ON tournaments (start_date);
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    identifier TEXT NOT NULL,
+    -- only filled in by the version 1 databases, the players are club players since version 2
+    name TEXT,
+    first_name TEXT,
+    birth_date TEXT,
+    PRIMARY KEY (tournament_id, identifier)
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    round_name TEXT NOT NULL,
+    start_date TEXT,
+    start_time TEXT,
+    end_date TEXT,
+    end_time TEXT,
+    UNIQUE (tournament_id, position)
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    round_id INTEGER NOT NULL REFERENCES rounds (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    player1 TEXT NOT NULL,
+    score1 REAL,
+    color1 TEXT,
+    player2 TEXT NOT NULL,
+    score2 REAL,
+    color2 TEXT,
+    UNIQUE (round_id, position)
+);
+CREATE INDEX IF NOT EXISTS matches_player1 ON matches (player1);
+CREATE INDEX IF NOT EXISTS matches_player2 ON matches (player2);
+"""
+
+SCHEMA_VERSION = 2
+
+
+class SqliteStorage:
+    """
+    Storage of the players and of the tournaments in a sqlite database.
+
+    It reads and writes the same dictionaries as the json files, so it plugs in behind the
+    load_*_from_json / save_*_to_json methods. The json files found next to a new database are imported.
+    """
+    def __init__(self, file_path: Path | str, legacy_tournaments: Path | None = None,
+                 legacy_players: Path | None = None, import_report_path: Path | None = None):
+        self.file_path = file_path
+        # Problems met while importing the json files, the data of the tournaments left out is kept in it
+        self.import_report = MigrationReport()
+        # Path to the saved import report, None unless tournaments were left out and the report could be saved
+        self.import_report_path: Path | None = None
+        if file_path != ":memory:":
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(file_path, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            self.import_json(legacy_tournaments, legacy_players, import_report_path)
+        elif version < SCHEMA_VERSION:
+            self.migrate()
+
+    def import_json(self, tournaments_path: Path | None, players_path: Path | None,
+                    report_path: Path | None = None) -> None:
+        """
+        Method that imports the json files into the new database. The tournaments go through the migration
+        pipeline: the older ones are upgraded, the ones which cannot be used are recorded in the import report
+        and left out, their data staying in the json file.
+        Args:
+            tournaments_path (Path | None): Path to the tournaments json file.
+            players_path (Path | None): Path to the players json file.
+            report_path (Path | None): Path to the json file the import report is saved to when tournaments are
+                left out.
+        """
+        data = []
+        for path in (players_path, tournaments_path):
+            if path is not None and Path(path).exists():
+                with open(path, encoding="utf-8") as json_file:
+                    data.append(json.load(json_file))
+            else:
+                data.append({})
+        players, tournaments = data
+
+        tournaments = dict(migrate_tournaments(tournaments.items(), self.import_report, players))
+        # the players stored in full by the older tournaments were added to the club players by the migration
+        self.write_players(players)
+        self.write(tournaments)
+
+        with self.lock, self.connection:
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        if report_path is not None and self.import_report.has_errors():
+            try:
+                Path(report_path).parent.mkdir(parents=True, exist_ok=True)
+                self.import_report.write(report_path)
+                self.import_report_path = Path(report_path)
+            except OSError:
+                pass
+
+    def migrate(self) -> None:
+        """
+        Method that upgrades a version 1 database, whose tournaments kept a copy of their players, to the club
+        players shared by all the tournaments.
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT INTO players (identifier, name, first_name, birth_date) "
+                "SELECT identifier, name, first_name, birth_date FROM tournament_players WHERE name IS NOT NULL "
+                "ORDER BY tournament_id, position ON CONFLICT (identifier) DO NOTHING")
+            self.connection.execute("UPDATE tournament_players SET name = NULL, first_name = NULL, birth_date = NULL")
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def paths(self) -> list[Path]:
+        """
+        Method that gets the files to watch for changes.
+        Returns:
+            The paths to the files.
+        """
+        return [] if self.file_path == ":memory:" else [Path(self.file_path)]
+
+    def close(self) -> None:
+        """
+        Method that closes the database.
+        """
+        self.connection.close()
+
+    # --- Players ---
+
+    def read_players(self) -> dict[str, dict]:
+        """
+        Method that reads the club players.
+        Returns:
+            The players' data by identifier.
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT identifier, name, first_name, birth_date FROM players "
+                                           "ORDER BY rowid").fetchall()
+        return {identifier: {"name": name, "first_name": first_name, "birth_date": birth_date}
+                for identifier, name, first_name, birth_date in rows}
+
+    def write_players(self, players: dict[str, dict]) -> None:
+        """
+        Method that inserts or updates the given players in a single transaction.
+        Args:
+            players (dict[str, dict]): The players' data by identifier.
+        """
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT INTO players (identifier, name, first_name, birth_date) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (identifier) DO UPDATE SET name = excluded.name, first_name = excluded.first_name, "
+                "birth_date = excluded.birth_date",
+                [(identifier, attrs["name"], attrs["first_name"], attrs["birth_date"])
+                 for identifier, attrs in players.items()])
+
+    def find_player(self, identifier: str) -> dict | None:
+        """
+        Method that finds a club player by identifier, through the primary key index.
+        Args:
+            identifier (str): The player identifier.
+
+        Returns:
+            The player's data. Or None if not found.
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT name, first_name, birth_date FROM players WHERE identifier = ?",
+                                          (identifier,)).fetchone()
+        if row is None:
+            return None
+        return {"name": row[0], "first_name": row[1], "birth_date": row[2]}
+
+    # --- Tournaments ---
+
+    def read_summaries(self) -> dict[str, dict]:
+        """
+        Method that reads the tournaments headers, without their players and rounds.
+        Returns:
+            The tournaments headers by name.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT name, place, start_date, end_date, description, current_round, rounds_number, "
+                "current_round = 4 AND EXISTS (SELECT 1 FROM rounds r WHERE r.tournament_id = tournaments.id "
+                "AND r.position = 3 AND COALESCE(r.end_date, '') != '') "
+                "FROM tournaments ORDER BY id").fetchall()
+        return {name: {"place": place,
+                       "start_date": start_date,
+                       "end_date": end_date,
+                       "description": description,
+                       "current_round": current_round,
+                       "rounds_number": rounds_number,
+                       "completed": bool(completed)}
+                for name, place, start_date, end_date, description, current_round, rounds_number, completed in rows}
+
+    def read(self, names: Iterable[str] | None = None) -> dict[str, dict]:
+        """
+        Method that reads the given tournaments.
+        Args:
+            names (Iterable[str] | None): The tournament names. All the tournaments if None.
+
+        Returns:
+            The tournaments' data by name.
+        """
+        columns = "id, name, place, start_date, end_date, description, current_round, rounds_number"
+        with self.lock:
+            if names is None:
+                rows = self.connection.execute(f"SELECT {columns} FROM tournaments ORDER BY id").fetchall()
+            else:
+                rows = []
+                for name in names:
+                    rows.extend(self.connection.execute(f"SELECT {columns} FROM tournaments WHERE name = ?",
+                                                        (name,)).fetchall())
+
+            tournaments = {}
+            for tournament_id, name, place, start_date, end_date, description, current_round, rounds_number in rows:
+                # the tables hold the players identifiers only, as the current schema version does
+                tournaments[name] = {"schema_version": TOURNAMENT_SCHEMA_VERSION,
+                                     "place": place,
+                                     "start_date": start_date,
+                                     "end_date": end_date,
+                                     "description": description,
+                                     "current_round": current_round,
+                                     "rounds_number": rounds_number,
+                                     "players": self.read_tournament_players(tournament_id),
+                                     "rounds": self.read_rounds(tournament_id)}
+        return tournaments
+
+    def read_tournament_players(self, tournament_id: int) -> list[str]:
+        """
+        Method that reads the players of a tournament.
+        Args:
+            tournament_id (int): The tournament id.
+
+        Returns:
+            The players identifiers.
+        """
+        rows = self.connection.execute("SELECT identifier FROM tournament_players WHERE tournament_id = ? "
+                                       "ORDER BY position", (tournament_id,))
+        return [identifier for identifier, in rows]
+
+    def read_rounds(self, tournament_id: int) -> dict[str, dict]:
+        """
+        Method that reads the rounds of a tournament with their matches.
+        Args:
+            tournament_id (int): The tournament id.
+
+        Returns:
+            The rounds' data by round name.
+        """
+        rounds: dict[int, dict] = {}
+        names: dict[int, str] = {}
+        for round_id, round_name, start_date, start_time, end_date, end_time in self.connection.execute(
+                "SELECT id, round_name, start_date, start_time, end_date, end_time FROM rounds "
+                "WHERE tournament_id = ? ORDER BY position", (tournament_id,)):
+            names[round_id] = round_name
+            rounds[round_id] = {"round_name": round_name,
+                                "start_date": start_date,
+                                "start_time": start_time,
+                                "end_date": end_date,
+                                "end_time": end_time,
+                                "matches": {}}
+
+        for round_id, position, player1, score1, color1, player2, score2, color2 in self.connection.execute(
+                "SELECT m.round_id, m.position, m.player1, m.score1, m.color1, m.player2, m.score2, m.color2 "
+                "FROM matches m JOIN rounds r ON r.id = m.round_id WHERE r.tournament_id = ? "
+                "ORDER BY r.position, m.position", (tournament_id,)):
+            rounds[round_id]["matches"][f"match_{position + 1}"] = {
+                "player1": {"identifier": player1, "score": score1, "color": color1},
+                "player2": {"identifier": player2, "score": score2, "color": color2},
+            }
+        return {names[round_id]: attrs for round_id, attrs in rounds.items()}
+
+    def write(self, tournaments: dict[str, dict]) -> None:
+        """
+        Method that inserts or updates the given tournaments, each one in its own transaction.
+        Args:
+            tournaments (dict[str, dict]): The tournaments' data by name.
+        """
+        for name, attrs in tournaments.items():
+            with self.lock, self.connection:
+                self.write_tournament(name, attrs)
+
+    def write_tournament(self, name: str, attrs: dict) -> None:
+        """
+        Method that inserts or updates a tournament with its players, rounds and matches.
+        Args:
+            name (str): The tournament name.
+            attrs (dict): The tournament's data.
+        """
+        execute = self.connection.execute
+        execute("INSERT INTO tournaments (name, place, start_date, end_date, description, current_round, "
+                "rounds_number) VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (name) DO UPDATE SET "
+                "place = excluded.place, start_date = excluded.start_date, end_date = excluded.end_date, "
+                "description = excluded.description, current_round = excluded.current_round, "
+                "rounds_number = excluded.rounds_number",
+                (name, attrs["place"], attrs["start_date"], attrs["end_date"], attrs.get("description", ""),
+                 attrs.get("current_round", 1), attrs["rounds_number"]))
+        tournament_id = execute("SELECT id FROM tournaments WHERE name = ?", (name,)).fetchone()[0]
+
+        players = attrs.get("players", [])
+        if isinstance(players, dict):
+            # older files store each player in full, the missing ones become club players
+            self.connection.executemany(
+                "INSERT INTO players (identifier, name, first_name, birth_date) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (identifier) DO NOTHING",
+                [(identifier, player["name"], player["first_name"], player["birth_date"])
+                 for identifier, player in players.items()])
+
+        execute("DELETE FROM tournament_players WHERE tournament_id = ?", (tournament_id,))
+        self.connection.executemany(
+            "INSERT INTO tournament_players (tournament_id, position, identifier) VALUES (?, ?, ?)",
+            [(tournament_id, position, identifier) for position, identifier in enumerate(players)])
+
+        rounds = list(attrs.get("rounds", {}).values())
+        for position, rnd in enumerate(rounds):
+            execute("INSERT INTO rounds (tournament_id, position, round_name, start_date, start_time, end_date, "
+                    "end_time) VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (tournament_id, position) DO UPDATE SET "
+                    "round_name = excluded.round_name, start_date = excluded.start_date, "
+                    "start_time = excluded.start_time, end_date = excluded.end_date, end_time = excluded.end_time",
+                    (tournament_id, position, rnd["round_name"], rnd.get("start_date"), rnd.get("start_time"),
+                     rnd.get("end_date"), rnd.get("end_time")))
+            round_id = execute("SELECT id FROM rounds WHERE tournament_id = ? AND position = ?",
+                               (tournament_id, position)).fetchone()[0]
+
+            matches = list(rnd.get("matches", {}).values())
+            self.connection.executemany(
+                "INSERT INTO matches (round_id, position, player1, score1, color1, player2, score2, color2) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (round_id, position) DO UPDATE SET "
+                "player1 = excluded.player1, score1 = excluded.score1, color1 = excluded.color1, "
+                "player2 = excluded.player2, score2 = excluded.score2, color2 = excluded.color2",
+                [(round_id, match_position,
+                  match["player1"]["identifier"], match["player1"]["score"], match["player1"]["color"],
+                  match["player2"]["identifier"], match["player2"]["score"], match["player2"]["color"])
+                 for match_position, match in enumerate(matches)])
+            execute("DELETE FROM matches WHERE round_id = ? AND position >= ?", (round_id, len(matches)))
+
+        execute("DELETE FROM rounds WHERE tournament_id = ? AND position >= ?", (tournament_id, len(rounds)))
+
+    def standings(self, tournament_name: str) -> list[tuple[str, float]]:
+        """
+        Method that computes the standings of a tournament with an aggregate query over the matches.
+        Args:
+            tournament_name (str): The tournament name.
+
+        Returns:
+            The players' identifiers with their scores, best score first.
+        """
+        with self.lock:
+            return self.connection.execute(
+                "SELECT identifier, SUM(score) FROM ("
+                "  SELECT m.player1 AS identifier, COALESCE(m.score1, 0) AS score FROM matches m"
+                "  JOIN rounds r ON r.id = m.round_id JOIN tournaments t ON t.id = r.tournament_id"
+                "  WHERE t.name = ?"
+                "  UNION ALL"
+                "  SELECT m.player2, COALESCE(m.score2, 0) FROM matches m"
+                "  JOIN rounds r ON r.id = m.round_id JOIN tournaments t ON t.id = r.tournament_id"
+                "  WHERE t.name = ?"
+                ") GROUP BY identifier ORDER BY SUM(score) DESC, identifier",
+                (tournament_name, tournament_name)).fetchall()
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+# Standard library imports
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from .models import SCHEMA_VERSION
+from .storage import iter_json_object, write_json_atomically, write_json_object_atomically
+
+# Fields without which a tournament cannot be built
+REQUIRED_FIELDS = ("place", "start_date", "end_date", "rounds_number")
+MATCH_SIDE_FIELDS = ("identifier", "score", "color")
+
+
+class MigrationReport:
+    """
+    Structured report of the tournaments read through the migration pipeline.
+
+    Every problem is recorded with the tournament and the path of the faulty value in its data. The tournaments
+    which cannot be used are left out by the pipeline, their data is kept in the report so that nothing is lost.
+    """
+    def __init__(self):
+        self.tournaments = 0
+        self.migrated = 0
+        self.players_added = 0
+        self.issues: list[dict[str, str]] = []
+        self.rejected: dict[str, Any] = {}
+
+    def add_issue(self, severity: str, tournament: str, path: str, message: str) -> None:
+        """
+        Method that records a problem.
+        Args:
+            severity (str): "error" if the tournament is left out, "warning" if it is kept.
+            tournament (str): The tournament name.
+            path (str): Path of the faulty value in the tournament's data, "/" separated.
+            message (str): Description of the problem.
+        """
+        self.issues.append({"severity": severity, "tournament": tournament, "path": path, "message": message})
+
+    def reject(self, tournament: str, data: Any) -> None:
+        """
+        Method that keeps the data of a tournament left out because of its errors.
+        Args:
+            tournament (str): The tournament name.
+            data (Any): The tournament's data, as read.
+        """
+        self.rejected[tournament] = data
+
+    def has_errors(self) -> bool:
+        """
+        Method that checks if a tournament was left out.
+        Returns:
+            True if there are errors. False otherwise.
+        """
+        return any(issue["severity"] == "error" for issue in self.issues)
+
+    def convert_to_dict(self) -> dict[str, Any]:
+        """
+        Method that converts the report to a dictionary.
+        Returns:
+            The report's data.
+        """
+        return {"schema_version": SCHEMA_VERSION,
+                "tournaments": self.tournaments,
+                "migrated": self.migrated,
+                "rejected": len(self.rejected),
+                "players_added": self.players_added,
+                "issues": self.issues,
+                "rejected_tournaments": self.rejected}
+
+    def write(self, file_path: Path) -> None:
+        """
+        Method that saves the report to a json file.
+        Args:
+            file_path (Path): Path to the json file.
+        """
+        write_json_atomically(file_path, self.convert_to_dict())
+
+
+def schema_version(attrs: dict) -> Any:
+    """
+    Function that gets the schema version of a tournament's data.
+    Args:
+        attrs (dict): The tournament's data.
+
+    Returns:
+        The schema version. The data written before the version field are told apart by their players, which
+        were stored in full up to version 1.
+    """
+    version = attrs.get("schema_version")
+    if version is None:
+        return 1 if isinstance(attrs.get("players"), dict) else 2
+    return version
+
+
+def upgrade_from_version_1(attrs: dict, players: dict[str, dict]) -> dict:
+    """
+    Function that upgrades a tournament storing each of its players in full. Only their identifiers are kept,
+    their details go to the club players.
+    Args:
+        attrs (dict): The tournament's data, in version 1.
+        players (dict[str, dict]): The club players' data by identifier, the missing players are added to it.
+
+    Returns:
+        The tournament's data, in version 2.
+    """
+    for identifier, player in attrs.get("players", {}).items():
+        players.setdefault(identifier, player)
+    upgraded = dict(attrs)
+    upgraded["players"] = list(attrs.get("players", {}))
+    return upgraded
+
+
+# Upgrade of each schema version to the next one
+MIGRATIONS: dict[int, Callable[[dict, dict[str, dict]], dict]] = {
+    1: upgrade_from_version_1,
+}
+
+
+def check_tournament(name: str, attrs: dict, report: MigrationReport) -> bool:
+    """
+    Function that checks that a tournament's data, in the current version, can be built.
+    Args:
+        name (str): The tournament name.
+        attrs (dict): The tournament's data.
+        report (MigrationReport): The report the problems are recorded in.
+
+    Returns:
+        True if the tournament can be built. False otherwise.
+    """
+    valid = True
+    for field in REQUIRED_FIELDS:
+        if field not in attrs:
+            report.add_issue("error", name, field, "Missing field")
+            valid = False
+
+    players = attrs.get("players", [])
+    if not isinstance(players, list):
+        report.add_issue("error", name, "players", "The players are not a list of identifiers")
+        return False
+    identifiers = set(players)
+
+    rounds = attrs.get("rounds", {})
+    if not isinstance(rounds, dict) or not all(isinstance(rnd, dict) for rnd in rounds.values()):
+        report.add_issue("error", name, "rounds", "The rounds are not objects by round name")
+        return False
+    for round_name, rnd in rounds.items():
+        matches = rnd.get("matches", {})
+        if not isinstance(matches, dict) or not all(isinstance(match, dict) for match in matches.values()):
+            report.add_issue("error", name, f"rounds/{round_name}/matches", "The matches are not objects by name")
+            valid = False
+            continue
+        for match_name, match in matches.items():
+            for side in ("player1", "player2"):
+                path = f"rounds/{round_name}/matches/{match_name}/{side}"
+                side_attrs = match.get(side)
+                if not isinstance(side_attrs, dict) or any(field not in side_attrs for field in MATCH_SIDE_FIELDS):
+                    report.add_issue("error", name, path, "Incomplete match side")
+                    valid = False
+                elif side_attrs["identifier"] not in identifiers:
+                    report.add_issue("error", name, path,
+                                     f"Unknown player {side_attrs['identifier']}, not a player of the tournament")
+                    valid = False
+    return valid
+
+
+def migrate_tournament(name: str, attrs: Any, report: MigrationReport,
+                       players: dict[str, dict] | None = None) -> dict | None:
+    """
+    Function that upgrades a tournament's data to the current schema version and checks it.
+    Args:
+        name (str): The tournament name.
+        attrs (Any): The tournament's data, as read.
+        report (MigrationReport): The report the problems are recorded in.
+        players (dict[str, dict] | None): The club players' data by identifier, the players stored in full by
+            the older versions are added to it.
+
+    Returns:
+        The tournament's data in the current version, the given one if it already was. Or None if the
+        tournament cannot be used, its data being kept in the report.
+    """
+    report.tournaments += 1
+    if not isinstance(attrs, dict):
+        report.add_issue("error", name, "", "The tournament's data is not an object")
+        report.reject(name, attrs)
+        return None
+
+    version = schema_version(attrs)
+    if not isinstance(version, int) or not 1 <= version <= SCHEMA_VERSION:
+        report.add_issue("error", name, "schema_version", f"Unsupported schema version {version}")
+        report.reject(name, attrs)
+        return None
+
+    migrated = attrs
+    if version < SCHEMA_VERSION:
+        known = {} if players is None else players
+        players_number = len(known)
+        for from_version in range(version, SCHEMA_VERSION):
+            migrated = MIGRATIONS[from_version](migrated, known)
+        report.migrated += 1
+        report.add_issue("warning", name, "schema_version", f"Upgraded from schema version {version}")
+        if players is not None:
+            report.players_added += len(known) - players_number
+
+    if not check_tournament(name, migrated, report):
+        report.reject(name, attrs)
+        return None
+
+    if migrated.get("schema_version") != SCHEMA_VERSION:
+        migrated = {"schema_version": SCHEMA_VERSION,
+                    **{key: value for key, value in migrated.items() if key != "schema_version"}}
+    return migrated
+
+
+def migrate_tournaments(tournaments: Iterable[tuple[str, Any]], report: MigrationReport,
+                        players: dict[str, dict] | None = None) -> Iterator[tuple[str, dict]]:
+    """
+    Function that upgrades tournaments one at a time, as they are read.
+    Args:
+        tournaments (Iterable[tuple[str, Any]]): The tournaments' names and data.
+        report (MigrationReport): The report the problems are recorded in.
+        players (dict[str, dict] | None): See migrate_tournament.
+
+    Returns:
+        An iterator over the names and the upgraded data of the tournaments which can be used.
+    """
+    for name, attrs in tournaments:
+        migrated = migrate_tournament(name, attrs, report, players)
+        if migrated is not None:
+            yield name, migrated
+
+
+def migrate_tournaments_file(source: Path, destination: Path, players_path: Path | None = None,
+                             report_path: Path | None = None) -> MigrationReport:
+    """
+    Function that upgrades a tournaments json file to the current schema version. The tournaments are read,
+    upgraded and written one at a time, so that files of any size can be migrated. The source file can be the
+    destination, it is only replaced once the migration is complete. The tournaments which cannot be used are
+    copied unchanged, so that nothing is lost even without a saved report.
+    Args:
+        source (Path): Path to the json file to be upgraded.
+        destination (Path): Path to the upgraded json file.
+        players_path (Path | None): Path to the club players json file, the players stored in full in the
+            tournaments are added to it.
+        report_path (Path | None): Path to the json file the report is saved to.
+
+    Returns:
+        The migration report.
+    """
+    players: dict[str, dict] = {}
+    if players_path is not None and players_path.exists():
+        with open(players_path, encoding="utf-8") as json_file:
+            players = json.load(json_file)
+
+    report = MigrationReport()
+
+    def members() -> Iterator[tuple[str, Any]]:
+        for name, attrs, _ in iter_json_object(source):
+            migrated = migrate_tournament(name, attrs, report, players)
+            yield name, attrs if migrated is None else migrated
+
+    write_json_object_atomically(destination, members())
+
+    if players_path is not None and report.players_added:
+        write_json_atomically(players_path, players)
+    if report_path is not None:
+        report.write(report_path)
+    return report
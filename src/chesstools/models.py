@@ -2,48 +2,73 @@ from __future__ import annotations
 
 # Standard library imports
 import random
-import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
 
-import faker
-# Third-party imports
-from rich.console import Console
+from .pairing import PAIRING_ENGINES
 
-# Initialize Console
-console = Console(
-    file=sys.stdout,
-    force_terminal=True,
-    color_system="truecolor",  # active la palette complète
-    width=200
-)
-
-fake = faker.Faker()
 NUMBER_OF_ROUNDS = 4
 TOURNAMENT_FOLDER = Path("./data/tournaments/")
 TOURNAMENTS_DATA_JSON = TOURNAMENT_FOLDER / Path("./tournaments.json")
 PLAYERS_DATA_JSON = TOURNAMENT_FOLDER / Path("./players.json")
+PAIRING_ENGINE = "blossom"
+# Version of the layout of the tournaments' data, written with each tournament. See migrations.py for the
+# upgrade of the older layouts
+SCHEMA_VERSION = 2
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Function that builds the fake data generator and the console of the module the first time they are used.
+    Importing faker alone takes longer than drawing the first menu.
+    Args:
+        name (str): The attribute name.
+
+    Returns:
+        The fake data generator for "fake", the console shared with the views for "console".
+    """
+    if name == "fake":
+        import faker
+        value = faker.Faker()
+    elif name == "console":
+        from .views import console as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
 class Match:
+    # The two sides of the match are kept in fixed fields, match_tuple only rebuilds the tuples on demand
+    __slots__ = ("player_1", "score_1", "color_1", "player_2", "score_2", "color_2")
+
     def __init__(self, player_1: Player, player_2: Player, score_1: float = 0.0, score_2: float = 0.0):
-        match_1 = (player_1, score_1, "⚪")
-        match_2 = (player_2, score_2, "⚫")
         if random.choice([True, False]):
-            self.match_tuple: tuple[tuple[Player, float, str], tuple[Player, float, str]] = (
-                match_1,
-                match_2,
-            )
+            self.player_1, self.score_1, self.color_1 = player_1, score_1, "⚪"
+            self.player_2, self.score_2, self.color_2 = player_2, score_2, "⚫"
         else:
-            self.match_tuple = (match_2, match_1)
+            self.player_1, self.score_1, self.color_1 = player_2, score_2, "⚫"
+            self.player_2, self.score_2, self.color_2 = player_1, score_1, "⚪"
+
+    @property
+    def match_tuple(self) -> tuple[tuple[Player, float, str], tuple[Player, float, str]]:
+        """
+        The two sides of the match, as (player, score, color) tuples.
+        """
+        return (self.player_1, self.score_1, self.color_1), (self.player_2, self.score_2, self.color_2)
+
+    @match_tuple.setter
+    def match_tuple(self, value: tuple[tuple[Player, float, str], tuple[Player, float, str]]) -> None:
+        (self.player_1, self.score_1, self.color_1), (self.player_2, self.score_2, self.color_2) = value
 
     def __iter__(self):
         return iter(self.match_tuple)
 
     def __str__(self):
-        player_1, score_1, color_1 = self.match_tuple[0]
-        player_2, score_2, color_2 = self.match_tuple[1]
+        player_1, score_1, color_1 = self.player_1, self.score_1, self.color_1
+        player_2, score_2, color_2 = self.player_2, self.score_2, self.color_2
 
         score_1_display = score_1 if score_1 is not None else 0
         score_2_display = score_2 if score_2 is not None else 0
@@ -70,12 +95,16 @@ class Match:
             color_1 (str): The color 1.
             color_2 (str): The color 2.
         """
-        p1, s1, _ = self.match_tuple[0]
-        p2, s2, _ = self.match_tuple[1]
-        self.match_tuple = (
-            (p1, s1, color_1),
-            (p2, s2, color_2),
-        )
+        self.color_1 = color_1
+        self.color_2 = color_2
+
+    def swap_sides(self) -> None:
+        """
+        Method that swaps the two sides of the match, each player keeping their score and color.
+        """
+        self.player_1, self.player_2 = self.player_2, self.player_1
+        self.score_1, self.score_2 = self.score_2, self.score_1
+        self.color_1, self.color_2 = self.color_2, self.color_1
 
     def convert_to_dict(self) -> dict[str, dict[str, str | float]]:
         """
@@ -83,23 +112,24 @@ class Match:
         Returns:
 
         """
-        player_1, score_1, color_1 = self.match_tuple[0]
-        player_2, score_2, color_2 = self.match_tuple[1]
         return {
             "player1": {
-                "identifier": player_1.identifier,
-                "score": score_1,
-                "color": color_1,
+                "identifier": self.player_1.identifier,
+                "score": self.score_1,
+                "color": self.color_1,
             },
             "player2": {
-                "identifier": player_2.identifier,
-                "score": score_2,
-                "color": color_2,
+                "identifier": self.player_2.identifier,
+                "score": self.score_2,
+                "color": self.color_2,
             }
         }
 
 
 class Player:
+    # score is only set by the callers of the greedy pairing engine, which reads it when present
+    __slots__ = ("name", "first_name", "birth_date", "identifier", "score")
+
     def __init__(self, name: str, first_name: str, birth_date: str, identifier: str):
         self.name = name
         self.first_name = first_name
@@ -127,7 +157,11 @@ class Player:
 
 
 class Round:
+    __slots__ = ("round_name", "matches", "start_date", "start_time", "end_date", "end_time", "dirty")
+
     def __init__(self, round_name):
+        # True when the round changed since its tournament was last serialized
+        self.dirty = True
         self.round_name = round_name
         self.matches = []
         self.start_date = None
@@ -163,6 +197,11 @@ class Round:
     def __repr__(self):
         return str(self)
 
+    def __setattr__(self, name, value):
+        if name != "dirty":
+            object.__setattr__(self, "dirty", True)
+        object.__setattr__(self, name, value)
+
     def set_start_date(self) -> None:
         """
         Method that sets the start date of the round.
@@ -209,8 +248,23 @@ class Round:
 
 
 class Tournament:
+    __slots__ = ("name", "place", "rounds_number", "start_date", "end_date", "description", "current_round",
+                 "_rounds", "_players", "loader", "completed", "played_pairs", "opponents", "ledger", "colours",
+                 "indexed_rounds", "serialized")
+
+    # Attributes written by convert_to_dict, setting one of them drops the cached serialized form
+    SERIALIZED_ATTRIBUTES = frozenset(("name", "place", "rounds_number", "start_date", "end_date", "description",
+                                       "current_round", "rounds", "players", "_rounds", "_players"))
+
     def __init__(self, name: str, place: str, rounds_number: int, start_date=None, end_date=None,
                  description: str = "", current_round: int = 1):
+        # Last result of convert_to_dict, None when the tournament changed since then
+        self.serialized: dict | None = None
+        # Callable filling in the players and the rounds the first time they are accessed, None once loaded
+        self.loader: Callable[[Tournament], None] | None = None
+        # Completion state read from the tournaments index, used as long as the rounds are not loaded
+        self.completed: bool | None = None
+
         self.name = name
         self.place = place
         self.rounds_number = rounds_number
@@ -221,6 +275,15 @@ class Tournament:
         self.rounds = []
         self.players = []
 
+        # Pairs of identifiers which already played, and opponents of each player, in the indexed rounds
+        self.played_pairs: set[frozenset[str]] = set()
+        self.opponents: dict[str, set[str]] = {}
+        # Running total of each player's scores in the indexed rounds
+        self.ledger: dict[str, float] = {}
+        # Number of games played with white minus the number of games played with black
+        self.colours: dict[str, int] = {}
+        self.indexed_rounds = 0
+
     def __str__(self):
         rounds_str = ""
         if self.rounds:
@@ -241,12 +304,120 @@ class Tournament:
     def __repr__(self):
         return str(self)
 
+    def __setattr__(self, name, value):
+        if name in Tournament.SERIALIZED_ATTRIBUTES:
+            object.__setattr__(self, "serialized", None)
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        # the serialized form is rebuilt on the next save rather than pickled along with the tournament
+        return {name: getattr(self, name) for name in Tournament.__slots__
+                if name != "serialized" and hasattr(self, name)}
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "serialized", None)
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def rounds(self) -> list[Round]:
+        """
+        The rounds of the tournament, loaded on first access.
+        """
+        if self.loader is not None:
+            self.materialize()
+        return self._rounds
+
+    @rounds.setter
+    def rounds(self, rounds: list[Round]) -> None:
+        if self.loader is not None:
+            self.materialize()
+        self._rounds = rounds
+
+    @property
+    def players(self) -> list[Player]:
+        """
+        The players of the tournament, loaded on first access.
+        """
+        if self.loader is not None:
+            self.materialize()
+        return self._players
+
+    @players.setter
+    def players(self, players: list[Player]) -> None:
+        if self.loader is not None:
+            self.materialize()
+        self._players = players
+
+    def mark_dirty(self) -> None:
+        """
+        Method that drops the cached serialized form of the tournament, after one of its matches changed.
+        """
+        self.serialized = None
+
+    def is_dirty(self) -> bool:
+        """
+        Method that checks if the tournament changed since it was last serialized.
+        Returns:
+            True if convert_to_dict has to rebuild the tournament's data. False otherwise.
+        """
+        serialized = self.serialized
+        if serialized is None or self.loader is not None:
+            return True
+        if len(serialized["rounds"]) != len(self._rounds) or len(serialized["players"]) != len(self._players):
+            return True
+        return any(rnd.dirty for rnd in self._rounds)
+
+    def is_loaded(self) -> bool:
+        """
+        Method that checks if the players and the rounds of the tournament are loaded.
+        Returns:
+            True if they are loaded. False otherwise.
+        """
+        return self.loader is None
+
+    def materialize(self) -> None:
+        """
+        Method that loads the players and the rounds of a tournament read from the tournaments index.
+        """
+        loader, self.loader = self.loader, None
+        if loader is not None:
+            loader(self)
+
+    def load_from(self, tournament: Tournament) -> None:
+        """
+        Method that takes the state of a fully loaded copy of the tournament.
+        Args:
+            tournament (Tournament): Tournament object.
+        """
+        self.current_round = tournament.current_round
+        self.players = tournament.players
+        self.rounds = tournament.rounds
+        self.completed = None
+        self.reset_round_index()
+
+    @staticmethod
+    def completed_from_dict(attrs: dict) -> bool:
+        """
+        Method that checks if a tournament is completed from its data, without building its rounds.
+        Args:
+            attrs (dict): The tournament's data.
+
+        Returns:
+            True if the tournament is completed. False otherwise.
+        """
+        rounds = list(attrs.get("rounds", {}).values())
+        return attrs.get("current_round", 1) == 4 and len(rounds) > 3 and bool(rounds[3].get("end_date"))
+
     def is_completed(self) -> bool:
         """
         Methods that checks if the round is completed.
         Returns:
             True if the round is completed. False otherwise.
         """
+        if self.loader is not None and self.completed is not None:
+            return self.completed
+
         if self.current_round == 4:
             if self.rounds[3].end_date:
                 return True
@@ -261,6 +432,7 @@ class Tournament:
         """
         for player in players:
             self.players.append(player)
+        self.mark_dirty()
 
     def add_round(self, tournament_round: Round) -> None:
         """
@@ -269,6 +441,81 @@ class Tournament:
             tournament_round (Round): Round object.
         """
         self.rounds.append(tournament_round)
+        self.mark_dirty()
+        self.sync_round_index()
+
+    def replace_round(self, round_index: int, tournament_round: Round) -> None:
+        """
+        Method that replaces a round of the tournament.
+        Args:
+            round_index (int): Index of the round to be replaced.
+            tournament_round (Round): Round object.
+        """
+        self.rounds[round_index] = tournament_round
+        self.mark_dirty()
+        self.reset_round_index()
+
+    def index_round(self, tournament_round: Round) -> None:
+        """
+        Method that adds the pairs and the scores of a round to the pairs index and to the score ledger.
+        Args:
+            tournament_round (Round): Round object.
+        """
+        for match in tournament_round.matches:
+            identifier_1 = match.player_1.identifier
+            identifier_2 = match.player_2.identifier
+            self.played_pairs.add(frozenset((identifier_1, identifier_2)))
+            self.opponents.setdefault(identifier_1, set()).add(identifier_2)
+            self.opponents.setdefault(identifier_2, set()).add(identifier_1)
+            self.ledger[identifier_1] = self.ledger.get(identifier_1, 0.0) + float(match.score_1 or 0.0)
+            self.ledger[identifier_2] = self.ledger.get(identifier_2, 0.0) + float(match.score_2 or 0.0)
+            self.colours[identifier_1] = self.colours.get(identifier_1, 0) + (1 if match.color_1 == "⚪" else -1)
+            self.colours[identifier_2] = self.colours.get(identifier_2, 0) + (1 if match.color_2 == "⚪" else -1)
+
+    def reset_round_index(self) -> None:
+        """
+        Method that rebuilds the pairs index and the score ledger from all the rounds.
+        """
+        self.played_pairs = set()
+        self.opponents = {}
+        self.ledger = {}
+        self.colours = {}
+        self.indexed_rounds = 0
+        self.sync_round_index()
+
+    def update_ledger(self, old_scores: list[tuple[str, float]], match: Match) -> None:
+        """
+        Method that updates the score ledger after the scores of an indexed match changed.
+        Args:
+            old_scores (list[tuple[str, float]]): The players' identifiers with their previous scores.
+            match (Match): Match object, holding the new scores.
+        """
+        for identifier, score in old_scores:
+            self.ledger[identifier] = self.ledger.get(identifier, 0.0) - float(score or 0.0)
+        for player, score in ((match.player_1, match.score_1), (match.player_2, match.score_2)):
+            self.ledger[player.identifier] = self.ledger.get(player.identifier, 0.0) + float(score or 0.0)
+
+    @property
+    def scores(self) -> Mapping[str, float]:
+        """
+        Read-only view of the score ledger.
+        Returns:
+            The total score by player's id.
+        """
+        self.sync_round_index()
+        return MappingProxyType(self.ledger)
+
+    def sync_round_index(self) -> None:
+        """
+        Method that indexes the rounds appended since the last call. A round is indexed once, so its matches
+        must be created before it is appended.
+        """
+        if len(self.rounds) < self.indexed_rounds:
+            self.reset_round_index()
+            return
+        for tournament_round in self.rounds[self.indexed_rounds:]:
+            self.index_round(tournament_round)
+        self.indexed_rounds = len(self.rounds)
 
     @staticmethod
     def compute_player_scores(tournament) -> tuple[dict[str, float], dict[str, Player]]:
@@ -283,18 +530,7 @@ class Tournament:
         id_to_player = {player.identifier: player for player in tournament.players}
         # init scores to 0.0
         scores = {player_id: 0.0 for player_id in id_to_player.keys()}
-
-        for rnd in getattr(tournament, "rounds", []):
-            for match in getattr(rnd, "matches", []) or []:
-
-                player_1_obj, score_1, _ = match.match_tuple[0]
-                player_2_obj, score_2, _ = match.match_tuple[1]
-
-                score_1_val = float(score_1) if score_1 is not None else 0.0
-                score_2_val = float(score_2) if score_2 is not None else 0.0
-
-                scores[player_1_obj.identifier] = scores.get(player_1_obj.identifier, 0.0) + score_1_val
-                scores[player_2_obj.identifier] = scores.get(player_2_obj.identifier, 0.0) + score_2_val
+        scores.update(tournament.scores)
 
         return scores, id_to_player
 
@@ -304,70 +540,42 @@ class Tournament:
         Returns:
             A sorted list of players.
         """
-        scores = {}
-        for rnd in (self.rounds or []):
-            for match in rnd.matches:
-                for player, raw_score, _ in match.match_tuple:
-                    pid = player.identifier
-                    scores[pid] = scores.get(pid, 0.0) + float(raw_score)
+        scores = self.scores
 
         ordered = sorted(self.players, key=lambda p: scores.get(p.identifier, 0.0), reverse=True)
 
-        self.players[:] = ordered
+        if ordered != self.players:
+            self.players[:] = ordered
+            self.mark_dirty()
 
         return ordered
 
-    def create_round(self, round_number: int, players: list) -> None:
+    def create_round(self, round_number: int, players: list, engine: str | None = None) -> None:
         """
         Method that creates a round object.
         Args:
             round_number (int): The round number.
             players (list): A list of Player objects.
+            engine (str | None): Name of the pairing engine. PAIRING_ENGINE if None.
         """
         round_obj = Round(f"Round {round_number}")
 
-        self.create_matches(players, round_obj)
+        self.create_matches(players, round_obj, engine)
         round_obj.set_start_date()
 
-        self.rounds.append(round_obj)
+        self.add_round(round_obj)
 
-    def create_matches(self, players: list, round_obj: Round) -> None:
+    def create_matches(self, players: list, round_obj: Round, engine: str | None = None) -> None:
         """
         Creates matches for a given round, ensuring players haven't played each other before.
 
         Args:
             players (Players): The players participating in the tournament.
             round_obj (Round): The round object to populate with matches.
+            engine (str | None): Name of the pairing engine. PAIRING_ENGINE if None.
         """
-        players_list = players.copy()
-        round_obj.matches = []
-
-        while len(players_list) >= 2:
-            first = players_list.pop(0)
-
-            # seek a second player who has not played with the first one near the first one score
-            found_opponent = False
-            best_candidate_index = None
-            best_score_diff = float(1000)
-
-            for i, candidate in enumerate(players_list):
-                if not self.match_already_played(first, candidate):
-                    # Seek a candidate with the nearest score
-                    diff = abs(getattr(first, "score", 0.0) - getattr(candidate, "score", 0.0))
-                    if diff < best_score_diff:
-                        best_score_diff = diff
-                        best_candidate_index = i
-
-            # found
-            if best_candidate_index is not None:
-                second = players_list.pop(best_candidate_index)
-                round_obj.matches.append(Match(first, second))
-                found_opponent = True
-
-            # If no suitable candidate found, pair with the first available
-            if not found_opponent and players_list:
-                second = players_list.pop(0)
-                round_obj.matches.append(Match(first, second))
+        pairs = PAIRING_ENGINES[engine or PAIRING_ENGINE].pair(self, list(players))
+        round_obj.matches = [Match(white, black) for white, black in pairs]
 
     def match_already_played(self, player_1: Player, player_2: Player) -> bool:
         """
@@ -379,30 +587,31 @@ class Tournament:
         Returns:
             A boolean indicating if the player 1 has already played with player 2.
         """
-        pair_to_check = frozenset([player_1.identifier, player_2.identifier])
-
-        for rnd in self.rounds:
-            for match in rnd.matches:
-                match_player_1 = match.match_tuple[0][0].identifier
-                match_player_2 = match.match_tuple[1][0].identifier
-                existing_pair = frozenset([match_player_1, match_player_2])
-
-                if pair_to_check == existing_pair:
-                    return True
-        return False
+        self.sync_round_index()
+        return player_2.identifier in self.opponents.get(player_1.identifier, ())
 
     def convert_to_dict(self) -> dict[str, str | datetime | dict[str, dict] | dict[Any, Any]]:
         """
-        Method that converts the player's data to a dictionary.
-        Returns: The dictionary of the player's data.
+        Method that converts the tournament's data to a dictionary. The result is cached until the tournament
+        changes, and must not be modified by the caller.
+        Returns: The dictionary of the tournament's data.
         """
-        return {
+        if not self.is_dirty():
+            return self.serialized
+
+        serialized = {
+            "schema_version": SCHEMA_VERSION,
             "place": self.place,
             "start_date": self.start_date,
             "end_date": self.end_date,
             "description": self.description,
             "current_round": self.current_round,
             "rounds_number": self.rounds_number,
-            "players": {str(player.identifier): player.convert_to_dict() for player in self.players},
+            # the players are club players, only their identifiers are stored
+            "players": [str(player.identifier) for player in self.players],
             "rounds": {rnd.round_name: rnd.convert_to_dict() for rnd in self.rounds}
         }
+        for rnd in self._rounds:
+            rnd.dirty = False
+        self.serialized = serialized
+        return serialized
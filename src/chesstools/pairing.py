@@ -0,0 +1,639 @@
+from __future__ import annotations
+
+# Standard library imports
+from abc import ABC, abstractmethod
+from itertools import groupby
+from typing import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    from .models import Player, Tournament
+
+# Costs of a pairing, the rematches first, then the score gaps, then the colour imbalance
+REMATCH_COST = 1_000_000
+SCORE_GAP_COST = 100
+COLOUR_COST = 1
+# Number of following players, in the standings order, each player can be paired with. None links every pair
+# of players, which keeps the matching exact.
+PAIRING_WINDOW = None
+# Number of candidates a score group may try before floating one more player down
+BACKTRACKING_LIMIT = 1000
+
+
+def max_weight_matching(edges: list[tuple[int, int, int]], max_cardinality: bool = False) -> list[int]:
+    """
+    Function that computes a maximum-weight matching of a general graph with Edmonds' blossom algorithm,
+    in O(n³) with integer weights and integer arithmetic only.
+    Args:
+        edges (list[tuple[int, int, int]]): The edges as (vertex, vertex, weight), the vertices being numbered
+            from 0.
+        max_cardinality (bool): If True, only the maximum-cardinality matchings are considered.
+
+    Returns:
+        The mate of each vertex, -1 for the unmatched ones.
+    """
+    if not edges:
+        return []
+
+    edges_number = len(edges)
+    vertices_number = 1 + max(max(i, j) for i, j, _ in edges)
+    max_weight = max(0, max(weight for _, _, weight in edges))
+
+    # endpoint[p] is the vertex at the end p of the edge p // 2
+    endpoint = [edges[p // 2][p % 2] for p in range(2 * edges_number)]
+    # ends of the edges leaving each vertex, pointing to the remote vertex
+    neighbour_ends: list[list[int]] = [[] for _ in range(vertices_number)]
+    for k, (i, j, _) in enumerate(edges):
+        neighbour_ends[i].append(2 * k + 1)
+        neighbour_ends[j].append(2 * k)
+
+    # mate[v] is the remote end of the matched edge of v, -1 if single
+    mate = [-1] * vertices_number
+    # label of the top-level blossoms and of the vertices: 0 free, 1 S, 2 T
+    label = [0] * (2 * vertices_number)
+    label_end = [-1] * (2 * vertices_number)
+    in_blossom = list(range(vertices_number))
+    blossom_parent = [-1] * (2 * vertices_number)
+    blossom_children: list[list[int] | None] = [None] * (2 * vertices_number)
+    blossom_base = list(range(vertices_number)) + [-1] * vertices_number
+    blossom_ends: list[list[int] | None] = [None] * (2 * vertices_number)
+    best_edge = [-1] * (2 * vertices_number)
+    blossom_best_edges: list[list[int] | None] = [None] * (2 * vertices_number)
+    unused_blossoms = list(range(vertices_number, 2 * vertices_number))
+    # the slack of an edge k is dual[i] + dual[j] - double_weight[k]
+    double_weight = [2 * weight for _, _, weight in edges]
+    dual = [max_weight] * vertices_number + [0] * vertices_number
+    allowed_edge = [False] * edges_number
+    queue: list[int] = []
+
+    def slack(k: int) -> int:
+        return dual[endpoint[2 * k]] + dual[endpoint[2 * k + 1]] - double_weight[k]
+
+    def blossom_leaves(b: int) -> list[int]:
+        # walked with a stack rather than recursive generators, the blossoms can be deeply nested
+        leaves = []
+        stack = [b]
+        while stack:
+            t = stack.pop()
+            if t < vertices_number:
+                leaves.append(t)
+            else:
+                stack.extend(reversed(blossom_children[t]))
+        return leaves
+
+    def assign_label(w: int, t: int, p: int) -> None:
+        b = in_blossom[w]
+        label[w] = label[b] = t
+        label_end[w] = label_end[b] = p
+        best_edge[w] = best_edge[b] = -1
+        if t == 1:
+            queue.extend(blossom_leaves(b))
+        elif t == 2:
+            # the base of a T-blossom is matched, its mate becomes an S-vertex
+            base = blossom_base[b]
+            assign_label(endpoint[mate[base]], 1, mate[base] ^ 1)
+
+    def scan_blossom(v: int, w: int) -> int:
+        # trace back from v and w to find a new blossom base, -1 if an augmenting path was found
+        path = []
+        base = -1
+        while v != -1 or w != -1:
+            b = in_blossom[v]
+            if label[b] & 4:
+                base = blossom_base[b]
+                break
+            path.append(b)
+            label[b] = 5
+            if label_end[b] == -1:
+                v = -1
+            else:
+                v = endpoint[label_end[b]]
+                b = in_blossom[v]
+                v = endpoint[label_end[b]]
+            if w != -1:
+                v, w = w, v
+        for b in path:
+            label[b] = 1
+        return base
+
+    def add_blossom(base: int, k: int) -> None:
+        v, w, _ = edges[k]
+        base_blossom = in_blossom[base]
+        bv = in_blossom[v]
+        bw = in_blossom[w]
+        b = unused_blossoms.pop()
+        blossom_base[b] = base
+        blossom_parent[b] = -1
+        blossom_parent[base_blossom] = b
+        blossom_children[b] = path = []
+        blossom_ends[b] = ends = []
+        while bv != base_blossom:
+            blossom_parent[bv] = b
+            path.append(bv)
+            ends.append(label_end[bv])
+            v = endpoint[label_end[bv]]
+            bv = in_blossom[v]
+        path.append(base_blossom)
+        path.reverse()
+        ends.reverse()
+        ends.append(2 * k)
+        while bw != base_blossom:
+            blossom_parent[bw] = b
+            path.append(bw)
+            ends.append(label_end[bw] ^ 1)
+            w = endpoint[label_end[bw]]
+            bw = in_blossom[w]
+        label[b] = 1
+        label_end[b] = label_end[base_blossom]
+        dual[b] = 0
+        for leaf in blossom_leaves(b):
+            if label[in_blossom[leaf]] == 2:
+                queue.append(leaf)
+            in_blossom[leaf] = b
+
+        # keep the least-slack edge to each neighbouring S-blossom
+        best_edge_to = [-1] * (2 * vertices_number)
+        for child in path:
+            if blossom_best_edges[child] is None:
+                edges_lists = [[p // 2 for p in neighbour_ends[leaf]] for leaf in blossom_leaves(child)]
+            else:
+                edges_lists = [blossom_best_edges[child]]
+            for edges_list in edges_lists:
+                for edge in edges_list:
+                    i, j, _ = edges[edge]
+                    if in_blossom[j] == b:
+                        i, j = j, i
+                    bj = in_blossom[j]
+                    if bj != b and label[bj] == 1 and (best_edge_to[bj] == -1
+                                                       or slack(edge) < slack(best_edge_to[bj])):
+                        best_edge_to[bj] = edge
+            blossom_best_edges[child] = None
+            best_edge[child] = -1
+        blossom_best_edges[b] = [edge for edge in best_edge_to if edge != -1]
+        best_edge[b] = -1
+        for edge in blossom_best_edges[b]:
+            if best_edge[b] == -1 or slack(edge) < slack(best_edge[b]):
+                best_edge[b] = edge
+
+    def expand_blossom(b: int, end_stage: bool) -> None:
+        for child in blossom_children[b]:
+            blossom_parent[child] = -1
+            if child < vertices_number:
+                in_blossom[child] = child
+            elif end_stage and dual[child] == 0:
+                expand_blossom(child, end_stage)
+            else:
+                for leaf in blossom_leaves(child):
+                    in_blossom[leaf] = child
+
+        if not end_stage and label[b] == 2:
+            # relabel the children on the even-length path from the entry child to the base
+            entry_child = in_blossom[endpoint[label_end[b] ^ 1]]
+            j = blossom_children[b].index(entry_child)
+            if j & 1:
+                j -= len(blossom_children[b])
+                step = 1
+                end_trick = 0
+            else:
+                step = -1
+                end_trick = 1
+            p = label_end[b]
+            while j != 0:
+                label[endpoint[p ^ 1]] = 0
+                label[endpoint[blossom_ends[b][j - end_trick] ^ end_trick ^ 1]] = 0
+                assign_label(endpoint[p ^ 1], 2, p)
+                allowed_edge[blossom_ends[b][j - end_trick] // 2] = True
+                j += step
+                p = blossom_ends[b][j - end_trick] ^ end_trick
+                allowed_edge[p // 2] = True
+                j += step
+            child = blossom_children[b][j]
+            label[endpoint[p ^ 1]] = label[child] = 2
+            label_end[endpoint[p ^ 1]] = label_end[child] = p
+            best_edge[child] = -1
+            j += step
+            while blossom_children[b][j] != entry_child:
+                child = blossom_children[b][j]
+                if label[child] == 1:
+                    j += step
+                    continue
+                reached = -1
+                for leaf in blossom_leaves(child):
+                    if label[leaf] != 0:
+                        reached = leaf
+                        break
+                if reached != -1:
+                    label[reached] = 0
+                    label[endpoint[mate[blossom_base[child]]]] = 0
+                    assign_label(reached, 2, label_end[reached])
+                j += step
+
+        label[b] = label_end[b] = -1
+        blossom_children[b] = blossom_ends[b] = None
+        blossom_base[b] = -1
+        blossom_best_edges[b] = None
+        best_edge[b] = -1
+        unused_blossoms.append(b)
+
+    def augment_blossom(b: int, v: int) -> None:
+        # swap the matched and unmatched edges on the path from v to the base of b
+        t = v
+        while blossom_parent[t] != b:
+            t = blossom_parent[t]
+        if t >= vertices_number:
+            augment_blossom(t, v)
+        i = j = blossom_children[b].index(t)
+        if i & 1:
+            j -= len(blossom_children[b])
+            step = 1
+            end_trick = 0
+        else:
+            step = -1
+            end_trick = 1
+        while j != 0:
+            j += step
+            t = blossom_children[b][j]
+            p = blossom_ends[b][j - end_trick] ^ end_trick
+            if t >= vertices_number:
+                augment_blossom(t, endpoint[p])
+            j += step
+            t = blossom_children[b][j]
+            if t >= vertices_number:
+                augment_blossom(t, endpoint[p ^ 1])
+            mate[endpoint[p]] = p ^ 1
+            mate[endpoint[p ^ 1]] = p
+        blossom_children[b] = blossom_children[b][i:] + blossom_children[b][:i]
+        blossom_ends[b] = blossom_ends[b][i:] + blossom_ends[b][:i]
+        blossom_base[b] = blossom_base[blossom_children[b][0]]
+
+    def augment_matching(k: int) -> None:
+        v, w, _ = edges[k]
+        for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+            while True:
+                bs = in_blossom[s]
+                if bs >= vertices_number:
+                    augment_blossom(bs, s)
+                mate[s] = p
+                if label_end[bs] == -1:
+                    break
+                t = endpoint[label_end[bs]]
+                bt = in_blossom[t]
+                s = endpoint[label_end[bt]]
+                j = endpoint[label_end[bt] ^ 1]
+                if bt >= vertices_number:
+                    augment_blossom(bt, j)
+                mate[j] = label_end[bt]
+                p = label_end[bt] ^ 1
+
+    # the edges which are tight from the start can be matched greedily, every vertex dual being still equal
+    for k, (i, j, weight) in enumerate(edges):
+        if weight == max_weight and i != j and mate[i] == -1 and mate[j] == -1:
+            mate[i] = 2 * k + 1
+            mate[j] = 2 * k
+
+    for _ in range(vertices_number):
+        # each stage grows an alternating forest from the single vertices until the matching is augmented
+        label[:] = [0] * (2 * vertices_number)
+        best_edge[:] = [-1] * (2 * vertices_number)
+        blossom_best_edges[vertices_number:] = [None] * vertices_number
+        allowed_edge[:] = [False] * edges_number
+        queue[:] = []
+        for v in range(vertices_number):
+            if mate[v] == -1 and label[in_blossom[v]] == 0:
+                assign_label(v, 1, -1)
+
+        augmented = False
+        while True:
+            while queue and not augmented:
+                v = queue.pop()
+                for p in neighbour_ends[v]:
+                    k = p >> 1
+                    w = endpoint[p]
+                    if in_blossom[v] == in_blossom[w]:
+                        continue
+                    if not allowed_edge[k]:
+                        k_slack = dual[v] + dual[w] - double_weight[k]
+                        if k_slack <= 0:
+                            allowed_edge[k] = True
+                    if allowed_edge[k]:
+                        if label[in_blossom[w]] == 0:
+                            assign_label(w, 2, p ^ 1)
+                        elif label[in_blossom[w]] == 1:
+                            base = scan_blossom(v, w)
+                            if base >= 0:
+                                add_blossom(base, k)
+                            else:
+                                augment_matching(k)
+                                augmented = True
+                                break
+                        elif label[w] == 0:
+                            label[w] = 2
+                            label_end[w] = p ^ 1
+                    elif label[in_blossom[w]] == 1:
+                        b = in_blossom[v]
+                        if best_edge[b] == -1 or k_slack < slack(best_edge[b]):
+                            best_edge[b] = k
+                    elif label[w] == 0:
+                        if best_edge[w] == -1 or k_slack < slack(best_edge[w]):
+                            best_edge[w] = k
+            if augmented:
+                break
+
+            # no more tight edge, update the dual variables by the smallest allowed delta
+            delta_type = -1
+            delta = delta_edge = delta_blossom = None
+            if not max_cardinality:
+                delta_type = 1
+                delta = min(dual[:vertices_number])
+            for v in range(vertices_number):
+                if label[in_blossom[v]] == 0 and best_edge[v] != -1:
+                    d = slack(best_edge[v])
+                    if delta_type == -1 or d < delta:
+                        delta = d
+                        delta_type = 2
+                        delta_edge = best_edge[v]
+            for b in range(2 * vertices_number):
+                if blossom_parent[b] == -1 and label[b] == 1 and best_edge[b] != -1:
+                    d = slack(best_edge[b]) // 2
+                    if delta_type == -1 or d < delta:
+                        delta = d
+                        delta_type = 3
+                        delta_edge = best_edge[b]
+            for b in range(vertices_number, 2 * vertices_number):
+                if (blossom_base[b] >= 0 and blossom_parent[b] == -1 and label[b] == 2
+                        and (delta_type == -1 or dual[b] < delta)):
+                    delta = dual[b]
+                    delta_type = 4
+                    delta_blossom = b
+            if delta_type == -1:
+                # maximum cardinality reached, finish with a last dual update
+                delta_type = 1
+                delta = max(0, min(dual[:vertices_number]))
+
+            for v in range(vertices_number):
+                if label[in_blossom[v]] == 1:
+                    dual[v] -= delta
+                elif label[in_blossom[v]] == 2:
+                    dual[v] += delta
+            for b in range(vertices_number, 2 * vertices_number):
+                if blossom_base[b] >= 0 and blossom_parent[b] == -1:
+                    if label[b] == 1:
+                        dual[b] += delta
+                    elif label[b] == 2:
+                        dual[b] -= delta
+
+            if delta_type == 1:
+                break
+            elif delta_type == 2:
+                allowed_edge[delta_edge] = True
+                i, j, _ = edges[delta_edge]
+                if label[in_blossom[i]] == 0:
+                    i, j = j, i
+                queue.append(i)
+            elif delta_type == 3:
+                allowed_edge[delta_edge] = True
+                i, j, _ = edges[delta_edge]
+                queue.append(i)
+            else:
+                expand_blossom(delta_blossom, False)
+
+        if not augmented:
+            break
+
+        for b in range(vertices_number, 2 * vertices_number):
+            if blossom_parent[b] == -1 and blossom_base[b] >= 0 and label[b] == 1 and dual[b] == 0:
+                expand_blossom(b, True)
+
+    return [endpoint[mate[v]] if mate[v] >= 0 else -1 for v in range(vertices_number)]
+
+
+class PairingEngine(ABC):
+    """
+    Base class of the pairing engines, which split the players of a new round into matches.
+    """
+    @abstractmethod
+    def pair(self, tournament: Tournament, players: list[Player]) -> list[tuple[Player, Player]]:
+        """
+        Method that pairs the players of a new round.
+        Args:
+            tournament (Tournament): Tournament object, with its previous rounds.
+            players (list[Player]): The players, ordered by score.
+
+        Returns:
+            The pairs of players, the first one playing white.
+        """
+
+    @staticmethod
+    def orient(tournament: Tournament, player_1: Player, player_2: Player) -> tuple[Player, Player]:
+        """
+        Method that gives white to the player who has had it the least often.
+        Args:
+            tournament (Tournament): Tournament object.
+            player_1 (Player): Player 1 object, playing white on a tie.
+            player_2 (Player): Player 2 object.
+
+        Returns:
+            The pair of players, the first one playing white.
+        """
+        if tournament.colours.get(player_2.identifier, 0) < tournament.colours.get(player_1.identifier, 0):
+            return player_2, player_1
+        return player_1, player_2
+
+
+class GreedyPairing(PairingEngine):
+    """
+    Pairs each player in turn with the nearest-scored player they have not played yet, or with the next
+    player if there is none.
+    """
+    def pair(self, tournament: Tournament, players: list[Player]) -> list[tuple[Player, Player]]:
+        players_list = players.copy()
+        pairs = []
+        tournament.sync_round_index()
+
+        while len(players_list) >= 2:
+            first = players_list.pop(0)
+            first_opponents = tournament.opponents.get(first.identifier, ())
+
+            # seek a second player who has not played with the first one near the first one score
+            best_candidate_index = None
+            best_score_diff = float(1000)
+
+            for i, candidate in enumerate(players_list):
+                if candidate.identifier not in first_opponents:
+                    # Seek a candidate with the nearest score
+                    diff = abs(getattr(first, "score", 0.0) - getattr(candidate, "score", 0.0))
+                    if diff < best_score_diff:
+                        best_score_diff = diff
+                        best_candidate_index = i
+
+            # If no suitable candidate found, pair with the first available
+            second = players_list.pop(best_candidate_index if best_candidate_index is not None else 0)
+            pairs.append((first, second))
+
+        return pairs
+
+
+class BlossomPairing(PairingEngine):
+    """
+    Pairs the whole round at once as a minimum-cost perfect matching, the cost of a pair adding up a
+    rematch penalty, the square of the score gap and the colour imbalance.
+
+    Every pair of players is linked by default, so the pairing is the cheapest one. A window links each player
+    to the next players in the standings only, which keeps the graph sparse on large tournaments but makes the
+    pairing approximate: a cheaper pair between distant players is missed. The pairs of consecutive players are
+    always linked, so a perfect matching always exists.
+    """
+    def __init__(self, window: int | None = PAIRING_WINDOW):
+        self.window = window
+
+    @staticmethod
+    def pair_cost(tournament: Tournament, scores: Mapping[str, float], player_1: Player, player_2: Player) -> int:
+        """
+        Method that gets the cost of pairing two players.
+        Args:
+            tournament (Tournament): Tournament object.
+            scores (Mapping[str, float]): The tournament scores by player's id.
+            player_1 (Player): Player 1 object.
+            player_2 (Player): Player 2 object.
+
+        Returns:
+            The cost of the pair.
+        """
+        cost = 0
+        if player_2.identifier in tournament.opponents.get(player_1.identifier, ()):
+            cost += REMATCH_COST
+
+        # scores are half points, the gap is counted in half points to stay with integers
+        gap = round(2 * abs(scores.get(player_1.identifier, 0.0) - scores.get(player_2.identifier, 0.0)))
+        cost += SCORE_GAP_COST * gap * gap
+
+        # both players are due the same colour, one of them is going to get the other one
+        colour_1 = tournament.colours.get(player_1.identifier, 0)
+        colour_2 = tournament.colours.get(player_2.identifier, 0)
+        if colour_1 * colour_2 > 0:
+            cost += COLOUR_COST * min(abs(colour_1), abs(colour_2))
+        return cost
+
+    def pair(self, tournament: Tournament, players: list[Player]) -> list[tuple[Player, Player]]:
+        tournament.sync_round_index()
+        if len(players) < 2:
+            return []
+
+        # the distance between the players in the standings breaks the ties between equal costs, which
+        # spares the matching many blossoms. It is scaled down so that it never outweighs a real cost.
+        window = len(players) if self.window is None else self.window
+        tie_scale = len(players) * window
+        scores = tournament.scores
+        costs = []
+        for i, player in enumerate(players):
+            for j in range(i + 1, min(len(players), i + 1 + window)):
+                costs.append((i, j, self.pair_cost(tournament, scores, player, players[j]) * tie_scale + j - i))
+
+        # a maximum-weight matching of the maximum cardinality is a minimum-cost perfect matching
+        max_cost = max(cost for _, _, cost in costs) + 1
+        mate = max_weight_matching([(i, j, max_cost - cost) for i, j, cost in costs], max_cardinality=True)
+
+        return [self.orient(tournament, players[i], players[j]) for i, j in enumerate(mate) if i < j]
+
+
+class DutchPairing(PairingEngine):
+    """
+    Pairs the players score group by score group, from the top one, like the Dutch Swiss system. The top
+    half of each group plays the bottom half, and the players who cannot be paired without a rematch float
+    down to the next group.
+
+    Only one score group is searched at a time, with a bounded backtracking, so the pairing time grows with
+    the size of the groups rather than with the size of the tournament.
+    """
+    def __init__(self, backtracking_limit: int = BACKTRACKING_LIMIT):
+        self.backtracking_limit = backtracking_limit
+
+    def pair_halves(self, tournament: Tournament, top: list[Player], bottom: list[Player]) \
+            -> list[tuple[Player, Player]] | None:
+        """
+        Method that pairs each player of the top half with a player of the bottom half they have not played
+        yet, starting from the same rank in both halves.
+        Args:
+            tournament (Tournament): Tournament object.
+            top (list[Player]): The top half.
+            bottom (list[Player]): The bottom half, as long as the top half.
+
+        Returns:
+            The pairs of players, or None if none was found within the backtracking limit.
+        """
+        size = len(bottom)
+        used = [False] * size
+        # offset, from the player's own rank, of the next bottom player to try
+        offsets = [0] * size
+        chosen: list[int] = []
+        steps = 0
+
+        while len(chosen) < size:
+            i = len(chosen)
+            opponents = tournament.opponents.get(top[i].identifier, ())
+            while offsets[i] < size:
+                j = (i + offsets[i]) % size
+                offsets[i] += 1
+                steps += 1
+                if not used[j] and bottom[j].identifier not in opponents:
+                    used[j] = True
+                    chosen.append(j)
+                    break
+            else:
+                # no opponent left for this player, try the next one for the previous player
+                if i == 0 or steps > self.backtracking_limit:
+                    return None
+                offsets[i] = 0
+                used[chosen.pop()] = False
+
+        return [(top[i], bottom[j]) for i, j in enumerate(chosen)]
+
+    def pair_group(self, tournament: Tournament, group: list[Player]) \
+            -> tuple[list[tuple[Player, Player]], list[Player]]:
+        """
+        Method that pairs a score group, floating down its lowest players until the rest can be paired.
+        Args:
+            tournament (Tournament): Tournament object.
+            group (list[Player]): The players of the score group, the floaters from above first.
+
+        Returns:
+            The pairs of players and the players floating down to the next group.
+        """
+        for pairs_number in range(len(group) // 2, 0, -1):
+            pairs = self.pair_halves(tournament, group[:pairs_number], group[pairs_number:2 * pairs_number])
+            if pairs is not None:
+                return pairs, group[2 * pairs_number:]
+        return [], group
+
+    def pair(self, tournament: Tournament, players: list[Player]) -> list[tuple[Player, Player]]:
+        tournament.sync_round_index()
+        scores = tournament.scores
+        standings = sorted(players, key=lambda player: scores.get(player.identifier, 0.0), reverse=True)
+
+        history: list[tuple[list[Player], list[tuple[Player, Player]]]] = []
+        floaters: list[Player] = []
+        for _, score_group in groupby(standings, key=lambda player: scores.get(player.identifier, 0.0)):
+            group = floaters + list(score_group)
+            group_pairs, floaters = self.pair_group(tournament, group)
+            history.append((group, group_pairs))
+
+        # too many players are left at the bottom, the lowest group is merged with the one above
+        while len(floaters) >= 2 and len(history) >= 2:
+            group, _ = history.pop()
+            upper_group, _ = history.pop()
+            upper_identifiers = {player.identifier for player in upper_group}
+            merged = upper_group + [player for player in group if player.identifier not in upper_identifiers]
+            group_pairs, floaters = self.pair_group(tournament, merged)
+            history.append((merged, group_pairs))
+
+        pairs = [pair for _, group_pairs in history for pair in group_pairs]
+        # the players still left at the bottom cannot avoid a rematch any more
+        pairs.extend(zip(floaters[::2], floaters[1::2]))
+
+        return [self.orient(tournament, player_1, player_2) for player_1, player_2 in pairs]
+
+
+PAIRING_ENGINES: dict[str, PairingEngine] = {
+    "greedy": GreedyPairing(),
+    "blossom": BlossomPairing(),
+    "dutch": DutchPairing(),
+}
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+# Standard library imports
+import hashlib
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from .storage import write_json_atomically
+
+# Version of the build manifest and of the fragments file, the files of another version are ignored
+REPORT_BUILD_VERSION = 1
+
+
+def content_digest(*parts: Any) -> str:
+    """
+    Function that hashes the data a report or a fragment is rendered from.
+    Args:
+        *parts (Any): The data, json serializable.
+
+    Returns:
+        The hexadecimal digest.
+    """
+    text = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ReportBuild:
+    """
+    A report to be written: the digests of what it is rendered from, and its content, only rendered when written.
+    """
+    def __init__(self, digests: dict[str, str], content: Iterable[str] = ()):
+        # digest by kind of input, "template" and "inputs"
+        self.digests = digests
+        self.content = content
+        self.rebuilt_fragments: list[str] = []
+        self.reused_fragments = 0
+
+
+class ReportBuildCache:
+    """
+    Record of the reports built, so that a report whose template and inputs have not changed is not rendered
+    again, along with the html fragments rendered for each tournament, reused until their tournament changes.
+
+    The build manifest tells for each report file when it was last checked, if it was rebuilt and why. The
+    reports can be built from several threads at once.
+    """
+    def __init__(self, manifest_path: Path, fragments_path: Path):
+        self.manifest_path = manifest_path
+        self.fragments_path = fragments_path
+        self.reports: dict[str, dict[str, Any]] | None = None
+        self.fragments: dict[str, dict[str, str]] | None = None
+        self.fragments_changed = False
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def read(file_path: Path, key: str) -> dict:
+        """
+        Method that reads the entries of the manifest or of the fragments file.
+        Args:
+            file_path (Path): Path to the json file.
+            key (str): Key of the entries in the file.
+
+        Returns:
+            The entries. Empty if the file is missing, unreadable or of another version.
+        """
+        try:
+            with open(file_path, encoding="utf-8") as json_file:
+                data = json.load(json_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != REPORT_BUILD_VERSION:
+            return {}
+        entries = data.get(key)
+        return entries if isinstance(entries, dict) else {}
+
+    def load(self) -> None:
+        """
+        Method that reads the manifest and the fragments the first time they are needed.
+        """
+        with self.lock:
+            if self.reports is None:
+                self.reports = self.read(self.manifest_path, "reports")
+            if self.fragments is None:
+                self.fragments = self.read(self.fragments_path, "fragments")
+
+    def outdated(self, path: Path, build: ReportBuild) -> str | None:
+        """
+        Method that checks if a report has to be rendered again.
+        Args:
+            path (Path): Path to the report file.
+            build (ReportBuild): The report to be written.
+
+        Returns:
+            Why the report has to be rendered again. Or None if the report file is up to date.
+        """
+        self.load()
+        with self.lock:
+            entry = self.reports.get(str(path))
+        if entry is None:
+            return "first build"
+        if not Path(path).exists():
+            return "report file missing"
+        for kind, digest in build.digests.items():
+            if entry.get("digests", {}).get(kind) != digest:
+                return f"{kind} changed"
+        return None
+
+    def fragment(self, build: ReportBuild, key: str, digest: str, render: Callable[[], str]) -> str:
+        """
+        Method that gets the html fragment rendered from a tournament, rendering it again only if the tournament
+        changed since it was last rendered.
+        Args:
+            build (ReportBuild): The report the fragment is part of.
+            key (str): Key of the fragment, the tournament name.
+            digest (str): Digest of the data the fragment is rendered from.
+            render (Callable[[], str]): Renders the fragment.
+
+        Returns:
+            The html fragment.
+        """
+        self.load()
+        with self.lock:
+            cached = self.fragments.get(key)
+        if cached is not None and cached.get("digest") == digest:
+            build.reused_fragments += 1
+            return cached["html"]
+        html = render()
+        with self.lock:
+            self.fragments[key] = {"digest": digest, "html": html}
+            self.fragments_changed = True
+        build.rebuilt_fragments.append(key)
+        return html
+
+    def record(self, path: Path, build: ReportBuild, reason: str | None) -> None:
+        """
+        Method that records in the manifest that a report was checked, and rebuilt if it was outdated. See save.
+        Args:
+            path (Path): Path to the report file.
+            build (ReportBuild): The report checked.
+            reason (str | None): Why the report was rebuilt. None if it was up to date.
+        """
+        self.load()
+        with self.lock:
+            self.reports[str(path)] = {
+                "digests": build.digests,
+                "checked_at": datetime.now().isoformat(timespec="seconds"),
+                "rebuilt": reason is not None,
+                "reason": reason or "unchanged",
+                "fragments": {"rebuilt": build.rebuilt_fragments, "reused": build.reused_fragments},
+            }
+
+    def save(self) -> None:
+        """
+        Method that saves the manifest, and the fragments if some were rendered.
+        """
+        self.load()
+        with self.lock:
+            Path(self.manifest_path).parent.mkdir(parents=True, exist_ok=True)
+            if self.fragments_changed:
+                write_json_atomically(self.fragments_path,
+                                      {"version": REPORT_BUILD_VERSION, "fragments": self.fragments})
+                self.fragments_changed = False
+            write_json_atomically(self.manifest_path, {"version": REPORT_BUILD_VERSION, "reports": self.reports})
@@ -0,0 +1,836 @@
+from __future__ import annotations
+
+# Standard library imports
+import atexit
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Iterator, TextIO
+
+from .cache import repository_cache
+from .models import Match, Tournament
+
+# Number of bytes after which the journal is folded back into the snapshot
+JOURNAL_COMPACTION_THRESHOLD = 256 * 1024
+# Number of characters read at once by the streaming json reader
+JSON_READ_SIZE = 64 * 1024
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Number of seconds the write-behind writer waits for more saves before writing a queued snapshot
+WRITE_BEHIND_DELAY = 0.5
+
+
+def fsync_directory(folder: Path) -> None:
+    """
+    Function that flushes a directory entry to the disk, so that a rename made in it survives a crash.
+    Args:
+        folder (Path): Path to the directory.
+    """
+    try:
+        descriptor = os.open(folder, os.O_RDONLY)
+    except OSError:
+        # directories can not be opened on every platform, the rename is then as durable as it gets
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def write_json_files_atomically(files: dict[Path, Any]) -> None:
+    """
+    Function that writes each data to a temporary file synced to the disk, then swaps the files in with
+    renames, in the given order. The directories are synced once, after the last rename.
+
+    Each file is replaced atomically, a crash leaves it either in its old or in its new state, but the files
+    are not replaced together: a crash between two renames leaves the first files new and the next ones old.
+    The file referring to the others, such as an index, must therefore come last.
+    Args:
+        files (dict[Path, Any]): The data to be dumped, by path of the json file.
+    """
+    temporary_paths = []
+    try:
+        for file_path, data in files.items():
+            temporary_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            temporary_paths.append(temporary_path)
+            with open(temporary_path, "w", encoding="utf-8") as json_file:
+                json.dump(data, json_file, ensure_ascii=False, indent=4)
+                json_file.flush()
+                os.fsync(json_file.fileno())
+    except BaseException:
+        for temporary_path in temporary_paths:
+            temporary_path.unlink(missing_ok=True)
+        raise
+
+    for file_path, temporary_path in zip(files, temporary_paths):
+        os.replace(temporary_path, file_path)
+    for folder in {file_path.parent for file_path in files}:
+        fsync_directory(folder)
+
+
+def write_json_atomically(file_path: Path, data: Any) -> None:
+    """
+    Function that writes the data to a temporary file and swaps it in with a rename, so that a reader never
+    sees a half-written file and a crash never leaves a truncated one.
+    Args:
+        file_path (Path): Path to the json file.
+        data (Any): The data to be dumped.
+    """
+    write_json_files_atomically({file_path: data})
+
+
+def write_json_object_atomically(file_path: Path, members: Iterable[tuple[str, Any]]) -> None:
+    """
+    Function that writes a json object member by member, so that only the member being written is held in
+    memory, to a temporary file swapped in with a rename. The file is laid out as write_json_atomically does.
+    Args:
+        file_path (Path): Path to the json file.
+        members (Iterable[tuple[str, Any]]): The keys and the values of the object.
+    """
+    temporary_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temporary_path, "w", encoding="utf-8") as json_file:
+            separator = "{\n    "
+            for key, value in members:
+                value_text = json.dumps(value, ensure_ascii=False, indent=4).replace("\n", "\n    ")
+                json_file.write(f"{separator}{json.dumps(key, ensure_ascii=False)}: {value_text}")
+                separator = ",\n    "
+            json_file.write("{}" if separator == "{\n    " else "\n}")
+            json_file.flush()
+            os.fsync(json_file.fileno())
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+    os.replace(temporary_path, file_path)
+    fsync_directory(file_path.parent)
+
+
+class JsonStreamReader:
+    """
+    Incremental json reader decoding one value at a time with JSONDecoder.raw_decode over a buffered text
+    stream. Only the text of the value being decoded is kept in memory. The stream must be opened with
+    newline="" for the offsets in bytes to be right, universal newlines reading a CRLF line ending as one character.
+    """
+    def __init__(self, stream: TextIO, offset: int = 0, read_size: int = JSON_READ_SIZE):
+        self.stream = stream
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        # Offset in bytes, in the file, of the mark position in the buffer
+        self.offset = offset
+        self.mark = 0
+        self.eof = False
+
+    def fill(self, size: int) -> bool:
+        """
+        Method that drops the consumed text from the buffer and reads more.
+        Args:
+            size (int): Number of characters to read.
+
+        Returns:
+            False at the end of the stream. True otherwise.
+        """
+        if self.eof:
+            return False
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += len(self.buffer[self.mark:self.position].encode("utf-8"))
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = self.mark = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Method that skips the whitespace and gets the next character, without consuming it.
+        Returns:
+            The next character, an empty string at the end of the stream.
+        """
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill(self.read_size):
+                return ""
+
+    def expect(self, characters: str) -> str:
+        """
+        Method that consumes the next character, which must be one of the given ones.
+        Args:
+            characters (str): The expected characters.
+
+        Returns:
+            The consumed character.
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(f"Expecting one of {characters!r}", self.buffer, self.position)
+        self.position += 1
+        return character
+
+    def byte_offset(self) -> int:
+        """
+        Method that gets the offset in bytes, in the file, of the next value.
+        Returns:
+            The offset in bytes.
+        """
+        self.peek()
+        self.offset += len(self.buffer[self.mark:self.position].encode("utf-8"))
+        self.mark = self.position
+        return self.offset
+
+    def decode(self) -> Any:
+        """
+        Method that decodes the next value, reading more of the stream until the value is complete.
+        Returns:
+            The decoded value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # a number ending with the buffer may go on in the stream
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # read as much again as is buffered, so that a large value is not decoded too many times
+            self.fill(max(self.read_size, len(self.buffer)))
+
+    def iter_object(self, offsets: bool = False) -> Iterator[tuple[str, Any, int | None]]:
+        """
+        Method that decodes a json object member by member.
+        Args:
+            offsets (bool): True to get the offset in bytes of each value, which takes a little time.
+
+        Returns:
+            An iterator over the keys, the values and the values offsets, None if not asked for.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            offset = self.byte_offset() if offsets else None
+            yield key, self.decode(), offset
+            if self.expect(",}") == "}":
+                return
+
+
+def iter_json_object(file_path: Path, offsets: bool = False) -> Iterator[tuple[str, Any, int | None]]:
+    """
+    Function that reads a json file holding an object, member by member.
+    Args:
+        file_path (Path): Path to the json file.
+        offsets (bool): True to get the offset in bytes of each value.
+
+    Returns:
+        An iterator over the keys, the values and the values offsets.
+    """
+    with open(file_path, encoding="utf-8", newline="") as json_file:
+        yield from JsonStreamReader(json_file).iter_object(offsets)
+
+
+def read_json_value_at(file_path: Path, offset: int) -> Any:
+    """
+    Function that reads a single json value from a json file.
+    Args:
+        file_path (Path): Path to the json file.
+        offset (int): Offset in bytes of the value, as given by iter_json_object.
+
+    Returns:
+        The decoded value.
+    """
+    with open(file_path, "rb") as binary_file:
+        binary_file.seek(offset)
+        return JsonStreamReader(io.TextIOWrapper(binary_file, encoding="utf-8", newline=""), offset).decode()
+
+
+class TournamentsJournal:
+    """
+    Append-only log of the tournament changes made since the last snapshot.
+
+    Every record is idempotent (it sets a value rather than incrementing one), so replaying a record twice
+    leaves the tournaments in the same state. This is what allows the snapshot to be rewritten in the
+    background while the operator keeps entering results.
+    """
+    def __init__(self, file_path: Path, compaction_threshold: int = JOURNAL_COMPACTION_THRESHOLD):
+        self.file_path = Path(file_path)
+        self.compacting_path = self.file_path.with_name(self.file_path.name + ".compacting")
+        self.compaction_threshold = compaction_threshold
+        self.lock = threading.RLock()
+        self.compaction_lock = threading.Lock()
+        self.compaction_thread: threading.Thread | None = None
+        # Lines held back by the open batches, written with a single sync when the outermost one closes
+        self.pending_lines: list[str] = []
+        self.batch_depth = 0
+
+    def append(self, record: dict) -> None:
+        """
+        Method that appends a record at the end of the journal, and syncs it to the disk unless a batch is open.
+        Args:
+            record (dict): The record to be appended.
+        """
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self.lock:
+            if self.batch_depth:
+                self.pending_lines.append(line)
+            else:
+                self.write_lines([line])
+
+    def write_lines(self, lines: list[str]) -> None:
+        """
+        Method that writes lines at the end of the journal and syncs them to the disk.
+        Args:
+            lines (list[str]): The lines to be written.
+        """
+        with self.lock:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.file_path, "a", encoding="utf-8") as journal_file:
+                journal_file.writelines(lines)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager coalescing the records appended inside it into a single durable write, made when the
+        outermost batch closes. The records of a batch are lost together if the program crashes before that.
+        """
+        with self.lock:
+            self.batch_depth += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.batch_depth -= 1
+                if not self.batch_depth and self.pending_lines:
+                    lines, self.pending_lines = self.pending_lines, []
+                    self.write_lines(lines)
+
+    def log_tournament(self, tournament: Tournament) -> None:
+        """
+        Method that logs a whole tournament, used when a new tournament is created.
+        Args:
+            tournament (Tournament): Tournament object.
+        """
+        self.append({"op": "tournament", "name": tournament.name, "data": tournament.convert_to_dict()})
+
+    def log_round_start(self, tournament: Tournament, round_index: int) -> None:
+        """
+        Method that logs the start of a round with its pairings.
+        Args:
+            tournament (Tournament): Tournament object.
+            round_index (int): Index of the round in the tournament rounds.
+        """
+        self.append({"op": "round_start",
+                     "name": tournament.name,
+                     "round": round_index,
+                     "current_round": tournament.current_round,
+                     "data": tournament.rounds[round_index].convert_to_dict()})
+
+    def log_score(self, tournament: Tournament, round_index: int, match_index: int, match: Match) -> None:
+        """
+        Method that logs the scores of a match.
+        Args:
+            tournament (Tournament): Tournament object.
+            round_index (int): Index of the round in the tournament rounds.
+            match_index (int): Index of the match in the round matches.
+            match (Match): Match object.
+        """
+        self.append({"op": "score",
+                     "name": tournament.name,
+                     "round": round_index,
+                     "match": match_index,
+                     "scores": {player.identifier: score for player, score, _ in match}})
+
+    def log_round_end(self, tournament: Tournament, round_index: int) -> None:
+        """
+        Method that logs the end of a round.
+        Args:
+            tournament (Tournament): Tournament object.
+            round_index (int): Index of the round in the tournament rounds.
+        """
+        rnd = tournament.rounds[round_index]
+        self.append({"op": "round_end",
+                     "name": tournament.name,
+                     "round": round_index,
+                     "end_date": rnd.end_date,
+                     "end_time": rnd.end_time})
+
+    @staticmethod
+    def read_records(file_path: Path) -> Iterator[dict]:
+        """
+        Method that reads the records of a journal file. A torn last line, left by a crash in the middle of
+        an append, ends the reading.
+        Args:
+            file_path (Path): Path to the journal file.
+
+        Returns:
+            An iterator over the records.
+        """
+        try:
+            with open(file_path, encoding="utf-8") as journal_file:
+                for line in journal_file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        return
+        except FileNotFoundError:
+            return
+
+    def records(self) -> Iterator[dict]:
+        """
+        Method that reads all the pending records, the ones being compacted first.
+        Returns:
+            An iterator over the records.
+        """
+        yield from self.read_records(self.compacting_path)
+        yield from self.read_records(self.file_path)
+
+    def size(self) -> int:
+        """
+        Method that gets the size of the pending journal.
+        Returns:
+            The size in bytes.
+        """
+        try:
+            return self.file_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def is_empty(self) -> bool:
+        """
+        Method that checks if there is nothing left to compact.
+        Returns:
+            True if the journal is empty. False otherwise.
+        """
+        return self.size() == 0 and not self.compacting_path.exists()
+
+    def needs_compaction(self) -> bool:
+        """
+        Method that checks if the journal has grown enough to be folded into the snapshot.
+        Returns:
+            True if the journal should be compacted. False otherwise.
+        """
+        return self.size() >= self.compaction_threshold
+
+    def compact(self, write_snapshot: Callable[[Iterator[dict]], bool]) -> bool:
+        """
+        Method that folds the journal into the snapshot. The journal is first set aside so that new records
+        can still be appended, then the snapshot is rewritten with the set aside records applied.
+        Args:
+            write_snapshot (Callable): Callable applying the records to the snapshot. Each file must be
+                swapped in atomically, since the snapshot can be read while it is being rewritten.
+
+        Returns:
+            True if the journal was compacted. False otherwise.
+        """
+        with self.compaction_lock:
+            with self.lock:
+                if not self.compacting_path.exists():
+                    if self.size() == 0:
+                        return True
+                    os.replace(self.file_path, self.compacting_path)
+
+            if not write_snapshot(self.read_records(self.compacting_path)):
+                return False
+
+            with self.lock:
+                self.compacting_path.unlink(missing_ok=True)
+            return True
+
+    def compact_in_background(self, write_snapshot: Callable[[Iterator[dict]], bool]) -> None:
+        """
+        Method that compacts the journal in a background thread, unless a compaction is already running.
+        Args:
+            write_snapshot (Callable): See compact.
+        """
+        if self.compaction_thread is not None and self.compaction_thread.is_alive():
+            return
+        self.compaction_thread = threading.Thread(target=self.compact,
+                                                  args=(write_snapshot,),
+                                                  name="journal-compaction",
+                                                  daemon=True)
+        self.compaction_thread.start()
+
+    def wait_for_compaction(self) -> None:
+        """
+        Method that waits for the running background compaction, if any.
+        """
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+            self.compaction_thread = None
+
+
+class TournamentArchive:
+    """
+    Cold storage of the completed tournaments, which never change again: one gzip compressed json file per
+    tournament in the archive folder, plus an index of their headers. A tournament is only decompressed when
+    it is opened.
+    """
+    def __init__(self, folder: Path):
+        self.folder = Path(folder)
+        self.index_path = self.folder / "index.json"
+        self.lock = threading.RLock()
+        self.index: tuple[tuple, dict[str, dict]] | None = None
+
+    def paths(self) -> list[Path]:
+        """
+        Method that gets the files to watch for changes. The index is rewritten with every archived tournament.
+        Returns:
+            The paths to the files.
+        """
+        return [self.index_path]
+
+    def read_index(self) -> dict[str, dict]:
+        """
+        Method that reads the headers of the archived tournaments, kept until the index file changes.
+        Returns:
+            The tournaments headers by name, with the name of their archive file.
+        """
+        with self.lock:
+            signature = repository_cache.signature([self.index_path])
+            if self.index is None or self.index[0] != signature:
+                try:
+                    with open(self.index_path, encoding="utf-8") as json_file:
+                        self.index = (signature, json.load(json_file)["tournaments"])
+                except FileNotFoundError:
+                    self.index = (signature, {})
+            return self.index[1]
+
+    def read(self, name: str) -> dict | None:
+        """
+        Method that decompresses an archived tournament.
+        Args:
+            name (str): The tournament name.
+
+        Returns:
+            The tournament's data. Or None if it is not archived.
+        """
+        entry = self.read_index().get(name)
+        if entry is None:
+            return None
+        with gzip.open(self.folder / entry["file"], "rt", encoding="utf-8") as json_file:
+            return json.load(json_file)
+
+    def write(self, tournaments: dict[str, dict]) -> None:
+        """
+        Method that archives the given tournaments, then adds them to the index.
+        Args:
+            tournaments (dict[str, dict]): The tournaments' data by name.
+        """
+        with self.lock:
+            index = dict(self.read_index())
+            self.folder.mkdir(parents=True, exist_ok=True)
+            for name, attrs in tournaments.items():
+                file_name = ShardedTournamentStore.shard_name(name) + ".gz"
+                temporary_path = self.folder / f"{file_name}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temporary_path, "wb") as archive_file:
+                    with gzip.GzipFile(fileobj=archive_file, mode="wb", mtime=0) as gzip_file:
+                        gzip_file.write(json.dumps(attrs, ensure_ascii=False).encode("utf-8"))
+                    archive_file.flush()
+                    os.fsync(archive_file.fileno())
+                os.replace(temporary_path, self.folder / file_name)
+
+                index[name] = ShardedTournamentStore.summary(name, attrs)
+                index[name]["file"] = file_name
+
+            # the index is swapped in once every archive file it points to is in place
+            write_json_atomically(self.index_path, {"tournaments": index})
+
+
+class WriteBehindWriter:
+    """
+    Background writer the saved snapshots are handed to, so that the prompt never waits for the disk.
+
+    The snapshots queued under the same key are merged, the latest data of each entry winning, and written
+    once the delay elapsed since the first of them, or as soon as the writer is flushed. The queued snapshots
+    are flushed when the interpreter exits, Ctrl-C included, as long as the writer is not closed.
+    """
+    def __init__(self, delay: float = WRITE_BEHIND_DELAY):
+        self.delay = delay
+        self.condition = threading.Condition()
+        # Merged snapshot, write callable, time of the first save and error callback, by key
+        self.pending: dict[Hashable, tuple[dict, Callable[[dict], Any], float,
+                                           Callable[[Exception], Any] | None]] = {}
+        self.writing = False
+        self.flush_requested = False
+        self.closed = False
+        self.thread: threading.Thread | None = None
+        self.error: Exception | None = None
+
+        self.saves = 0
+        self.flushes = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+
+    def submit(self, key: Hashable, data: dict, write: Callable[[dict], Any],
+               on_error: Callable[[Exception], Any] | None = None) -> None:
+        """
+        Method that queues a snapshot to be written in the background.
+        Args:
+            key (Hashable): The snapshots with the same key are merged into a single write.
+            data (dict): The snapshot, which must not be modified once submitted.
+            write (Callable): Callable writing the merged snapshot.
+            on_error (Callable | None): Called with the error if the write fails, so that the failure is
+                reported for the save which requested it. Without it the error is raised by the next flush.
+        """
+        with self.condition:
+            self.saves += 1
+            if self.closed:
+                try:
+                    write(data)
+                except Exception as error:
+                    if on_error is None:
+                        raise
+                    on_error(error)
+                return
+
+            queued = self.pending.get(key)
+            if queued is None:
+                self.pending[key] = (dict(data), write, time.perf_counter(), on_error)
+            else:
+                queued[0].update(data)
+                self.pending[key] = (queued[0], write, queued[2], on_error)
+
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="write-behind", daemon=True)
+                self.thread.start()
+                # the thread is a daemon, killed at exit with the saves it still holds
+                atexit.register(self.close)
+            self.condition.notify_all()
+
+    def write(self, batch: dict[Hashable, tuple]) -> None:
+        """
+        Method that writes snapshots, each one on its own so that a failed write does not hold back the others.
+        Args:
+            batch (dict[Hashable, tuple]): The queued snapshots by key.
+        """
+        for data, write, _, on_error in batch.values():
+            try:
+                write(data)
+            except Exception as error:
+                if on_error is None:
+                    self.error = error
+                else:
+                    on_error(error)
+
+    def run(self) -> None:
+        """
+        Method that writes the queued snapshots, run by the writer thread.
+        """
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+
+                deadline = min(queued for _, _, queued, _ in self.pending.values()) + self.delay
+                while not self.flush_requested and not self.closed:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+
+                batch, self.pending = self.pending, {}
+                self.writing = True
+
+            started = time.perf_counter()
+            try:
+                self.write(batch)
+            finally:
+                latency = time.perf_counter() - started
+                with self.condition:
+                    self.writing = False
+                    self.flushes += 1
+                    self.last_latency = latency
+                    self.max_latency = max(self.max_latency, latency)
+                    self.condition.notify_all()
+
+    def flush(self) -> None:
+        """
+        Method that writes the queued snapshots right away, and waits until they are on disk.
+        Raises:
+            The error raised by a background write since the last flush, if any.
+        """
+        if threading.current_thread() is self.thread:
+            return
+
+        with self.condition:
+            self.flush_requested = True
+            self.condition.notify_all()
+            while self.pending or self.writing:
+                self.condition.wait()
+            self.flush_requested = False
+            error, self.error = self.error, None
+
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """
+        Method that flushes the queued snapshots and stops the writer thread. Later saves are written at once.
+        """
+        try:
+            self.flush()
+        finally:
+            with self.condition:
+                self.closed = True
+                self.condition.notify_all()
+            if self.thread is not None:
+                self.thread.join()
+                self.thread = None
+                atexit.unregister(self.close)
+
+    def stats(self) -> dict[str, float]:
+        """
+        Method that gets the writer statistics.
+        Returns:
+            The number of saves and of writes to disk, the time the last and the slowest writes took, in seconds.
+        """
+        with self.condition:
+            return {"saves": self.saves,
+                    "flushes": self.flushes,
+                    "last_latency": self.last_latency,
+                    "max_latency": self.max_latency}
+
+
+class ShardedTournamentStore:
+    """
+    One json file per tournament in a shards folder, plus a small manifest mapping each tournament name to
+    its shard and to the header fields needed to list the tournaments without opening the shards.
+    """
+    def __init__(self, folder: Path, manifest_path: Path, legacy_snapshot: Path | None = None):
+        self.folder = Path(folder)
+        self.manifest_path = Path(manifest_path)
+        self.legacy_snapshot = legacy_snapshot
+
+    @staticmethod
+    def shard_name(tournament_name: str) -> str:
+        """
+        Method that gets the file name of a tournament shard. The hash keeps apart the names which only
+        differ by special characters.
+        Args:
+            tournament_name (str): The tournament name.
+
+        Returns:
+            The shard file name.
+        """
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", tournament_name).strip("-").lower()[:40]
+        digest = hashlib.sha1(tournament_name.encode("utf-8")).hexdigest()[:8]
+        return f"{slug}-{digest}.json"
+
+    @staticmethod
+    def summary(tournament_name: str, attrs: dict) -> dict:
+        """
+        Method that gets the manifest entry of a tournament.
+        Args:
+            tournament_name (str): The tournament name.
+            attrs (dict): The tournament's data.
+
+        Returns:
+            The manifest entry.
+        """
+        return {
+            "file": ShardedTournamentStore.shard_name(tournament_name),
+            "place": attrs["place"],
+            "start_date": attrs["start_date"],
+            "end_date": attrs["end_date"],
+            "description": attrs.get("description", ""),
+            "current_round": attrs.get("current_round", 1),
+            "rounds_number": attrs["rounds_number"],
+            "completed": Tournament.completed_from_dict(attrs),
+        }
+
+    def read_manifest(self) -> dict[str, dict]:
+        """
+        Method that reads the manifest. The single file snapshot is split into shards the first time.
+        Returns:
+            The manifest entries by tournament name.
+        """
+        try:
+            with open(self.manifest_path, encoding="utf-8") as json_file:
+                return json.load(json_file)["tournaments"]
+        except FileNotFoundError:
+            if self.legacy_snapshot is not None and self.legacy_snapshot.exists():
+                with open(self.legacy_snapshot, encoding="utf-8") as json_file:
+                    self.write(json.load(json_file), {})
+                return self.read_manifest()
+            return {}
+
+    def paths(self) -> list[Path]:
+        """
+        Method that gets the files to watch for changes. The manifest is rewritten with every shard.
+        Returns:
+            The paths to the files.
+        """
+        return [self.manifest_path]
+
+    def read_summaries(self) -> dict[str, dict]:
+        """
+        Method that reads the tournaments headers, without their players and rounds.
+        Returns:
+            The tournaments headers by name.
+        """
+        return self.read_manifest()
+
+    def read(self, names: Iterable[str] | None = None) -> dict[str, dict]:
+        """
+        Method that reads the shards of the given tournaments.
+        Args:
+            names (Iterable[str] | None): The tournament names. All the tournaments if None.
+
+        Returns:
+            The tournaments' data by name.
+        """
+        manifest = self.read_manifest()
+        if names is None:
+            names = manifest.keys()
+
+        tournaments = {}
+        for name in names:
+            if name not in manifest:
+                continue
+            with open(self.folder / manifest[name]["file"], encoding="utf-8") as json_file:
+                tournaments[name] = json.load(json_file)
+        return tournaments
+
+    def write(self, tournaments: dict[str, dict], manifest: dict[str, dict] | None = None) -> None:
+        """
+        Method that writes the shards of the given tournaments and updates the manifest.
+        Args:
+            tournaments (dict[str, dict]): The tournaments' data by name.
+            manifest (dict[str, dict] | None): The current manifest, read from disk if None.
+        """
+        if manifest is None:
+            manifest = self.read_manifest()
+
+        self.folder.mkdir(parents=True, exist_ok=True)
+        files: dict[Path, Any] = {}
+        for name, attrs in tournaments.items():
+            files[self.folder / self.shard_name(name)] = attrs
+            manifest[name] = self.summary(name, attrs)
+
+        # the manifest is swapped in last, once every shard it points to is in place
+        files[self.manifest_path] = {"tournaments": manifest}
+        write_json_files_atomically(files)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+# Standard library imports
+import hashlib
+import os
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+# Folder of the report templates, found from the package rather than from the working directory
+TEMPLATES_FOLDER = Path(__file__).resolve().parent.parent / "templates"
+# Compiled templates kept between launches
+TEMPLATES_CACHE_FOLDER = TEMPLATES_FOLDER / "__jinja_cache__"
+
+
+class TemplateRegistry(Mapping):
+    """
+    Report templates by report name, each one loaded and compiled the first time it is used.
+
+    The compiled templates are kept in a jinja bytecode cache on disk, so that the next launches only load them.
+    jinja2 itself is only imported with the first template.
+    """
+    def __init__(self, templates: dict[str, str], folder: Path = TEMPLATES_FOLDER,
+                 cache_folder: Path | None = TEMPLATES_CACHE_FOLDER):
+        # template file name, relative to the folder, by report name
+        self.names = templates
+        self.folder = Path(folder)
+        self.cache_folder = cache_folder
+        self.environment: Environment | None = None
+        self.compiled: dict[str, Template] = {}
+        self.lock = threading.Lock()
+
+    def get_environment(self) -> Environment:
+        """
+        Method that creates the jinja environment the first time a template is used.
+        Returns:
+            The jinja environment.
+        """
+        if self.environment is None:
+            from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+            self.environment = Environment(loader=FileSystemLoader(self.folder),
+                                           bytecode_cache=FileSystemBytecodeCache(self.bytecode_folder()))
+        return self.environment
+
+    def bytecode_folder(self) -> str | None:
+        """
+        Method that gets the folder of the bytecode cache.
+        Returns:
+            The cache folder. Or None for the temporary folder of the user, when it cannot be written to.
+        """
+        if self.cache_folder is None:
+            return None
+        try:
+            self.cache_folder.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        return str(self.cache_folder) if os.access(self.cache_folder, os.W_OK) else None
+
+    def __getitem__(self, report: str) -> Template:
+        template = self.compiled.get(report)
+        if template is None:
+            with self.lock:
+                template = self.compiled.get(report)
+                if template is None:
+                    template = self.compiled[report] = self.get_environment().get_template(self.names[report])
+        return template
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def source_digest(self, report: str) -> str:
+        """
+        Method that hashes the source of a template, without loading it.
+        Args:
+            report (str): The report name.
+
+        Returns:
+            The hexadecimal digest.
+        """
+        return hashlib.blake2b((self.folder / self.names[report]).read_bytes(), digest_size=20).hexdigest()
+
+    def load_all(self) -> None:
+        """
+        Method that loads and compiles all the templates now rather than on first use.
+        """
+        for report in self.names:
+            self[report]
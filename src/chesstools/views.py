@@ -66,6 +66,19 @@ class MainView:
                 continue
             return int(answer)
 
+    @staticmethod
+    def display_writer_stats(stats: dict[str, float]) -> None:
+        """
+        Method that displays how long the background saves took.
+        Args:
+            stats (dict[str, float]): The write-behind writer statistics.
+        """
+        if not stats["flushes"]:
+            return
+        console.print(f"[bright_white]💾 {stats['saves']} saves written in {stats['flushes']} writes, "
+                      f"last one in {stats['last_latency'] * 1000:.1f} ms, "
+                      f"slowest one in {stats['max_latency'] * 1000:.1f} ms.[/bright_white]")
+
     @staticmethod
     def display_goodbye() -> None:
         """
@@ -75,6 +88,24 @@ class MainView:
 
 
 class TournamentView:
+    @staticmethod
+    def display_load_issues(issues: list[dict[str, str]], report_path: Path | None) -> None:
+        """
+        Method that displays the problems which left tournaments out while reading them.
+        Args:
+            issues (list[dict[str, str]]): The errors of the load report.
+            report_path (Path | None): Path to the saved load report. None if it could not be saved.
+        """
+        for issue in issues:
+            console.print(f"[bold bright_red]⚠ {issue['tournament']} ({issue['path']}): "
+                          f"{issue['message']}[/bold bright_red]")
+        if report_path is None:
+            console.print("[bright_red]The tournaments in error are left out and kept unchanged in their file, "
+                          "the load report could not be saved.[/bright_red]")
+        else:
+            console.print(f"[bright_red]The tournaments in error are left out and kept unchanged in their file, "
+                          f"see {report_path}.[/bright_red]")
+
     @staticmethod
     def display_match_details(match: Match) -> Group:
         """
@@ -641,6 +672,11 @@ class TournamentView:
     def display_file_not_found(file_path: Path) -> None:
         console.print(f"[bright_white]{file_path} : [/bright_white][bright_red]❌ file not found ![/bright_red]\n")
 
+    @staticmethod
+    def display_save_failed(file_path: Path, error: Exception) -> None:
+        console.print(f"[bright_white]{file_path} : [/bright_white][bright_red]❌ the tournaments could not be "
+                      f"saved ({error}) ![/bright_red]\n")
+
     @staticmethod
     def display_winners(winners: list[Player], max_score: float, tournament_name: str) -> None:
         """
@@ -851,11 +887,15 @@ class PlayerView:
         Method that checks if a player, identified by his identifier, exists in a players object.
         Args:
             identifier (str): The player's identifier.
-            players (Players): The players object.
+            players (Players): The players object. Its identifier index is used when it has one.
 
         Returns:
             A boolean. True if the player exists, False otherwise.
         """
+        identifier_index = getattr(players, "identifier_index", None)
+        if identifier_index is not None:
+            return identifier in identifier_index
+
         for p in players:
             if identifier == p.identifier:
                 return True
@@ -950,6 +990,11 @@ class PlayerView:
     def display_file_not_found(file_path: Path) -> None:
         console.print(f"[bright_white]{file_path} : [/bright_white][bright_red]❌ file not found ![/bright_red]\n")
 
+    @staticmethod
+    def display_save_failed(file_path: Path, error: Exception) -> None:
+        console.print(f"[bright_white]{file_path} : [/bright_white][bright_red]❌ the players could not be "
+                      f"saved ({error}) ![/bright_red]\n")
+
 
 class ReportView:
 
@@ -1006,6 +1051,39 @@ class ReportView:
     def display_report_generated(path: Path) -> None:
         console.print(f"[bright_white]The HTML report has been generated.\nHere ⯈[/bright_white] {path}\n")
 
+    @staticmethod
+    def display_report_unchanged(path: Path) -> None:
+        console.print(f"[bright_white]The HTML report is already up to date.\nHere ⯈[/bright_white] {path}\n")
+
+    @staticmethod
+    def display_report_timing(path: Path, status: str, seconds: float) -> None:
+        """
+        Method that displays how a report of the batch mode went.
+        Args:
+            path (Path): Path to the report.
+            status (str): "generated", "unchanged" or "failed".
+            seconds (float): Time spent on the report.
+        """
+        color = {"generated": "bright_green", "unchanged": "bright_white"}.get(status, "bright_red")
+        console.print(f"[{color}]{status:>9}[/{color}] {seconds * 1000:8.1f} ms  {path}", highlight=False)
+
+    @staticmethod
+    def display_report_error(path: Path, error: Exception) -> None:
+        console.print(f"{path} : [bold bright_red]❌[/bold bright_red] [bright_red]{error}[/bright_red]",
+                      highlight=False)
+
+    @staticmethod
+    def display_reports_summary(statuses: dict[str, int], seconds: float) -> None:
+        """
+        Method that displays the outcome of the batch mode.
+        Args:
+            statuses (dict[str, int]): Number of reports by status.
+            seconds (float): Time spent on all the reports.
+        """
+        counts = ", ".join(f"{statuses.get(status, 0)} {status}" for status in ("generated", "unchanged", "failed"))
+        console.print(f"[bright_white]{sum(statuses.values())} reports in {seconds:.2f} s: {counts}.[/bright_white]",
+                      highlight=False)
+
     @staticmethod
     def display_cancelled() -> None:
         console.print("[bright_white]Ok, cancelled.[/bright_white]")
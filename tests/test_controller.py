@@ -96,6 +96,20 @@ class TestController(unittest.TestCase):
 
         self.assertTrue(played_pairs_round1.isdisjoint(played_pairs_round2))
 
+    def test_score_ledger_follows_match_scores(self):
+        tournament_controller = self.controller.tournament_controller
+        self.tournament.create_round(1, self.players.data)
+        match = self.tournament.rounds[0].matches[0]
+        (player_1, _, _), (player_2, _, _) = match.match_tuple
+
+        tournament_controller.set_match_scores(match, player_1, 1.0, player_2, 0.0, self.tournament)
+        tournament_controller.set_match_scores(match, player_1, 0.5, player_2, 0.5, self.tournament)
+
+        self.assertEqual(self.tournament.scores[player_1.identifier], 0.5)
+        self.assertEqual(self.tournament.scores[player_2.identifier], 0.5)
+        scores, _ = Tournament.compute_player_scores(self.tournament)
+        self.assertEqual(sum(scores.values()), 1.0)
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,252 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.chesstools import controllers
+from src.chesstools.cache import repository_cache
+from src.chesstools.controllers import MainController, TournamentsManager
+from src.chesstools.migrations import (MigrationReport, migrate_tournament, migrate_tournaments,
+                                       migrate_tournaments_file)
+from src.chesstools.models import SCHEMA_VERSION, Tournament
+from src.chesstools.storage import TournamentsJournal
+
+
+def legacy_tournament(players):
+    # layout of the files written before the schema version, with the players stored in full
+    return {
+        "place": "Paris", "start_date": "15/09/2025", "end_date": "17/09/2025", "description": "Demo",
+        "current_round": 1, "rounds_number": 4,
+        "players": {identifier: {"name": identifier, "first_name": "Test", "birth_date": None}
+                    for identifier in players},
+        "rounds": {"Round 1": {"round_name": "Round 1", "start_date": None, "start_time": None, "end_date": None,
+                               "end_time": None,
+                               "matches": {"match_1": {
+                                   "player1": {"identifier": players[0], "score": 1.0, "color": "⚪"},
+                                   "player2": {"identifier": players[1], "score": 0.0, "color": "⚫"}}}}},
+    }
+
+
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.addCleanup(self.directory.cleanup)
+
+        broken = legacy_tournament(["AB12345", "CD12345"])
+        broken["rounds"]["Round 1"]["matches"]["match_1"]["player2"]["identifier"] = "ZZ99999"
+        current = legacy_tournament(["AB12345", "EF12345"])
+        current["schema_version"] = SCHEMA_VERSION
+        current["players"] = list(current["players"])
+        self.tournaments = {"Legacy Open": legacy_tournament(["AB12345", "CD12345"]),
+                            "Broken Open": broken,
+                            "Current Open": current}
+
+    def test_file_is_upgraded_and_errors_reported(self):
+        source = self.folder / "tournaments.json"
+        source.write_text(json.dumps(self.tournaments), encoding="utf-8")
+        players_path = self.folder / "players.json"
+        players_path.write_text(json.dumps({"EF12345": {"name": "F", "first_name": "E", "birth_date": None}}),
+                                encoding="utf-8")
+
+        report = migrate_tournaments_file(source, source, players_path, self.folder / "report.json")
+
+        migrated = json.loads(source.read_text(encoding="utf-8"))
+        self.assertEqual(list(migrated), ["Legacy Open", "Broken Open", "Current Open"])
+        self.assertEqual(migrated["Broken Open"], self.tournaments["Broken Open"])
+        self.assertEqual(migrated["Legacy Open"]["schema_version"], SCHEMA_VERSION)
+        self.assertEqual(migrated["Legacy Open"]["players"], ["AB12345", "CD12345"])
+        self.assertEqual(migrated["Current Open"], self.tournaments["Current Open"])
+        self.assertEqual(set(json.loads(players_path.read_text(encoding="utf-8"))), {"AB12345", "CD12345", "EF12345"})
+
+        saved = json.loads((self.folder / "report.json").read_text(encoding="utf-8"))
+        self.assertEqual((saved["tournaments"], saved["migrated"], saved["rejected"]), (3, 2, 1))
+        errors = [issue for issue in saved["issues"] if issue["severity"] == "error"]
+        self.assertEqual(errors, [{"severity": "error", "tournament": "Broken Open",
+                                   "path": "rounds/Round 1/matches/match_1/player2",
+                                   "message": "Unknown player ZZ99999, not a player of the tournament"}])
+        self.assertEqual(saved["rejected_tournaments"]["Broken Open"], self.tournaments["Broken Open"])
+        self.assertTrue(report.has_errors())
+
+    def test_rejected_tournament_kept_without_report(self):
+        source = self.folder / "tournaments.json"
+        source.write_text(json.dumps(self.tournaments), encoding="utf-8")
+
+        report = migrate_tournaments_file(source, source)
+
+        migrated = json.loads(source.read_text(encoding="utf-8"))
+        self.assertEqual(migrated["Broken Open"], self.tournaments["Broken Open"])
+        self.assertEqual(list(report.rejected), ["Broken Open"])
+
+    def test_tournaments_are_migrated_one_at_a_time(self):
+        def tournaments():
+            yield "Legacy Open", self.tournaments["Legacy Open"]
+            raise AssertionError("read before the first tournament was used")
+
+        report = MigrationReport()
+        name, attrs = next(migrate_tournaments(tournaments(), report))
+
+        self.assertEqual((name, attrs["players"]), ("Legacy Open", ["AB12345", "CD12345"]))
+        self.assertEqual(report.tournaments, 1)
+
+    def test_newer_schema_version_rejected(self):
+        attrs = dict(self.tournaments["Current Open"], schema_version=SCHEMA_VERSION + 1)
+        report = MigrationReport()
+
+        self.assertIsNone(migrate_tournament("Current Open", attrs, report))
+        self.assertEqual(report.issues[0]["path"], "schema_version")
+        self.assertIs(report.rejected["Current Open"], attrs)
+
+    def test_load_goes_on_after_a_broken_tournament(self):
+        snapshot_path = self.folder / "tournaments.json"
+        report_path = self.folder / "load_report.json"
+        for name, value in (("TOURNAMENTS_DATA_JSON", snapshot_path), ("PLAYERS_DATA_JSON", self.folder / "p.json"),
+                            ("TOURNAMENTS_LOAD_REPORT_JSON", report_path)):
+            patcher = mock.patch.object(controllers, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        snapshot_path.write_text(json.dumps(self.tournaments), encoding="utf-8")
+        (self.folder / "p.json").write_text(json.dumps({"EF12345": {"name": "F", "first_name": "E",
+                                                                    "birth_date": None}}), encoding="utf-8")
+
+        controller = MainController().tournament_controller
+        controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+        controller.archive = None
+        controller.lazy = False
+
+        tournaments = controller.get_all_tournaments()
+
+        self.assertEqual([tournament.name for tournament in tournaments], ["Legacy Open", "Current Open"])
+        self.assertEqual(json.loads(report_path.read_text(encoding="utf-8"))["rejected"], 1)
+
+    def test_issues_reported_when_a_lazy_tournament_is_materialized(self):
+        snapshot_path = self.folder / "tournaments.json"
+        report_path = self.folder / "load_report.json"
+        for name, value in (("TOURNAMENTS_DATA_JSON", snapshot_path), ("PLAYERS_DATA_JSON", self.folder / "p.json"),
+                            ("TOURNAMENTS_LOAD_REPORT_JSON", report_path)):
+            self.enterContext(mock.patch.object(controllers, name, value))
+        snapshot_path.write_text(json.dumps(self.tournaments), encoding="utf-8")
+        controller = MainController().tournament_controller
+        controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+        controller.archive = None
+        controller.lazy = True
+        controller.warm_start = False
+        display = self.enterContext(mock.patch.object(controller.view, "display_load_issues"))
+
+        tournaments = controller.get_all_tournaments()
+        self.assertFalse(report_path.exists())
+        tournaments.get_tournament("Broken Open").rounds
+
+        self.assertEqual(json.loads(report_path.read_text(encoding="utf-8"))["rejected"], 1)
+        errors, shown_path = display.call_args.args
+        self.assertEqual([issue["tournament"] for issue in errors], ["Broken Open"])
+        self.assertEqual(shown_path, report_path)
+
+    def test_unsaved_load_report_not_pointed_to(self):
+        (self.folder / "not_a_folder").write_text("", encoding="utf-8")
+        self.enterContext(mock.patch.object(controllers, "TOURNAMENTS_LOAD_REPORT_JSON",
+                                            self.folder / "not_a_folder" / "load_report.json"))
+        controller = MainController().tournament_controller
+        controller.load_report.add_issue("error", "Broken Open", "", "Broken")
+        display = self.enterContext(mock.patch.object(controller.view, "display_load_issues"))
+
+        controller.report_load_issues()
+
+        self.assertIsNone(display.call_args.args[1])
+
+    def test_broken_tournament_kept_when_another_one_is_saved(self):
+        snapshot_path = self.folder / "tournaments.json"
+        for name, value in (("TOURNAMENTS_DATA_JSON", snapshot_path), ("PLAYERS_DATA_JSON", self.folder / "p.json"),
+                            ("TOURNAMENTS_LOAD_REPORT_JSON", self.folder / "load_report.json")):
+            self.enterContext(mock.patch.object(controllers, name, value))
+
+        for lazy in (True, False):
+            with self.subTest(lazy=lazy):
+                snapshot_path.write_text(json.dumps(self.tournaments), encoding="utf-8")
+                (self.folder / "p.json").write_text(json.dumps({"EF12345": {"name": "F", "first_name": "E",
+                                                                            "birth_date": None}}), encoding="utf-8")
+                controller = MainController().tournament_controller
+                controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+                controller.archive = None
+                controller.lazy = lazy
+                controller.warm_start = False
+
+                tournaments = controller.get_all_tournaments()
+                for tournament in tournaments:
+                    tournament.rounds
+                tournament = tournaments.get_tournament("Current Open")
+                tournament.description = "Updated"
+                self.assertTrue(tournaments.save_tournament_to_json(controller, snapshot_path, ["Current Open"]))
+
+                saved = json.loads(snapshot_path.read_text(encoding="utf-8"))
+                self.assertEqual(saved["Broken Open"], self.tournaments["Broken Open"])
+                self.assertEqual(saved["Current Open"]["description"], "Updated")
+                reloaded = MainController().tournament_controller
+                reloaded.journal, reloaded.archive, reloaded.lazy = controller.journal, None, lazy
+                reloaded.warm_start = False
+                tournaments = reloaded.get_all_tournaments()
+                for tournament in tournaments:
+                    tournament.rounds
+                self.assertEqual(tournaments.get_tournament("Current Open").description, "Updated")
+                self.assertEqual(reloaded.load_report.rejected["Broken Open"], self.tournaments["Broken Open"])
+
+    def test_unopened_broken_tournament_kept_when_another_one_is_saved(self):
+        snapshot_path = self.folder / "tournaments.json"
+        for name, value in (("TOURNAMENTS_DATA_JSON", snapshot_path), ("PLAYERS_DATA_JSON", self.folder / "p.json"),
+                            ("TOURNAMENTS_LOAD_REPORT_JSON", self.folder / "load_report.json")):
+            self.enterContext(mock.patch.object(controllers, name, value))
+        snapshot_path.write_text(json.dumps(self.tournaments), encoding="utf-8")
+        (self.folder / "p.json").write_text(json.dumps({"EF12345": {"name": "F", "first_name": "E",
+                                                                    "birth_date": None}}), encoding="utf-8")
+        controller = MainController().tournament_controller
+        controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+        controller.archive = None
+        controller.lazy = True
+        controller.warm_start = False
+        self.enterContext(mock.patch.object(controller.view, "display_load_issues"))
+
+        tournaments = controller.get_all_tournaments()
+        tournaments.get_tournament("Current Open").description = "Updated"
+        self.assertTrue(tournaments.save_tournament_to_json(controller, snapshot_path, ["Current Open"]))
+
+        saved = json.loads(snapshot_path.read_text(encoding="utf-8"))
+        self.assertEqual(saved["Broken Open"], self.tournaments["Broken Open"])
+        self.assertEqual(saved["Current Open"]["description"], "Updated")
+
+    def test_issues_not_repeated_when_the_file_is_read_again(self):
+        snapshot_path = self.folder / "tournaments.json"
+        report_path = self.folder / "load_report.json"
+        for name, value in (("TOURNAMENTS_DATA_JSON", snapshot_path), ("PLAYERS_DATA_JSON", self.folder / "p.json"),
+                            ("TOURNAMENTS_LOAD_REPORT_JSON", report_path)):
+            self.enterContext(mock.patch.object(controllers, name, value))
+        snapshot_path.write_text(json.dumps(self.tournaments), encoding="utf-8")
+        controller = MainController().tournament_controller
+        controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+        controller.archive = None
+        controller.lazy = False
+        controller.warm_start = False
+        display = self.enterContext(mock.patch.object(controller.view, "display_load_issues"))
+
+        controller.get_all_tournaments()
+        issues = list(controller.load_report.issues)
+        repository_cache.invalidate()
+        controller.get_all_tournaments()
+
+        self.assertEqual(controller.load_report.issues, issues)
+        self.assertEqual(json.loads(report_path.read_text(encoding="utf-8"))["issues"], issues)
+        self.assertEqual(display.call_args_list[0], display.call_args_list[1])
+
+    def test_serialized_tournament_is_current_version(self):
+        tournament = Tournament(name="Spring Open", place="Paris", rounds_number=4)
+        tournaments = TournamentsManager([tournament])
+
+        self.assertEqual(next(iter(tournaments.convert_to_dict().values()))["schema_version"], SCHEMA_VERSION)
+        self.assertIs(migrate_tournament("Spring Open", tournament.convert_to_dict(), MigrationReport()),
+                      tournament.convert_to_dict())
+
+
+if __name__ == "__main__":
+
+    unittest.main()
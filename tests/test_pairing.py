@@ -0,0 +1,156 @@
+import itertools
+import random
+import unittest
+from unittest import mock
+from src.chesstools.models import Tournament, Round, Match, Player
+from src.chesstools.pairing import max_weight_matching, BlossomPairing, DutchPairing, GreedyPairing, PairingEngine
+
+
+def brute_force_matching(vertices_number, weights, max_cardinality):
+    best = (0, 0) if max_cardinality else (0,)
+    for edges_number in range(1, vertices_number // 2 + 1):
+        for matching in itertools.combinations(weights, edges_number):
+            vertices = [vertex for edge in matching for vertex in edge]
+            if len(set(vertices)) == len(vertices):
+                weight = sum(weights[edge] for edge in matching)
+                best = max(best, (edges_number, weight) if max_cardinality else (weight,))
+    return best
+
+
+def brute_force_pairing_cost(tournament, players):
+    scores = tournament.scores
+    if not players:
+        return 0
+    first, rest = players[0], players[1:]
+    return min(BlossomPairing.pair_cost(tournament, scores, first, player)
+               + brute_force_pairing_cost(tournament, rest[:index] + rest[index + 1:])
+               for index, player in enumerate(rest))
+
+
+class TestPairing(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [
+            Player(name=f"Player{index}", first_name="Test", birth_date="01/01/2000", identifier=f"ID{index}")
+            for index in range(6)
+        ]
+
+        self.tournament = Tournament(
+            name="Test Tournament",
+            place="Paris",
+            start_date="2025-09-15",
+            end_date="2025-09-17",
+            description="Demo",
+            rounds_number=4,
+            current_round=1,
+        )
+        self.tournament.add_players(self.players)
+
+        round_1 = Round("Round 1")
+        for index_1, index_2 in ((0, 2), (1, 3), (4, 5)):
+            round_1.matches.append(Match(self.players[index_1], self.players[index_2]))
+        self.tournament.add_round(round_1)
+
+    def test_matching_is_optimal(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            vertices_number = rng.randint(2, 8)
+            weights = {(i, j): rng.randint(-2, 10)
+                       for i, j in itertools.combinations(range(vertices_number), 2) if rng.random() < 0.6}
+            if not weights:
+                continue
+            edges = [(i, j, weight) for (i, j), weight in weights.items()]
+
+            for max_cardinality in (False, True):
+                mate = max_weight_matching(edges, max_cardinality)
+                matching = [(i, j) for i, j in enumerate(mate) if i < j]
+                weight = sum(weights[edge] for edge in matching)
+                result = (len(matching), weight) if max_cardinality else (weight,)
+
+                self.assertEqual(result, brute_force_matching(len(mate), weights, max_cardinality))
+
+    def test_pairing_engine_is_abstract(self):
+        with self.assertRaises(TypeError):
+            PairingEngine()
+
+    def test_blossom_pairing_is_the_cheapest(self):
+        rng = random.Random(0)
+        players = [Player(name=f"Player{index}", first_name="Test", birth_date="01/01/2000",
+                          identifier=f"BP{index}") for index in range(8)]
+        for _ in range(20):
+            tournament = Tournament(name="Open", place="Paris", rounds_number=4)
+            tournament.add_players(players)
+            for round_number in range(3):
+                tournament_round = Round(f"Round {round_number + 1}")
+                shuffled = rng.sample(players, len(players))
+                for player_1, player_2 in zip(shuffled[::2], shuffled[1::2]):
+                    score = rng.choice((0.0, 0.5, 1.0))
+                    tournament_round.matches.append(Match(player_1, player_2, score, 1.0 - score))
+                tournament.add_round(tournament_round)
+            standings = tournament.sort_players_by_score()
+
+            pairs = BlossomPairing().pair(tournament, standings)
+
+            cost = sum(BlossomPairing.pair_cost(tournament, tournament.scores, *pair) for pair in pairs)
+            self.assertEqual(cost, brute_force_pairing_cost(tournament, standings))
+
+    def test_blossom_pairing_reads_the_scores_once(self):
+        with mock.patch.object(Tournament, "scores", new_callable=mock.PropertyMock,
+                               return_value=self.tournament.scores) as scores:
+            BlossomPairing().pair(self.tournament, self.players)
+
+        self.assertEqual(scores.call_count, 1)
+
+    def test_greedy_pairing_falls_back_to_a_rematch(self):
+        pairs = GreedyPairing().pair(self.tournament, self.players)
+
+        self.assertTrue(any(self.tournament.match_already_played(*pair) for pair in pairs))
+
+    def test_blossom_pairing_avoids_rematches(self):
+        pairs = BlossomPairing().pair(self.tournament, self.players)
+
+        self.assertEqual(len(pairs), 3)
+        self.assertCountEqual([player for pair in pairs for player in pair], self.players)
+        self.assertFalse(any(self.tournament.match_already_played(*pair) for pair in pairs))
+
+    def test_blossom_pairing_balances_colours(self):
+        pairs = BlossomPairing().pair(self.tournament, self.players)
+
+        for white, black in pairs:
+            self.assertLessEqual(self.tournament.colours[white.identifier],
+                                 self.tournament.colours[black.identifier])
+
+    def test_dutch_pairing_first_round(self):
+        tournament = Tournament(name="Open", place="Paris", rounds_number=4)
+        players = [Player(name=f"Player{index}", first_name="Test", birth_date="01/01/2000",
+                          identifier=f"OP{index}") for index in range(8)]
+        tournament.add_players(players)
+
+        pairs = DutchPairing().pair(tournament, players)
+
+        self.assertEqual([frozenset(pair) for pair in pairs],
+                         [frozenset((players[index], players[index + 4])) for index in range(4)])
+
+    def test_dutch_pairing_by_score_groups(self):
+        round_2 = Round("Round 2")
+        round_2.matches.append(Match(self.players[0], self.players[3], 1.0, 0.0))
+        round_2.matches.append(Match(self.players[1], self.players[5], 1.0, 0.0))
+        round_2.matches.append(Match(self.players[2], self.players[4], 0.5, 0.5))
+        self.tournament.add_round(round_2)
+
+        pairs = DutchPairing().pair(self.tournament, self.players)
+
+        self.assertEqual(len(pairs), 3)
+        self.assertIn(frozenset((self.players[0], self.players[1])), [frozenset(pair) for pair in pairs])
+        self.assertFalse(any(self.tournament.match_already_played(*pair) for pair in pairs))
+
+    def test_dutch_pairing_floats_players_down(self):
+        pairs = DutchPairing().pair(self.tournament, self.players[:5])
+
+        self.assertEqual(len(pairs), 2)
+        self.assertFalse(any(self.tournament.match_already_played(*pair) for pair in pairs))
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -22,6 +22,39 @@ class TestPlayers(unittest.TestCase):
         after = self.players.data
 
         self.assertCountEqual(before, after)
+        self.assertIs(self.players.get_player_by_identifier("AS456"), self.player_2)
+
+    def test_identifier_lookup(self):
+        self.players.add_player(self.player_1)
+
+        self.assertIs(self.players.get_player_by_identifier("JD123"), self.player_1)
+        self.assertTrue(self.players.player_identifier_exists("JD123"))
+        self.assertIsNone(self.players.get_player_by_identifier("AS456"))
+        self.assertFalse(self.players.player_identifier_exists("AS456"))
+
+    def test_identifier_index_follows_list_changes(self):
+        self.players.add_player(self.player_1)
+        self.players.append(self.player_2)
+        self.assertEqual(self.players.identifier_index.keys(), {"JD123", "AS456"})
+
+        self.players.remove(self.player_1)
+        self.assertFalse(self.players.player_identifier_exists("JD123"))
+
+        self.players[0] = self.player_1
+        self.assertEqual(self.players.identifier_index.keys(), {"JD123"})
+
+        self.players.clear()
+        self.assertEqual(self.players.identifier_index, {})
+
+    def test_slice_has_its_own_index(self):
+        self.players.add_player(self.player_1)
+        self.players.add_player(self.player_2)
+
+        first = self.players[:1]
+
+        self.assertIsInstance(first, PlayersManager)
+        self.assertTrue(first.player_identifier_exists("JD123"))
+        self.assertFalse(first.player_identifier_exists("AS456"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.chesstools import controllers, views
+from src.chesstools.controllers import MainController, tournament_reports_paths
+from src.chesstools.models import Match, Player, Round, Tournament
+from src.chesstools.reports import ReportBuildCache
+
+
+class TestReportBuildCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.addCleanup(self.directory.cleanup)
+        self.enterContext(views.console.capture())
+
+        self.manifest_path = self.folder / "build_manifest.json"
+        self.report_path = self.folder / "tournaments.html"
+        self.controller = MainController().report_controller
+        self.controller.build_cache = ReportBuildCache(self.manifest_path, self.folder / "fragments.json")
+        self.tournaments = [Tournament(name=name, place="Paris", rounds_number=4)
+                            for name in ("Autumn Open", "Spring Open", "Winter Open")]
+        patcher = mock.patch.object(self.controller.main_controller.tournament_controller, "get_all_tournaments",
+                                    return_value=self.tournaments)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def build(self) -> dict:
+        self.controller.build_report(self.report_path, self.controller.generate_report_tournaments())
+        return json.loads(self.manifest_path.read_text(encoding="utf-8"))["reports"][str(self.report_path)]
+
+    def test_unchanged_report_is_skipped(self):
+        first = self.build()
+        self.assertEqual((first["rebuilt"], first["reason"]), (True, "first build"))
+        self.assertEqual(first["fragments"], {"rebuilt": ["Autumn Open", "Spring Open", "Winter Open"], "reused": 0})
+
+        with mock.patch.object(self.controller, "save_report", side_effect=AssertionError("report rendered")):
+            second = self.build()
+
+        self.assertEqual((second["rebuilt"], second["reason"]), (False, "unchanged"))
+
+    def test_only_changed_tournaments_rendered_again(self):
+        self.build()
+        self.tournaments[1].place = "Lyon"
+
+        entry = self.build()
+
+        self.assertEqual((entry["rebuilt"], entry["reason"]), (True, "inputs changed"))
+        self.assertEqual(entry["fragments"], {"rebuilt": ["Spring Open"], "reused": 2})
+        expected = self.controller.main_controller.templates["all_tournaments"].render(tournaments=self.tournaments)
+        self.assertEqual(self.report_path.read_text(encoding="utf-8"), expected)
+
+    def test_missing_report_file_rebuilt(self):
+        self.build()
+        self.report_path.unlink()
+
+        entry = self.build()
+
+        self.assertEqual(entry["reason"], "report file missing")
+        self.assertEqual(entry["fragments"]["reused"], 3)
+        self.assertTrue(self.report_path.exists())
+
+
+class TestAllReports(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.addCleanup(self.directory.cleanup)
+        self.enterContext(views.console.capture())
+        for name, value in (("ALPHABETICALLY_PLAYERS_REPORT", self.folder / "players.html"),
+                            ("ALL_TOURNAMENTS_REPORT", self.folder / "tournaments.html"),
+                            ("TOURNAMENT_REPORTS_FOLDER", self.folder / "tournaments")):
+            self.enterContext(mock.patch.object(controllers, name, value))
+
+        players = [Player("Doe", "John", "01/01/1990", "AB12345"), Player("Roe", "Jane", "02/02/1992", "CD12345")]
+        self.tournaments = []
+        for name in ("Spring Open", "Summer Open / Blitz"):
+            tournament = Tournament(name=name, place="Paris", rounds_number=4)
+            tournament.players = players
+            rnd = Round("Round 1")
+            rnd.matches = [Match(players[0], players[1], 1.0, 0.0)]
+            tournament.rounds = [rnd]
+            self.tournaments.append(tournament)
+
+        main_controller = MainController()
+        self.controller = main_controller.report_controller
+        self.controller.build_cache = ReportBuildCache(self.folder / "build_manifest.json",
+                                                       self.folder / "fragments.json")
+        self.enterContext(mock.patch.object(main_controller.tournament_controller, "get_all_tournaments",
+                                            return_value=self.tournaments))
+        self.enterContext(mock.patch.object(main_controller.player_controller, "get_players"))
+        main_controller.player_controller.players_manager = players
+
+    def test_every_report_written_then_skipped(self):
+        self.assertTrue(self.controller.generate_all_reports(workers=4))
+
+        paths = [self.folder / "players.html", self.folder / "tournaments.html"]
+        for tournament in self.tournaments:
+            paths.extend(tournament_reports_paths(tournament.name))
+        self.assertTrue(all(path.exists() for path in paths))
+        self.assertIn("Doe", paths[2].read_text(encoding="utf-8"))
+        self.assertIn("Round 1", paths[3].read_text(encoding="utf-8"))
+
+        with mock.patch.object(self.controller, "save_report", side_effect=AssertionError("report rendered")):
+            self.assertTrue(self.controller.generate_all_reports(workers=4))
+        manifest = json.loads((self.folder / "build_manifest.json").read_text(encoding="utf-8"))["reports"]
+        self.assertEqual(sorted(manifest), sorted(map(str, paths)))
+        self.assertFalse(any(entry["rebuilt"] for entry in manifest.values()))
+
+    def test_failed_report_does_not_stop_the_batch(self):
+        with mock.patch.object(self.controller, "tournament_rounds_report", side_effect=ValueError("broken")):
+            self.assertFalse(self.controller.generate_all_reports(workers=2))
+
+        self.assertTrue((self.folder / "tournaments.html").exists())
+        self.assertTrue(tournament_reports_paths("Spring Open")[0].exists())
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Time allowed from the first import to the first menu drawn, with the bytecode cache written. Only checked by
+# the benchmarks, run with CHESSTOOLS_BENCHMARKS=1
+STARTUP_BUDGET = 0.2
+
+FIRST_MENU = """
+import time
+start = time.perf_counter()
+import io, json, sys
+from src.chesstools import views
+from src.chesstools.controllers import MainController
+controller = MainController()
+views.console.file = io.StringIO()
+controller.view.display_main_menu()
+print(json.dumps({"seconds": time.perf_counter() - start,
+                  "deferred": [name for name in ("faker", "jinja2") if name in sys.modules]}))
+"""
+
+
+class TestStartup(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def draw_first_menu(self) -> dict:
+        environment = dict(os.environ, PYTHONPYCACHEPREFIX=self.directory.name)
+        environment.pop("PYTHONDONTWRITEBYTECODE", None)
+        result = subprocess.run([sys.executable, "-c", FIRST_MENU], cwd=Path(__file__).resolve().parents[1],
+                                env=environment, capture_output=True, text=True, check=True)
+        return json.loads(result.stdout.splitlines()[-1])
+
+    def test_first_menu_imports_neither_faker_nor_jinja(self):
+        self.assertEqual(self.draw_first_menu()["deferred"], [])
+
+    @unittest.skipUnless(os.environ.get("CHESSTOOLS_BENCHMARKS"), "wall-clock benchmark, set CHESSTOOLS_BENCHMARKS=1")
+    def test_first_menu_within_budget(self):
+        # the first run writes the bytecode cache
+        runs = [self.draw_first_menu() for _ in range(4)]
+
+        self.assertLess(min(run["seconds"] for run in runs[1:]), STARTUP_BUDGET)
+
+    def test_templates_loaded_on_first_report(self):
+        from src.chesstools.controllers import MainController
+
+        controller = MainController()
+        self.assertEqual(controller.templates.compiled, {})
+        self.assertIs(controller.templates["players"], controller.templates["players"])
+        self.assertEqual(list(controller.templates.compiled), ["players"])
+        self.assertEqual(len(controller.templates), 5)
+
+
+if __name__ == "__main__":
+
+    unittest.main()
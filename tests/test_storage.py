@@ -0,0 +1,935 @@
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.chesstools import controllers
+from src.chesstools.binary import (BinaryFormatError, BinaryTournamentStore, convert_binary_to_json,
+                                   convert_json_to_binary, decode_tournaments, encode_tournaments)
+from src.chesstools.cache import RepositoryCache, WarmStartCache, repository_cache
+from src.chesstools.controllers import MainController, PlayersManager, TournamentsManager
+from src.chesstools.database import SqliteStorage
+from src.chesstools.models import Player, Tournament
+from src.chesstools.storage import (JsonStreamReader, ShardedTournamentStore, TournamentArchive, TournamentsJournal,
+                                    WriteBehindWriter, iter_json_object, read_json_value_at)
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.snapshot_path = self.folder / "tournaments.json"
+
+        patcher = mock.patch.object(controllers, "PLAYERS_DATA_JSON", self.folder / "players.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(controllers, "TOURNAMENTS_DATA_JSON", self.snapshot_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        self.controller = MainController().tournament_controller
+        self.controller.journaled = True
+        self.controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+
+        self.players = PlayersManager([
+            Player(name="Doe", first_name="John", identifier="JD12345", birth_date="01/01/1990"),
+            Player(name="Smith", first_name="Anna", identifier="AS12345", birth_date="02/02/1991"),
+            Player(name="Brown", first_name="Charlie", identifier="CB12345", birth_date="03/03/1992"),
+            Player(name="Taylor", first_name="Emma", identifier="ET12345", birth_date="04/04/1993"),
+        ])
+        tournament = Tournament(name="Spring Open", place="Paris", rounds_number=4,
+                                start_date="15/09/2025", end_date="17/09/2025", description="Demo")
+        tournament.add_players(self.players)
+        tournament.create_round(1, list(self.players))
+
+        self.controller.tournaments.add_tournament(tournament)
+        self.controller.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+        self.controller.current_tournament = tournament
+
+    def enter_round_results(self):
+        tournament = self.controller.current_tournament
+        for match_index, match in enumerate(tournament.rounds[-1].matches):
+            player_1, _, _ = match.match_tuple[0]
+            player_2, _, _ = match.match_tuple[1]
+            self.controller.set_match_scores(match, player_1, 1.0, player_2, 0, tournament)
+            self.controller.journal.log_score(tournament, len(tournament.rounds) - 1, match_index, match)
+
+    def test_results_are_appended_without_rewriting_snapshot(self):
+        snapshot_before = self.snapshot_path.read_text(encoding="utf-8")
+
+        self.enter_round_results()
+        self.controller.end_current_round()
+
+        self.assertEqual(self.snapshot_path.read_text(encoding="utf-8"), snapshot_before)
+        self.assertEqual(len(list(self.controller.journal.records())), 3)
+
+    def test_replay_restores_results(self):
+        self.enter_round_results()
+        self.controller.end_current_round()
+
+        tournament = self.controller.get_all_tournaments().get_tournament("Spring Open")
+        first_round = tournament.rounds[0]
+        self.assertIsNotNone(first_round.end_date)
+        for match in first_round.matches:
+            self.assertCountEqual([score for _, score, _ in match], [1.0, 0])
+
+    def test_replaying_twice_is_idempotent(self):
+        self.enter_round_results()
+        self.controller.end_current_round()
+        tournaments = self.controller.read_all_tournaments()
+        tournaments.replay_journal(self.controller, self.controller.journal)
+
+        self.assertEqual(tournaments.convert_to_dict(), self.controller.read_all_tournaments().convert_to_dict())
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        self.enter_round_results()
+        self.controller.end_current_round()
+        expected = self.controller.get_all_tournaments().convert_to_dict()
+
+        self.controller.close()
+
+        self.assertTrue(self.controller.journal.is_empty())
+        self.assertEqual(self.controller.get_all_tournaments().convert_to_dict(), expected)
+
+    def test_background_compaction(self):
+        self.enter_round_results()
+        expected = self.controller.get_all_tournaments().convert_to_dict()
+
+        self.controller.compact_journal(background=True)
+        self.controller.journal.wait_for_compaction()
+
+        self.assertTrue(self.controller.journal.is_empty())
+        self.assertEqual(self.controller.get_all_tournaments().convert_to_dict(), expected)
+
+    def test_background_compaction_waits_for_the_club_players(self):
+        player_controller = self.controller.main_controller.player_controller
+        players_manager = player_controller.players_manager
+        self.enter_round_results()
+
+        with player_controller.lock:
+            self.controller.compact_journal(background=True)
+            self.controller.journal.compaction_thread.join(0.2)
+            self.assertTrue(self.controller.journal.compaction_thread.is_alive())
+            self.assertFalse(self.controller.journal.is_empty())
+        self.controller.journal.wait_for_compaction()
+
+        self.assertTrue(self.controller.journal.is_empty())
+        self.assertIs(player_controller.players_manager, players_manager)
+
+    def test_batched_results_are_written_once(self):
+        journal = self.controller.journal
+        with mock.patch.object(journal, "write_lines", wraps=journal.write_lines) as write_lines:
+            with journal.batch():
+                self.enter_round_results()
+                with journal.batch():
+                    self.controller.end_current_round()
+                self.assertTrue(journal.is_empty())
+
+        write_lines.assert_called_once()
+        self.assertEqual(len(list(journal.records())), 3)
+
+    def test_snapshot_left_intact_when_write_fails(self):
+        snapshot_before = self.snapshot_path.read_text(encoding="utf-8")
+
+        with mock.patch("src.chesstools.storage.json.dump", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.controller.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+
+        self.assertEqual(self.snapshot_path.read_text(encoding="utf-8"), snapshot_before)
+        self.assertEqual([path.name for path in self.folder.glob("*.tmp")], [])
+
+    def test_saves_are_written_behind(self):
+        self.controller.journaled = False
+        self.controller.writer = WriteBehindWriter(delay=60)
+        self.addCleanup(self.controller.writer.close)
+        snapshot_before = self.snapshot_path.read_text(encoding="utf-8")
+
+        self.enter_round_results()
+        self.controller.end_current_round()
+        self.controller.journal.file_path.unlink()
+        self.controller.save_tournament("Spring Open")
+        self.controller.save_tournament("Spring Open")
+
+        self.assertEqual(self.snapshot_path.read_text(encoding="utf-8"), snapshot_before)
+        tournaments = self.controller.get_all_tournaments()
+        self.assertIsNotNone(tournaments.get_tournament("Spring Open").rounds[0].end_date)
+        self.assertEqual(self.controller.writer.stats()["flushes"], 1)
+
+    def test_unsaved_changes_not_read_back_from_cache(self):
+        self.controller.journaled = False
+        self.controller.writer = WriteBehindWriter(delay=60)
+        self.addCleanup(self.controller.writer.close)
+        self.controller.tournaments = self.controller.get_all_tournaments()
+        self.controller.current_tournament = self.controller.get_tournament("Spring Open")
+        self.controller.current_tournament.description = "Unsaved"
+
+        with mock.patch.object(self.controller.view, "display_save_failed") as display_save_failed, \
+                mock.patch("src.chesstools.storage.json.dump", side_effect=OSError("disk full")):
+            self.controller.save_tournament("Spring Open")
+            self.controller.writer.flush()
+
+        display_save_failed.assert_called_once()
+        tournaments = self.controller.get_all_tournaments()
+        self.assertIsNot(tournaments, self.controller.tournaments)
+        self.assertEqual(tournaments.get_tournament("Spring Open").description, "Demo")
+
+
+class TestShardedStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.snapshot_path = self.folder / "tournaments.json"
+
+        patcher = mock.patch.object(controllers, "PLAYERS_DATA_JSON", self.folder / "players.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        self.controller = MainController().tournament_controller
+        self.controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+
+        players = [
+            Player(name="Doe", first_name="John", identifier="JD12345", birth_date="01/01/1990"),
+            Player(name="Smith", first_name="Anna", identifier="AS12345", birth_date="02/02/1991"),
+        ]
+        self.tournaments = TournamentsManager()
+        for name in ("Spring Open", "Summer Open", "Autumn Open"):
+            tournament = Tournament(name=name, place="Paris", rounds_number=4,
+                                    start_date="15/09/2025", end_date="17/09/2025", description="Demo")
+            tournament.add_players(players)
+            tournament.create_round(1, players)
+            self.tournaments.add_tournament(tournament)
+
+    def use_shards(self):
+        self.controller.storage = ShardedTournamentStore(self.folder / "shards", self.folder / "manifest.json",
+                                                         self.snapshot_path)
+
+    def test_single_file_is_split_into_shards(self):
+        self.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+        self.use_shards()
+
+        with mock.patch.object(controllers, "TOURNAMENTS_DATA_JSON", self.snapshot_path):
+            tournaments = self.controller.get_all_tournaments()
+
+        self.assertEqual(tournaments.convert_to_dict(), self.tournaments.convert_to_dict())
+        self.assertEqual(len(list((self.folder / "shards").iterdir())), 3)
+
+    def test_save_only_writes_touched_shard(self):
+        self.use_shards()
+        self.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+
+        tournament = self.tournaments.get_tournament("Summer Open")
+        tournament.description = "Updated"
+        written = []
+        original_write = ShardedTournamentStore.write
+
+        def spy(store, tournaments, manifest=None):
+            written.extend(tournaments)
+            original_write(store, tournaments, manifest)
+
+        with mock.patch.object(ShardedTournamentStore, "write", spy):
+            self.tournaments.save_tournament_to_json(self.controller, self.snapshot_path, ["Summer Open"])
+
+        self.assertEqual(written, ["Summer Open"])
+        self.assertEqual(self.controller.load_tournament("Summer Open").description, "Updated")
+        self.assertEqual(self.controller.load_tournament("Spring Open").description, "Demo")
+
+    def test_summaries_come_from_manifest(self):
+        self.use_shards()
+        self.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+
+        with mock.patch.object(ShardedTournamentStore, "read", side_effect=AssertionError):
+            summaries = self.controller.get_tournaments_summaries()
+
+        self.assertEqual([tournament.name for tournament in summaries], ["Spring Open", "Summer Open", "Autumn Open"])
+
+
+class TestSqliteStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.addCleanup(self.directory.cleanup)
+
+        main_controller = MainController()
+        self.controller = main_controller.tournament_controller
+        self.player_controller = main_controller.player_controller
+        self.controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+
+        self.players = PlayersManager([
+            Player(name="DOE", first_name="John", identifier="JD12345", birth_date="01/01/1990"),
+            Player(name="SMITH", first_name="Anna", identifier="AS12345", birth_date="02/02/1991"),
+            Player(name="BROWN", first_name="Charlie", identifier="CB12345", birth_date="03/03/1992"),
+            Player(name="TAYLOR", first_name="Emma", identifier="ET12345", birth_date="04/04/1993"),
+        ])
+        self.tournaments = TournamentsManager()
+        for name in ("Spring Open", "Summer Open"):
+            tournament = Tournament(name=name, place="Paris", rounds_number=4,
+                                    start_date="15/09/2025", end_date="17/09/2025", description="Demo")
+            tournament.add_players(self.players)
+            tournament.create_round(1, list(self.players))
+            for match in tournament.rounds[0].matches:
+                player_1, _, _ = match.match_tuple[0]
+                player_2, _, _ = match.match_tuple[1]
+                self.controller.set_match_scores(match, player_1, 1.0, player_2, 0.0)
+            tournament.rounds[0].set_end_date()
+            self.tournaments.add_tournament(tournament)
+
+    def open_database(self, legacy_tournaments=None, legacy_players=None):
+        database = SqliteStorage(self.folder / "club.sqlite3", legacy_tournaments, legacy_players)
+        self.addCleanup(database.close)
+        self.controller.storage = database
+        self.player_controller.storage = database
+        return database
+
+    def test_round_trip(self):
+        self.open_database()
+        self.tournaments.save_tournament_to_json(self.controller, self.folder / "unused.json")
+        self.players.save_players_to_json(self.player_controller, self.folder / "unused.json")
+
+        tournaments = TournamentsManager()
+        tournaments.load_tournaments_from_json(self.controller, self.folder / "unused.json")
+        players = PlayersManager()
+        players.load_players_from_json(self.player_controller, self.folder / "unused.json")
+
+        self.assertEqual(tournaments.convert_to_dict(), self.tournaments.convert_to_dict())
+        self.assertEqual(players.convert_to_dict(), self.players.convert_to_dict())
+
+    def test_json_files_are_imported(self):
+        tournaments_path = self.folder / "tournaments.json"
+        players_path = self.folder / "players.json"
+        self.tournaments.save_tournament_to_json(self.controller, tournaments_path)
+        self.players.save_players_to_json(self.player_controller, players_path)
+
+        database = self.open_database(tournaments_path, players_path)
+
+        self.assertEqual(database.read(), self.tournaments.convert_to_dict())
+        self.assertEqual(database.find_player("AS12345")["first_name"], "Anna")
+        self.assertIsNone(database.find_player("ZZ99999"))
+
+    def test_legacy_and_broken_tournaments_are_imported_through_the_migrations(self):
+        tournaments_path = self.folder / "tournaments.json"
+        players_path = self.folder / "players.json"
+        report_path = self.folder / "import_report.json"
+        self.players.save_players_to_json(self.player_controller, players_path)
+        data = self.tournaments.convert_to_dict()
+        legacy = data["Spring Open"]
+        del legacy["schema_version"]
+        legacy["players"] = {identifier: self.players.get_player_by_identifier(identifier).convert_to_dict()
+                             for identifier in legacy["players"]}
+        legacy["players"]["ZZ12345"] = {"name": "NEW", "first_name": "Zoe", "birth_date": "05/05/1995"}
+        del data["Summer Open"]["place"]
+        tournaments_path.write_text(json.dumps(data), encoding="utf-8")
+
+        database = SqliteStorage(self.folder / "club.sqlite3", tournaments_path, players_path, report_path)
+        self.addCleanup(database.close)
+
+        self.assertEqual(database.read(), {"Spring Open": self.tournaments.get_tournament(
+            "Spring Open").convert_to_dict() | {"players": list(legacy["players"])}})
+        self.assertEqual(database.find_player("ZZ12345")["first_name"], "Zoe")
+        self.assertEqual(database.import_report.migrated, 1)
+        self.assertEqual(list(database.import_report.rejected), ["Summer Open"])
+        self.assertEqual(database.import_report_path, report_path)
+        self.assertEqual(json.loads(report_path.read_text(encoding="utf-8"))["rejected_tournaments"],
+                         {"Summer Open": data["Summer Open"]})
+
+    def test_single_tournament_update(self):
+        database = self.open_database()
+        self.tournaments.save_tournament_to_json(self.controller, self.folder / "unused.json")
+
+        tournament = self.tournaments.get_tournament("Summer Open")
+        tournament.current_round = 2
+        tournament.create_round(2, tournament.sort_players_by_score())
+        self.tournaments.save_tournament_to_json(self.controller, self.folder / "unused.json", ["Summer Open"])
+
+        self.assertEqual(database.read(["Summer Open"]), {"Summer Open": tournament.convert_to_dict()})
+        self.assertEqual(database.read_summaries()["Spring Open"]["current_round"], 1)
+
+    def test_version_1_database_is_migrated(self):
+        database = self.open_database()
+        self.tournaments.save_tournament_to_json(self.controller, self.folder / "unused.json")
+        with database.connection:
+            database.connection.execute("UPDATE tournament_players SET name = identifier, first_name = 'Old', "
+                                        "birth_date = NULL")
+            database.connection.execute("DELETE FROM players")
+            database.connection.execute("PRAGMA user_version = 1")
+        database.close()
+
+        database = self.open_database()
+
+        self.assertEqual(database.find_player("AS12345")["first_name"], "Old")
+        self.assertEqual(database.read(["Spring Open"]), {"Spring Open": self.tournaments.get_tournament(
+            "Spring Open").convert_to_dict()})
+
+    def test_standings(self):
+        database = self.open_database()
+        self.tournaments.save_tournament_to_json(self.controller, self.folder / "unused.json")
+
+        standings = dict(database.standings("Spring Open"))
+
+        self.assertEqual(sorted(standings.values()), [0.0, 0.0, 1.0, 1.0])
+        self.assertEqual(standings.keys(), {player.identifier for player in self.players})
+
+    def test_completed_tournament_scores_from_database(self):
+        database = self.open_database()
+        self.tournaments.save_tournament_to_json(self.controller, self.folder / "unused.json")
+        tournament = self.tournaments.get_tournament("Spring Open")
+
+        with mock.patch.object(database, "standings", wraps=database.standings) as standings:
+            scores = self.controller.compute_player_scores(tournament)
+
+        standings.assert_called_once_with("Spring Open")
+        expected = {}
+        for match in tournament.rounds[0].matches:
+            expected.update((player.identifier, score) for player, score, _ in match.match_tuple)
+        self.assertEqual(scores, (expected, {player.identifier: player for player in tournament.players}))
+
+    def test_player_found_through_database_index(self):
+        database = self.open_database()
+        self.players.save_players_to_json(self.player_controller, self.folder / "unused.json")
+        self.player_controller.players_manager = PlayersManager()
+
+        with mock.patch.object(database, "read_players", side_effect=AssertionError("all players read")):
+            player = self.player_controller.find_player("AS12345")
+            self.assertIsNone(self.player_controller.find_player("ZZ99999"))
+
+        self.assertEqual((player.name, player.first_name), ("SMITH", "Anna"))
+        self.player_controller.players_manager = self.players
+        self.assertIs(self.player_controller.find_player("AS12345"), self.players.get_player_by_identifier("AS12345"))
+
+
+class TestLazyLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.snapshot_path = self.folder / "tournaments.json"
+
+        patcher = mock.patch.object(controllers, "PLAYERS_DATA_JSON", self.folder / "players.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(controllers, "TOURNAMENTS_DATA_JSON", self.snapshot_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        self.controller = MainController().tournament_controller
+        self.controller.lazy = True
+        self.controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+
+        players = [
+            Player(name="Doe", first_name="John", identifier="JD12345", birth_date="01/01/1990"),
+            Player(name="Smith", first_name="Anna", identifier="AS12345", birth_date="02/02/1991"),
+        ]
+        self.tournaments = TournamentsManager()
+        for name in ("Spring Open", "Summer Open"):
+            tournament = Tournament(name=name, place="Paris", rounds_number=4,
+                                    start_date="15/09/2025", end_date="17/09/2025", description="Demo")
+            tournament.add_players(players)
+            tournament.create_round(1, players)
+            self.tournaments.add_tournament(tournament)
+        self.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+
+    def test_index_holds_headers_only(self):
+        with mock.patch.object(TournamentsManager, "convert_dict_to_tournaments", side_effect=AssertionError):
+            tournaments = self.controller.get_all_tournaments()
+            self.assertEqual([tournament.name for tournament in tournaments], ["Spring Open", "Summer Open"])
+            self.assertFalse(any(tournament.is_completed() for tournament in tournaments))
+
+        self.assertFalse(any(tournament.is_loaded() for tournament in tournaments))
+
+    def test_tournament_is_built_when_opened(self):
+        tournament = self.controller.load_tournament("Summer Open")
+
+        self.assertEqual(len(tournament.rounds), 1)
+        self.assertTrue(tournament.is_loaded())
+        self.assertFalse(self.controller.get_all_tournaments().get_tournament("Spring Open").is_loaded())
+        self.assertEqual(tournament.convert_to_dict(),
+                         self.tournaments.get_tournament("Summer Open").convert_to_dict())
+
+    def test_pending_journal_records_are_replayed(self):
+        tournament = self.tournaments.get_tournament("Spring Open")
+        tournament.current_round = 2
+        tournament.create_round(2, tournament.players)
+        self.controller.journal.log_round_start(tournament, 1)
+
+        loaded = self.controller.load_tournament("Spring Open")
+
+        self.assertEqual(loaded.current_round, 2)
+        self.assertEqual(loaded.convert_to_dict(), tournament.convert_to_dict())
+
+    def test_tournaments_share_the_club_players(self):
+        data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        club_players = json.loads((self.folder / "players.json").read_text(encoding="utf-8"))
+
+        self.assertEqual(data["Spring Open"]["players"], ["JD12345", "AS12345"])
+        self.assertEqual(club_players["AS12345"]["first_name"], "Anna")
+
+        spring = self.controller.load_tournament("Spring Open")
+        summer = self.controller.load_tournament("Summer Open")
+        self.assertIs(spring.players[0], summer.players[0])
+
+    def test_legacy_players_become_club_players(self):
+        data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        # the files written before the schema version stored the players in full
+        del data["Spring Open"]["schema_version"]
+        data["Spring Open"]["players"] = {
+            "JD12345": {"name": "Doe", "first_name": "John", "birth_date": "01/01/1990"},
+            "AS12345": {"name": "Smith", "first_name": "Anna", "birth_date": "02/02/1991"},
+            "ZZ12345": {"name": "Zeta", "first_name": "Zoe", "birth_date": None},
+        }
+        self.snapshot_path.write_text(json.dumps(data), encoding="utf-8")
+
+        tournaments = self.controller.get_all_tournaments()
+        # reading the tournaments writes nothing, the pending saves included
+        with mock.patch.object(self.controller.writer, "flush", side_effect=AssertionError):
+            tournament = tournaments.get_tournament("Spring Open")
+            self.assertEqual([player.identifier for player in tournament.players], ["JD12345", "AS12345", "ZZ12345"])
+        self.assertNotIn("ZZ12345", json.loads((self.folder / "players.json").read_text(encoding="utf-8")))
+
+        tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+        self.assertEqual(json.loads((self.folder / "players.json").read_text(encoding="utf-8"))["ZZ12345"]["name"],
+                         "Zeta")
+        self.assertEqual(tournament.convert_to_dict()["players"], ["JD12345", "AS12345", "ZZ12345"])
+
+    def test_tournament_is_read_again_after_file_rewrite(self):
+        tournaments = self.controller.get_all_tournaments()
+        self.tournaments.get_tournament("Summer Open").description = "Rewritten"
+        self.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+
+        self.assertEqual(tournaments.get_tournament("Summer Open").rounds[0].round_name, "Round 1")
+
+
+class TestBinaryStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.snapshot_path = self.folder / "tournaments.json"
+
+        patcher = mock.patch.object(controllers, "PLAYERS_DATA_JSON", self.folder / "players.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.binary_path = self.folder / "tournaments.chsb"
+        self.addCleanup(self.directory.cleanup)
+
+        self.controller = MainController().tournament_controller
+        self.controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+
+        players = [
+            Player(name="Doe", first_name="John", identifier="JD12345", birth_date="01/01/1990"),
+            Player(name="Smith", first_name="Anna", identifier="AS12345", birth_date="02/02/1991"),
+            Player(name="Brown", first_name="Charlie", identifier="CB12345", birth_date=None),
+            Player(name="Taylor", first_name="Emma", identifier="ET12345", birth_date="04/04/1993"),
+        ]
+        self.tournaments = TournamentsManager()
+        for name in ("Spring Open", "Summer Open"):
+            tournament = Tournament(name=name, place="Paris", rounds_number=4,
+                                    start_date="15/09/2025", end_date="17/09/2025", description="Démo")
+            tournament.add_players(players)
+            tournament.create_round(1, players)
+            tournament.rounds[0].matches[0].score_1 = 1
+            self.tournaments.add_tournament(tournament)
+        self.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+
+    def test_round_trip_keeps_json_as_is(self):
+        data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(json.dumps(decode_tournaments(encode_tournaments(data))), json.dumps(data))
+
+        convert_json_to_binary(self.snapshot_path, self.binary_path)
+        convert_binary_to_json(self.binary_path, self.folder / "converted.json")
+        self.assertEqual((self.folder / "converted.json").read_text(encoding="utf-8"),
+                         self.snapshot_path.read_text(encoding="utf-8"))
+
+    def test_unsupported_version_is_rejected(self):
+        data = bytearray(encode_tournaments(self.tournaments.convert_to_dict()))
+        data[4] += 1
+
+        with self.assertRaises(BinaryFormatError):
+            decode_tournaments(bytes(data))
+        with self.assertRaises(BinaryFormatError):
+            decode_tournaments(bytes(data[:20]))
+
+    def test_json_file_is_imported_and_updated(self):
+        self.controller.storage = BinaryTournamentStore(self.binary_path, self.snapshot_path)
+
+        tournaments = self.controller.get_all_tournaments()
+        self.assertEqual(tournaments.convert_to_dict(), self.tournaments.convert_to_dict())
+
+        tournament = tournaments.get_tournament("Summer Open")
+        tournament.description = "Updated"
+        tournaments.save_tournament_to_json(self.controller, self.snapshot_path, ["Summer Open"])
+
+        self.assertEqual(self.controller.storage.read_summaries()["Summer Open"]["description"], "Updated")
+        self.assertEqual(self.controller.storage.read(["Spring Open"])["Spring Open"],
+                         self.tournaments.get_tournament("Spring Open").convert_to_dict())
+
+
+class TestArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.snapshot_path = self.folder / "tournaments.json"
+
+        patcher = mock.patch.object(controllers, "PLAYERS_DATA_JSON", self.folder / "players.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(controllers, "TOURNAMENTS_DATA_JSON", self.snapshot_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        self.controller = MainController().tournament_controller
+        self.controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+        self.controller.archive = TournamentArchive(self.folder / "archive")
+
+        players = [
+            Player(name="Doe", first_name="John", identifier="JD12345", birth_date="01/01/1990"),
+            Player(name="Smith", first_name="Anna", identifier="AS12345", birth_date="02/02/1991"),
+        ]
+        self.tournaments = TournamentsManager()
+        for name in ("Spring Open", "Summer Open"):
+            tournament = Tournament(name=name, place="Paris", rounds_number=4,
+                                    start_date="15/09/2025", end_date="17/09/2025", description="Demo")
+            tournament.add_players(players)
+            tournament.create_round(1, players)
+            self.tournaments.add_tournament(tournament)
+
+        completed = self.tournaments.get_tournament("Spring Open")
+        for round_number in range(2, 5):
+            completed.rounds[-1].set_end_date()
+            completed.current_round = round_number
+            completed.create_round(round_number, completed.players)
+        completed.rounds[-1].set_end_date()
+        self.tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+
+    def test_completed_tournament_moves_to_archive(self):
+        self.assertEqual(list(json.loads(self.snapshot_path.read_text(encoding="utf-8"))), ["Summer Open"])
+        self.assertEqual(list(self.controller.archive.read_index()), ["Spring Open"])
+        self.assertEqual(self.controller.archive.read("Spring Open"),
+                         self.tournaments.get_tournament("Spring Open").convert_to_dict())
+
+    def test_archived_tournament_read_when_opened(self):
+        for lazy in (True, False):
+            self.controller.lazy = lazy
+            with mock.patch.object(TournamentArchive, "read", side_effect=AssertionError):
+                tournaments = self.controller.get_all_tournaments()
+                archived = tournaments.get_tournament("Spring Open")
+                self.assertTrue(archived.is_completed())
+                self.assertFalse(archived.is_loaded())
+
+            self.assertEqual(archived.convert_to_dict(),
+                             self.tournaments.get_tournament("Spring Open").convert_to_dict())
+
+    def test_archived_tournament_opened_without_reading_json_file(self):
+        for lazy in (True, False):
+            self.controller.lazy = lazy
+            archived = self.controller.get_all_tournaments().get_tournament("Spring Open")
+
+            with mock.patch("src.chesstools.controllers.iter_json_object", side_effect=AssertionError), \
+                    mock.patch("src.chesstools.controllers.read_json_value_at", side_effect=AssertionError):
+                self.assertEqual(archived.convert_to_dict(),
+                                 self.tournaments.get_tournament("Spring Open").convert_to_dict())
+
+    def test_archive_not_written_again(self):
+        tournaments = self.controller.get_all_tournaments()
+        tournaments.get_tournament("Summer Open").description = "Updated"
+
+        with mock.patch.object(TournamentArchive, "write", side_effect=AssertionError):
+            tournaments.save_tournament_to_json(self.controller, self.snapshot_path)
+
+        self.assertFalse(tournaments.get_tournament("Spring Open").is_loaded())
+        self.assertEqual(self.controller.load_tournament("Summer Open").description, "Updated")
+
+
+class TestJsonStreamReader(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = Path(self.directory.name) / "data.json"
+        self.data = {"Été": {"values": [1, 2.5, None], "name": "Zoë"}, "empty": {}, "number": 12345}
+        self.path.write_text(json.dumps(self.data, ensure_ascii=False, indent=4), encoding="utf-8")
+
+    def test_members_are_decoded_one_at_a_time(self):
+        with open(self.path, encoding="utf-8") as json_file:
+            members = {key: value for key, value, _ in JsonStreamReader(json_file, read_size=3).iter_object()}
+
+        self.assertEqual(members, self.data)
+
+    def test_values_are_read_back_from_offsets(self):
+        for key, value, offset in iter_json_object(self.path, offsets=True):
+            self.assertEqual(read_json_value_at(self.path, offset), value)
+
+    def test_offsets_of_a_file_with_windows_line_endings(self):
+        self.path.write_bytes(json.dumps(self.data, ensure_ascii=False, indent=4).replace("\n", "\r\n")
+                              .encode("utf-8"))
+
+        members = list(iter_json_object(self.path, offsets=True))
+
+        self.assertEqual({key: value for key, value, _ in members}, self.data)
+        for key, value, offset in members:
+            self.assertEqual(read_json_value_at(self.path, offset), value)
+
+    def test_truncated_file_raises(self):
+        self.path.write_text('{"a": {"b": 1}, "c": [1, 2', encoding="utf-8")
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_object(self.path))
+
+
+class TestWriteBehindWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = WriteBehindWriter(delay=60)
+        self.addCleanup(self.writer.close)
+        self.written = []
+
+    def test_queued_snapshots_are_merged(self):
+        self.writer.submit("tournaments", {"Spring Open": 1, "Summer Open": 1}, self.written.append)
+        self.writer.submit("tournaments", {"Spring Open": 2}, self.written.append)
+        self.writer.submit("players", {"JD12345": 1}, self.written.append)
+        self.assertEqual(self.written, [])
+
+        self.writer.flush()
+
+        self.assertCountEqual(self.written, [{"Spring Open": 2, "Summer Open": 1}, {"JD12345": 1}])
+        self.assertEqual(self.writer.stats()["saves"], 3)
+        self.assertEqual(self.writer.stats()["flushes"], 1)
+
+    def test_written_after_delay(self):
+        self.writer.delay = 0.01
+        self.writer.submit("players", {"JD12345": 1}, self.written.append)
+
+        self.writer.thread.join(timeout=0.2)
+
+        self.assertEqual(self.written, [{"JD12345": 1}])
+
+    def test_write_error_raised_on_flush(self):
+        self.writer.submit("players", {}, mock.Mock(side_effect=OSError("disk full")))
+
+        with self.assertRaises(OSError):
+            self.writer.flush()
+
+    def test_write_error_reported_to_the_save(self):
+        on_error = mock.Mock()
+        self.writer.submit("tournaments", {}, mock.Mock(side_effect=OSError("disk full")), on_error)
+        self.writer.submit("players", {"JD12345": 1}, self.written.append)
+
+        self.writer.flush()
+
+        self.assertEqual(str(on_error.call_args.args[0]), "disk full")
+        self.assertEqual(self.written, [{"JD12345": 1}])
+
+    def test_queued_saves_written_when_interrupted(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        output = Path(directory.name) / "players.json"
+        script = ("import sys\n"
+                  "from pathlib import Path\n"
+                  "from src.chesstools.storage import WriteBehindWriter\n"
+                  "writer = WriteBehindWriter(delay=60)\n"
+                  "writer.submit('players', {'JD12345': 1}, lambda data: Path(sys.argv[1]).write_text(str(data)))\n"
+                  "raise KeyboardInterrupt\n")
+
+        subprocess.run([sys.executable, "-c", script, str(output)], cwd=Path(__file__).resolve().parents[1],
+                       capture_output=True)
+
+        self.assertEqual(output.read_text(), "{'JD12345': 1}")
+
+
+class TestRepositoryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = Path(self.directory.name) / "players.json"
+        self.path.write_text("{}", encoding="utf-8")
+        self.cache = RepositoryCache()
+        self.loads = 0
+
+    def loader(self):
+        self.loads += 1
+        return object()
+
+    def test_hit_while_file_unchanged(self):
+        first = self.cache.get("players", [self.path], self.loader)
+        second = self.cache.get("players", [self.path], self.loader)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 1, "entries": 1})
+
+    def test_miss_when_file_changes(self):
+        first = self.cache.get("players", [self.path], self.loader)
+        self.path.write_text('{"AB12345": {}}', encoding="utf-8")
+        second = self.cache.get("players", [self.path], self.loader)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_refresh_after_own_save(self):
+        value = self.cache.get("players", [self.path], self.loader)
+        self.path.write_text('{"AB12345": {}}', encoding="utf-8")
+        self.cache.refresh("players", [self.path], value)
+
+        self.assertIs(self.cache.get("players", [self.path], self.loader), value)
+        self.assertEqual(self.loads, 1)
+
+    def test_refresh_ignores_other_value(self):
+        self.cache.get("players", [self.path], self.loader)
+        self.path.write_text('{"AB12345": {}}', encoding="utf-8")
+        self.cache.refresh("players", [self.path], object())
+
+        self.cache.get("players", [self.path], self.loader)
+        self.assertEqual(self.loads, 2)
+
+
+class TestWarmStart(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        self.snapshot_path = self.folder / "tournaments.json"
+
+        for name, value in (("TOURNAMENTS_DATA_JSON", self.snapshot_path),
+                            ("PLAYERS_DATA_JSON", self.folder / "players.json")):
+            patcher = mock.patch.object(controllers, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        players = [
+            Player(name="Doe", first_name="John", identifier="JD12345", birth_date="01/01/1990"),
+            Player(name="Smith", first_name="Anna", identifier="AS12345", birth_date="02/02/1991"),
+        ]
+        self.tournaments = TournamentsManager()
+        for name in ("Spring Open", "Summer Open"):
+            tournament = Tournament(name=name, place="Paris", rounds_number=4,
+                                    start_date="15/09/2025", end_date="17/09/2025", description="Demo")
+            tournament.add_players(players)
+            tournament.create_round(1, players)
+            self.tournaments.add_tournament(tournament)
+        self.tournaments.save_tournament_to_json(self.new_controller(), self.snapshot_path)
+
+    def new_controller(self, lazy=False):
+        # a new launch, with nothing in the repository cache
+        repository_cache.invalidate()
+        controller = MainController().tournament_controller
+        controller.journal = TournamentsJournal(self.folder / "tournaments.journal")
+        controller.archive = None
+        controller.lazy = lazy
+        return controller
+
+    def test_next_launch_reads_the_pickled_tournaments(self):
+        for lazy in (False, True):
+            self.new_controller(lazy).get_all_tournaments()
+
+            controller = self.new_controller(lazy)
+            with mock.patch.object(TournamentsManager, "convert_dict_to_tournament", side_effect=AssertionError), \
+                    mock.patch("src.chesstools.controllers.iter_json_object", side_effect=AssertionError):
+                tournaments = controller.get_all_tournaments()
+
+            spring = tournaments.get_tournament("Spring Open")
+            self.assertIs(spring.players[0], controller.get_club_players().get_player_by_identifier("JD12345"))
+            self.assertEqual(tournaments.convert_to_dict(), self.tournaments.convert_to_dict())
+
+    def test_changed_file_is_parsed_again(self):
+        self.new_controller().get_all_tournaments()
+        self.tournaments.get_tournament("Summer Open").description = "Updated"
+        self.tournaments.save_tournament_to_json(self.new_controller(), self.snapshot_path)
+
+        tournaments = self.new_controller().get_all_tournaments()
+
+        self.assertEqual(tournaments.get_tournament("Summer Open").description, "Updated")
+
+    def test_tournaments_pickled_when_leaving(self):
+        controller = self.new_controller()
+        tournaments = controller.get_all_tournaments()
+        tournaments.get_tournament("Summer Open").description = "Updated"
+        tournaments.save_tournament_to_json(controller, self.snapshot_path)
+        controller.refresh_cached_tournaments(tournaments)
+        controller.save_warm_start()
+
+        controller = self.new_controller()
+        with mock.patch.object(TournamentsManager, "convert_dict_to_tournament", side_effect=AssertionError):
+            self.assertEqual(controller.get_all_tournaments().get_tournament("Summer Open").description, "Updated")
+
+    def test_changes_made_after_the_save_not_pickled(self):
+        controller = self.new_controller()
+        tournaments = controller.get_all_tournaments()
+        tournaments.get_tournament("Summer Open").description = "Saved"
+        tournaments.save_tournament_to_json(controller, self.snapshot_path)
+        controller.refresh_cached_tournaments(tournaments)
+        tournaments.get_tournament("Summer Open").description = "Unsaved"
+        controller.save_warm_start()
+
+        controller = self.new_controller()
+        with mock.patch.object(TournamentsManager, "convert_dict_to_tournament", side_effect=AssertionError):
+            self.assertEqual(controller.get_all_tournaments().get_tournament("Summer Open").description, "Saved")
+
+
+class TestWarmStartCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = Path(self.directory.name) / "players.json"
+        self.path.write_text("{}", encoding="utf-8")
+        self.key_path = Path(self.directory.name) / "keys" / "warm_start.key"
+        self.cache = WarmStartCache(self.key_path)
+        self.shared = object()
+        self.loads = 0
+
+    def loader(self):
+        self.loads += 1
+        return {"loads": self.loads, "shared": self.shared}
+
+    def references(self):
+        return {"shared": self.shared}
+
+    def test_value_read_back_while_content_unchanged(self):
+        self.cache.get("players", [self.path], self.loader, self.references)
+        value = WarmStartCache(self.key_path).get("players", [self.path], self.loader, self.references)
+
+        self.assertEqual(value["loads"], 1)
+        self.assertIs(value["shared"], self.shared)
+        self.assertEqual(self.cache.file_path("players", [self.path]).parent.name, WarmStartCache.FOLDER_NAME)
+
+    def test_miss_when_content_changes(self):
+        self.cache.get("players", [self.path], self.loader)
+        self.path.write_text('{"AB12345": {}}', encoding="utf-8")
+
+        self.assertEqual(self.cache.get("players", [self.path], self.loader)["loads"], 2)
+        self.assertEqual(self.cache.stats(), {"hits": 0, "misses": 2})
+
+    def test_damaged_file_is_parsed_again(self):
+        self.cache.get("players", [self.path], self.loader)
+        file_path = self.cache.file_path("players", [self.path])
+        file_path.write_bytes(file_path.read_bytes()[:-10])
+
+        self.assertEqual(self.cache.get("players", [self.path], self.loader)["loads"], 2)
+        self.assertEqual(self.cache.get("players", [self.path], self.loader)["loads"], 2)
+
+    def test_file_signed_with_another_key_not_unpickled(self):
+        WarmStartCache(Path(self.directory.name) / "other.key").get("players", [self.path], self.loader)
+
+        with mock.patch("src.chesstools.cache.pickle.Unpickler", side_effect=AssertionError):
+            self.assertIsNone(self.cache.read("players", [self.path], self.cache.digest([self.path])))
+        self.assertEqual(self.cache.get("players", [self.path], self.loader)["loads"], 2)
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.chesstools.controllers import REPORT_TEMPLATES, MainController
+from src.chesstools.models import Player
+from src.chesstools.templating import TemplateRegistry
+
+
+class TestTemplateRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_folder = Path(self.directory.name) / "cache"
+        self.addCleanup(self.directory.cleanup)
+
+    def test_templates_found_from_any_working_directory(self):
+        cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        self.addCleanup(os.chdir, cwd)
+
+        templates = TemplateRegistry(REPORT_TEMPLATES, cache_folder=self.cache_folder)
+        templates.load_all()
+
+        self.assertEqual(set(templates.compiled), set(REPORT_TEMPLATES))
+
+    def test_compiled_templates_reused_by_the_next_launch(self):
+        TemplateRegistry(REPORT_TEMPLATES, cache_folder=self.cache_folder)["players"]
+        self.assertEqual(len(list(self.cache_folder.glob("__jinja2_*.cache"))), 1)
+
+        templates = TemplateRegistry(REPORT_TEMPLATES, cache_folder=self.cache_folder)
+        environment = templates.get_environment()
+        with mock.patch.object(environment, "compile", side_effect=AssertionError("template compiled again")):
+            template = templates["players"]
+
+        self.assertIn("<html", template.render(players=[]).lower())
+
+    def test_unwritable_cache_folder_falls_back_to_temporary_folder(self):
+        self.cache_folder.write_text("not a folder", encoding="utf-8")
+
+        templates = TemplateRegistry(REPORT_TEMPLATES, cache_folder=self.cache_folder)
+
+        self.assertIsNone(templates.bytecode_folder())
+        self.assertEqual(templates["players"].name, REPORT_TEMPLATES["players"])
+
+
+class TestReportStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.report_path = Path(self.directory.name) / "reports" / "report.html"
+        self.addCleanup(self.directory.cleanup)
+        self.controller = MainController().report_controller
+
+    def test_report_written_as_rendered(self):
+        template = self.controller.main_controller.templates["players"]
+        players = [Player("Doe", "John", "01/01/1990", "AB12345"), Player("Roe", "Jane", "02/02/1992", "CD12345")]
+
+        chunks = template.generate(players=players)
+        self.assertTrue(self.controller.save_report(self.report_path, chunks))
+
+        self.assertEqual(self.report_path.read_text(encoding="utf-8"), template.render(players=players))
+        self.assertEqual(list(self.report_path.parent.glob("*.tmp")), [])
+
+    def test_failed_report_keeps_the_previous_one(self):
+        self.report_path.parent.mkdir()
+        self.report_path.write_text("previous", encoding="utf-8")
+
+        def chunks():
+            yield "<html>"
+            raise RuntimeError("rendering failed")
+
+        with self.assertRaises(RuntimeError):
+            self.controller.save_report(self.report_path, chunks())
+
+        self.assertEqual(self.report_path.read_text(encoding="utf-8"), "previous")
+        self.assertEqual(list(self.report_path.parent.glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -37,6 +37,65 @@ class TestTournament(unittest.TestCase):
         result = self.tournament.match_already_played(self.player_1, player_3)
         self.assertFalse(result)
 
+    def test_pair_index_follows_added_rounds(self):
+        player_3 = Player(name="Joe", first_name="Martin", birth_date="03/09/2005", identifier="po45823")
+        round_2 = Round("Round 2")
+        round_2.matches.append(Match(self.player_1, player_3))
+
+        self.tournament.add_round(round_2)
+
+        self.assertTrue(self.tournament.match_already_played(player_3, self.player_1))
+        self.assertEqual(self.tournament.opponents[self.player_1.identifier], {"AS4568", "po45823"})
+        self.assertIn(frozenset(("JD1237", "po45823")), self.tournament.played_pairs)
+
+    def test_pair_index_rebuilt_when_round_replaced(self):
+        player_3 = Player(name="Joe", first_name="Martin", birth_date="03/09/2005", identifier="po45823")
+        round_1 = Round("Round 1")
+        round_1.matches.append(Match(self.player_1, player_3))
+
+        self.tournament.replace_round(0, round_1)
+
+        self.assertFalse(self.tournament.match_already_played(self.player_1, self.player_2))
+        self.assertTrue(self.tournament.match_already_played(self.player_1, player_3))
+
+    def test_score_ledger_built_from_rounds(self):
+        round_2 = Round("Round 2")
+        round_2.matches.append(Match(self.player_1, self.player_2, 1.0, 0.0))
+        self.tournament.add_round(round_2)
+
+        self.assertEqual(self.tournament.scores, {"JD1237": 1.0, "AS4568": 0.0})
+        with self.assertRaises(TypeError):
+            self.tournament.scores["JD1237"] = 3.0
+
+    def test_match_fields_follow_match_tuple(self):
+        match = Match(self.player_1, self.player_2, 1.0, 0.0)
+        match.set_colors("⚪", "⚫")
+        match.swap_sides()
+
+        self.assertFalse(hasattr(match, "__dict__"))
+        self.assertEqual(match.match_tuple[0], (match.player_1, match.score_1, "⚫"))
+        self.assertEqual(match.convert_to_dict()["player2"],
+                         {"identifier": match.player_2.identifier, "score": match.score_2, "color": "⚪"})
+
+    def test_serialized_form_cached_until_changed(self):
+        serialized = self.tournament.convert_to_dict()
+
+        self.assertFalse(self.tournament.is_dirty())
+        self.assertIs(self.tournament.convert_to_dict(), serialized)
+
+        self.tournament.rounds[0].set_end_date()
+        self.assertTrue(self.tournament.is_dirty())
+        serialized = self.tournament.convert_to_dict()
+        self.assertIsNotNone(serialized["rounds"]["Round 1"]["end_date"])
+
+        self.tournament.current_round = 2
+        self.assertEqual(self.tournament.convert_to_dict()["current_round"], 2)
+
+        self.tournament.rounds[0].matches[0].score_1 = 1.0
+        self.tournament.mark_dirty()
+        self.assertEqual(self.tournament.convert_to_dict()["rounds"]["Round 1"]["matches"]["match_1"]
+                         ["player1"]["score"], 1.0)
+
 
 if __name__ == "__main__":
 